@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: common.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from typing import Any, Sequence
+
+import numpy
+
+import lvmieb
+
+
+__all__ = ["get_metadata", "summarise", "write_results", "compare_results"]
+
+
+def get_git_commit() -> str | None:
+    """Returns the current git commit, if the code is in a git repository."""
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def get_metadata(**kwargs) -> dict[str, Any]:
+    """Returns a description of the environment in which the benchmark ran."""
+
+    return {
+        "lvmieb_version": lvmieb.__version__,
+        "git_commit": get_git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        **kwargs,
+    }
+
+
+def summarise(samples: Sequence[float], elapsed: float | None = None) -> dict:
+    """Returns the percentiles of a list of samples, in milliseconds.
+
+    If ``elapsed`` (the wall time of the run, in seconds) is set, the
+    throughput in samples per second is also returned.
+
+    """
+
+    values = numpy.asarray(samples, dtype=numpy.float64) * 1000.0
+
+    if len(values) == 0:
+        return {"n": 0}
+
+    p50, p95, p99 = numpy.percentile(values, [50, 95, 99])
+
+    summary = {
+        "n": len(values),
+        "mean_ms": float(values.mean()),
+        "std_ms": float(values.std()),
+        "min_ms": float(values.min()),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": float(values.max()),
+    }
+
+    if elapsed is not None and elapsed > 0:
+        summary["throughput"] = len(values) / elapsed
+
+    return summary
+
+
+def write_results(path: str, metadata: dict, results: list[dict]):
+    """Writes the results of a benchmark as JSON."""
+
+    with open(path, "w") as fd:
+        json.dump({"metadata": metadata, "results": results}, fd, indent=2)
+
+
+def compare_results(
+    baseline_path: str,
+    results: list[dict],
+    keys: Sequence[str],
+    metric: str = "p50_ms",
+) -> dict[str, float]:
+    """Prints the ratio of a metric with respect to a baseline results file.
+
+    Results are matched by the values of ``keys``. Ratios above one mean that
+    the current results are slower. Returns a mapping of the matched results,
+    as a space-separated string of the key values, to their ratio.
+
+    """
+
+    with open(baseline_path) as fd:
+        baseline = json.load(fd)["results"]
+
+    indexed = {tuple(result[key] for key in keys): result for result in baseline}
+
+    ratios: dict[str, float] = {}
+
+    print(f"\nComparison of {metric} with {baseline_path}:")
+    for result in results:
+        index = tuple(result[key] for key in keys)
+        if index not in indexed or metric not in indexed[index]:
+            continue
+
+        old = indexed[index][metric]
+        new = result[metric]
+        ratio = new / old if old > 0 else float("nan")
+
+        label = " ".join(str(value) for value in index)
+        print(f"  {label:<50} {old:10.3f} -> {new:10.3f}  ({ratio:5.2f}x)")
+
+        ratios[label] = ratio
+
+    return ratios
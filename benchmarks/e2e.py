@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: e2e.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+"""End-to-end benchmarks of the actor against the hardware simulator.
+
+Each scenario runs the actor commands with a number of concurrent clients,
+against a simulation of 1, 3, and 12 spectrographs, and measures the latency
+of each command (from the moment it is received until it is done) and the
+throughput. The actor transport is mocked, everything else is real.
+
+Run from the root of the repository with ``python benchmarks/e2e.py``. Use
+``--output`` to save the results as JSON and ``--compare`` to compare them with
+those of a previous run.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import tempfile
+import time
+from dataclasses import dataclass
+
+import click
+from common import compare_results, get_metadata, summarise, write_results
+
+import clu.testing
+
+from lvmieb.actor import IEBActor
+from lvmieb.simulator import Simulator
+
+
+@dataclass
+class Scenario:
+    """A benchmark scenario.
+
+    Each client cycles through ``commands``, in which ``{spec}`` is replaced by
+    the spectrograph assigned to the client. ``iterations_factor`` scales the
+    number of iterations, for commands that move motors.
+
+    """
+
+    name: str
+    commands: tuple[str, ...]
+    iterations_factor: float = 1.0
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario("shutter", ("shutter open {spec}", "shutter close {spec}"), 0.2),
+        Scenario("hartmann_status", ("hartmann status {spec}",)),
+        Scenario("wago_status", ("wago status",)),
+        Scenario("transducer_status", ("transducer status",)),
+        Scenario("depth_status", ("depth status",)),
+    ]
+}
+
+
+async def create_actor(config: dict, log_dir: str) -> IEBActor:
+    """Creates an actor with a mocked transport for the simulated devices."""
+
+    config["actor"]["log_dir"] = log_dir
+
+    actor = IEBActor.from_config(config)
+    actor.parser_args = [actor.controllers]
+    actor.log.sh.setLevel(logging.WARNING)
+
+    return await clu.testing.setup_test_actor(actor)
+
+
+async def run_scenario(
+    actor: IEBActor,
+    scenario: Scenario,
+    concurrency: int,
+    iterations: int,
+) -> dict:
+    """Runs a scenario and returns the summary of the command latencies."""
+
+    specs = list(actor.controllers)
+    n_per_client = max(1, round(iterations * scenario.iterations_factor / concurrency))
+
+    latencies: list[float] = []
+    failed = 0
+
+    async def client(index: int):
+        nonlocal failed
+
+        spec = specs[index % len(specs)]
+
+        for ii in range(n_per_client):
+            command_string = scenario.commands[ii % len(scenario.commands)]
+            command_string = command_string.format(spec=spec)
+
+            t0 = time.perf_counter()
+            command = await actor.invoke_mock_command(command_string)  # type: ignore
+            await command
+            latencies.append(time.perf_counter() - t0)
+
+            if command.status.did_fail:
+                failed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client(ii) for ii in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    actor.mock_replies.clear()  # type: ignore
+
+    return {
+        "scenario": scenario.name,
+        "specs": len(specs),
+        "concurrency": concurrency,
+        "failed": failed,
+        "elapsed": elapsed,
+        **summarise(latencies, elapsed),
+    }
+
+
+async def run_benchmarks(
+    n_specs: list[int],
+    concurrency: list[int],
+    scenarios: list[Scenario],
+    iterations: int,
+    behaviour: str | None,
+    seed: int | None,
+) -> list[dict]:
+    """Runs all the scenarios for each number of spectrographs and clients."""
+
+    results = []
+    log_dir = tempfile.mkdtemp(prefix="lvmieb_benchmark_")
+
+    for n in n_specs:
+        async with Simulator(n_specs=n, behaviour=behaviour, seed=seed) as simulator:
+            actor = await create_actor(simulator.get_config(), log_dir)
+
+            try:
+                for scenario in scenarios:
+                    # Warm up, for example to import the command modules.
+                    await run_scenario(actor, scenario, 1, 1)
+
+                    for n_clients in concurrency:
+                        result = await run_scenario(
+                            actor,
+                            scenario,
+                            n_clients,
+                            iterations,
+                        )
+                        results.append(result)
+
+                        print(
+                            f"{scenario.name:<18} specs={n:<3} clients={n_clients:<3} "
+                            f"n={result['n']:<4} failed={result['failed']:<3} "
+                            f"p50={result['p50_ms']:8.2f} ms "
+                            f"p95={result['p95_ms']:8.2f} ms "
+                            f"p99={result['p99_ms']:8.2f} ms "
+                            f"throughput={result['throughput']:7.2f}/s"
+                        )
+            finally:
+                await actor.stop()
+
+    return results
+
+
+@click.command()
+@click.option(
+    "-n",
+    "--specs",
+    "n_specs",
+    type=int,
+    multiple=True,
+    default=[1, 3, 12],
+    show_default=True,
+    help="Number of spectrographs to simulate. Can be repeated.",
+)
+@click.option(
+    "-c",
+    "--concurrency",
+    type=int,
+    multiple=True,
+    default=[1, 4, 16],
+    show_default=True,
+    help="Number of concurrent clients. Can be repeated.",
+)
+@click.option(
+    "-s",
+    "--scenario",
+    "scenario_names",
+    type=click.Choice(list(SCENARIOS)),
+    multiple=True,
+    help="Scenarios to run. Can be repeated. Defaults to all.",
+)
+@click.option(
+    "-i",
+    "--iterations",
+    type=click.IntRange(1),
+    default=50,
+    show_default=True,
+    help="Number of commands per scenario, split between the clients.",
+)
+@click.option(
+    "-b",
+    "--behaviour",
+    type=click.Path(exists=True, dir_okay=False),
+    help="The behaviour of the simulated devices. Defaults to etc/simulator.yml.",
+)
+@click.option("--seed", type=int, default=1, show_default=True)
+@click.option("-o", "--output", type=click.Path(dir_okay=False, writable=True))
+@click.option(
+    "--compare",
+    type=click.Path(exists=True, dir_okay=False),
+    help="A previous results file with which to compare.",
+)
+def main(
+    n_specs: tuple[int, ...],
+    concurrency: tuple[int, ...],
+    scenario_names: tuple[str, ...],
+    iterations: int,
+    behaviour: str | None,
+    seed: int | None,
+    output: str | None,
+    compare: str | None,
+):
+    """Runs the end-to-end benchmarks."""
+
+    scenarios = [SCENARIOS[name] for name in scenario_names or SCENARIOS]
+
+    results = asyncio.run(
+        run_benchmarks(
+            list(n_specs),
+            list(concurrency),
+            scenarios,
+            iterations,
+            behaviour,
+            seed,
+        )
+    )
+
+    if output:
+        metadata = get_metadata(
+            benchmark="e2e",
+            iterations=iterations,
+            behaviour=behaviour,
+            seed=seed,
+        )
+        write_results(output, metadata, results)
+
+    if compare:
+        keys = ["scenario", "specs", "concurrency"]
+        compare_results(compare, results, keys, "p50_ms")
+        compare_results(compare, results, keys, "p95_ms")
+
+
+if __name__ == "__main__":
+    main()
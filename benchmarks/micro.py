@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: micro.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+"""Micro-benchmarks of the code that runs for each reply from the devices.
+
+Each benchmark is timed with `timeit` (with the garbage collector disabled),
+calibrating the number of loops so that each repeat takes at least 0.2 seconds
+and reporting the minimum and median time per call of several repeats. The
+memory allocated is measured with `tracemalloc` (peak bytes during a call) and
+`sys.getallocatedblocks` (blocks still allocated after each call, which should
+be zero).
+
+The WAGO and motor controller methods are run without I/O, replacing the calls
+to the devices with canned replies, so that only the processing of the replies
+is measured. The regular expressions that parse the replies are imported from
+the controller modules.
+
+Run from the root of the repository with ``python benchmarks/micro.py``. With
+``--compare`` and ``--max-regression`` the exit code is non-zero if any
+benchmark is slower than in the baseline by more than the given factor.
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fnmatch
+import gc
+import statistics
+import sys
+import timeit
+import tracemalloc
+
+from typing import Any, Callable, Coroutine
+
+import click
+from common import compare_results, get_metadata, write_results
+
+from sdsstools import read_yaml_file
+
+from lvmieb.controller import depth, pressure
+from lvmieb.controller.maskbits import MotorStatus
+from lvmieb.controller.motor import IS_PATTERN, MotorController, parse_IS
+from lvmieb.controller.wago import IEBWAGO
+from lvmieb.simulator.simulator import ETC_DIR
+
+
+IS_OPEN = b"\x00\x07IS=10111111\r"
+IS_INVALID = b"\x00\x07IS=11111111\r"
+PRESSURE_REPLY = b"@253ACK1.23E-06\\"
+DEPTH_REPLY = b"\rA 1.5000 mm\n"
+
+
+def run_sync(coro: Coroutine) -> Any:
+    """Runs a coroutine that does not suspend, without an event loop."""
+
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+
+    coro.close()
+    raise RuntimeError("The coroutine suspended.")
+
+
+class OfflineWAGO(IEBWAGO):
+    """An `.IEBWAGO` that returns canned values instead of reading the devices."""
+
+    async def __aenter__(self):
+        return
+
+    async def __aexit__(self, *args):
+        return
+
+    async def read_category(self, category: str, connect: bool = True):  # type: ignore
+        values = {"temperature": (10.5, "degC"), "humidity": (30.2, "percent")}
+
+        return {
+            f"{module.name}.{device.name}": values.get(category, ("closed", None))
+            for module in self.modules.values()
+            for device in module.devices.values()
+            if device.category == category
+        }
+
+
+def get_offline_wago() -> OfflineWAGO:
+    """Returns an `.OfflineWAGO` with the default configuration."""
+
+    config = read_yaml_file(str(ETC_DIR / "lvmieb.yml"))
+
+    wago_config = dict(config["specs"]["sp1"]["wago"])
+    wago_config["modules"] = config["wago_modules"]
+
+    # The Modbus client must be created with a running event loop, although
+    # it is never used.
+    async def create():
+        return OfflineWAGO.from_config(wago_config, name="sp1")
+
+    return asyncio.run(create())
+
+
+def get_offline_motor(reply: bytes) -> MotorController:
+    """Returns a `.MotorController` that always receives ``reply``."""
+
+    motor = MotorController("sp1", "shutter", "localhost", 0)
+
+    async def send_command(command: str, timeout: float = 3) -> bytes:
+        return reply
+
+    motor.send_command = send_command  # type: ignore
+
+    return motor
+
+
+def compose_motor_status() -> bool:
+    """Composes a `.MotorStatus` as in `.MotorController.get_status`."""
+
+    status = MotorStatus.POWER_ON
+    status |= MotorStatus.OPEN
+
+    return bool(status & (MotorStatus.POSITION_UNKNOWN | MotorStatus.POSITION_INVALID))
+
+
+def get_benchmarks() -> dict[str, Callable[[], Any]]:
+    """Returns the benchmarks, as a mapping of name to function."""
+
+    wago = get_offline_wago()
+    motor = get_offline_motor(IS_OPEN)
+
+    return {
+        "parse_IS.open": lambda: parse_IS(IS_OPEN, "shutter"),
+        "parse_IS.invalid": lambda: parse_IS(IS_INVALID, "hartmann_left"),
+        "motor.status_regex": lambda: IS_PATTERN.search(IS_OPEN),
+        "motor.get_status": lambda: run_sync(motor.get_status()),
+        "motor.status_flags": compose_motor_status,
+        "pressure.reply_regex": lambda: pressure.REPLY_PATTERN.search(PRESSURE_REPLY),
+        "depth.reply_regex": lambda: depth.REPLY_PATTERN.match(DEPTH_REPLY),
+        "wago.read_sensors": lambda: run_sync(wago.read_sensors()),
+        "wago.read_relays": lambda: run_sync(wago.read_relays()),
+    }
+
+
+def measure_time(func: Callable, repeat: int = 7) -> dict[str, float]:
+    """Returns the time per call, in nanoseconds."""
+
+    timer = timeit.Timer(func)
+
+    number, _ = timer.autorange()
+
+    times = [value / number * 1e9 for value in timer.repeat(repeat, number)]
+
+    return {
+        "loops": number,
+        "min_ns": min(times),
+        "median_ns": statistics.median(times),
+        "stdev_ns": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def measure_allocations(func: Callable, number: int = 1000) -> dict[str, float]:
+    """Returns the peak memory allocated during a call and the retained blocks."""
+
+    # Warm up the caches (for example, compiled regular expressions).
+    for _ in range(10):
+        func()
+
+    gc.disable()
+
+    try:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        blocks = sys.getallocatedblocks()
+        for _ in range(number):
+            func()
+        retained = (sys.getallocatedblocks() - blocks) / number
+    finally:
+        gc.enable()
+
+    return {"peak_bytes": peak - start, "retained_blocks": retained}
+
+
+@click.command()
+@click.option(
+    "-k",
+    "--filter",
+    "pattern",
+    default="*",
+    help="Only run the benchmarks whose name matches this pattern.",
+)
+@click.option("-r", "--repeat", type=click.IntRange(2), default=7, show_default=True)
+@click.option("-o", "--output", type=click.Path(dir_okay=False, writable=True))
+@click.option(
+    "--compare",
+    type=click.Path(exists=True, dir_okay=False),
+    help="A previous results file with which to compare.",
+)
+@click.option(
+    "--max-regression",
+    type=click.FloatRange(1, min_open=True),
+    help="Fail if a benchmark is slower than in --compare by more than this factor.",
+)
+def main(
+    pattern: str,
+    repeat: int,
+    output: str | None,
+    compare: str | None,
+    max_regression: float | None,
+):
+    """Runs the micro-benchmarks."""
+
+    results = []
+
+    for name, func in get_benchmarks().items():
+        if not fnmatch.fnmatchcase(name, pattern):
+            continue
+
+        result = {
+            "name": name,
+            **measure_time(func, repeat),
+            **measure_allocations(func),
+        }
+        results.append(result)
+
+        print(
+            f"{name:<22} median={result['median_ns']:10.1f} ns "
+            f"min={result['min_ns']:10.1f} ns "
+            f"stdev={result['stdev_ns']:8.1f} ns "
+            f"peak={result['peak_bytes']:6d} B "
+            f"retained={result['retained_blocks']:5.2f} blocks"
+        )
+
+    if output:
+        write_results(output, get_metadata(benchmark="micro", repeat=repeat), results)
+
+    if compare:
+        ratios = compare_results(compare, results, ["name"], "median_ns")
+
+        if max_regression is not None:
+            regressed = [
+                name for name, ratio in ratios.items() if ratio > max_regression
+            ]
+            if len(regressed) > 0:
+                raise click.ClickException(f"Regressions: {', '.join(regressed)}.")
+
+
+if __name__ == "__main__":
+    main()
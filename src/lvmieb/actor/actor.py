@@ -8,12 +8,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import pathlib
+import time
 import warnings
+from collections import deque
 from copy import deepcopy
 
-from typing import ClassVar
+from typing import Any, Awaitable, ClassVar
+
+import click
 
 from clu import Command
 from clu.actor import AMQPActor
@@ -22,9 +28,26 @@ from sdsstools.configuration import read_yaml_file
 from lvmieb import __version__, config
 from lvmieb.controller.controller import IEBController
 from lvmieb.controller.depth import DepthGauges
-from lvmieb.exceptions import LvmIebUserWarning
+from lvmieb.controller.fleet import IEBFleet
+from lvmieb.controller.journal import journal
+from lvmieb.controller.metrics import registry
+from lvmieb.controller.motor import MotorController
+from lvmieb.controller.recorder import recorder
+from lvmieb.exceptions import LvmIebError, LvmIebUserWarning
+from lvmieb.telemetry import (
+    AlarmEngine,
+    AnomalyDetector,
+    DeadbandFilter,
+    LeakRateMonitor,
+    TelemetryStore,
+)
 
 from .commands import parser as lvm_command_parser
+from .exporter import PrometheusExporter
+from .monitor import LoopMonitor
+from .poller import Poller
+from .publisher import TelemetryPublisher
+from .snapshot import ShutterTransition, Snapshot
 
 
 __all__ = ["IEBActor", "IEBCommand", "ControllersType"]
@@ -53,13 +76,45 @@ class IEBActor(AMQPActor):
         depth_gauges: DepthGauges | None = None,
         **kwargs,
     ):
-        self.controllers = {c.spec: c for c in controllers}
+        self.controllers = IEBFleet(controllers)
         self.depth_gauges = depth_gauges
 
         self.version = __version__
 
+        # Last known reachability of each device, as reported by probe_devices().
+        self.readiness: dict[str, dict[str, bool] | bool] = {}
+        self._probe_task: asyncio.Task | None = None
+
+        self.exporter: PrometheusExporter | None = None
+        self.loop_monitor: LoopMonitor | None = None
+        self.telemetry: TelemetryStore | None = None
+        self.publisher: TelemetryPublisher | None = None
+
+        # Shared poller for the streaming status commands.
+        self.poller = Poller()
+
+        # Last known status keywords, used to reply with deltas.
+        self.snapshot = Snapshot()
+
+        # Last known status of each spectrograph when its shutter moved.
+        self.transitions: dict[str, deque[ShutterTransition]] = {}
+        self.add_shutter_callbacks()
+
         super().__init__(*args, **kwargs)
 
+        # Rolling fit of the pressure of each camera, fed by read_transducers().
+        # Configured in from_config(), once the full configuration is available.
+        self.leak_rates = LeakRateMonitor()
+
+        # Alarm rules, evaluated on every status reading (see check_alarms()).
+        # The rules are loaded in from_config(), once the full configuration
+        # is available.
+        self.alarms = AlarmEngine()
+
+        # Rolling robust z-score of the WAGO sensors (see check_anomalies()).
+        # Created in from_config() if enabled in the configuration.
+        self.anomalies: AnomalyDetector | None = None
+
     async def start(self, **kwargs):  # pragma: no cover
         """Starts the actor connection to RabbitMQ."""
 
@@ -67,7 +122,409 @@ class IEBActor(AMQPActor):
         # have been created.
         self.parser_args = [self.controllers]
 
-        return await super().start(**kwargs)
+        await super().start(**kwargs)
+
+        monitor_config = self.config.get("loop_monitor", {})
+        if monitor_config.get("enabled", False):
+            self.loop_monitor = LoopMonitor(
+                interval=monitor_config.get("interval", 0.25),
+                slow_callback=monitor_config.get("slow_callback", 0.05),
+                log=self.log,
+                time_callbacks=monitor_config.get("time_callbacks", False),
+            )
+            try:
+                self.loop_monitor.start()
+            except LvmIebError as err:
+                self.log.warning(f"Cannot start the loop monitor: {err}")
+                self.loop_monitor = None
+
+        exporter_config = self.config.get("metrics_exporter", {})
+        if exporter_config.get("enabled", False):
+            self.exporter = PrometheusExporter(
+                host=exporter_config.get("host", "0.0.0.0"),
+                port=exporter_config.get("port", 9110),
+            )
+            await self.exporter.start()
+            self.log.info(f"Serving metrics on port {self.exporter.port}.")
+
+        self.open_telemetry()
+
+        journal_config = self.config.get("command_journal", {})
+        if journal_config.get("enabled", False):
+            try:
+                journal.open(journal_config["path"])
+            except OSError as err:
+                self.log.warning(f"Cannot open the command journal: {err}")
+
+        recorder_config = self.config.get("wire_recorder", {})
+        if recorder_config.get("enabled", False):
+            try:
+                recorder.open(recorder_config["path"])
+                self.log.info(f"Recording device traffic to {recorder.path!s}.")
+            except OSError as err:
+                self.log.warning(f"Cannot open the wire recorder journal: {err}")
+
+        publisher_config = self.config.get("telemetry_publisher", {})
+        if publisher_config.get("enabled", False):
+            adaptive_config = publisher_config.get("adaptive", {})
+            adaptive = None
+            if adaptive_config.get("enabled", False):
+                adaptive = {
+                    subsystem: (bounds["min_interval"], bounds["max_interval"])
+                    for subsystem, bounds in adaptive_config.items()
+                    if isinstance(bounds, dict)
+                }
+
+            self.publisher = TelemetryPublisher(
+                self,
+                interval=publisher_config.get("interval", 10),
+                deadband=DeadbandFilter.from_config(publisher_config),
+                adaptive=adaptive,
+            )
+            self.publisher.start()
+
+        # Probe the devices in the background so that the actor can start
+        # accepting commands immediately.
+        self._probe_task = asyncio.create_task(self.report_readiness())
+
+        return self
+
+    async def stop(self):
+        """Stops the background tasks and the actor."""
+
+        if self._probe_task is not None and not self._probe_task.done():
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+        self._probe_task = None
+
+        await self.poller.stop()
+
+        if self.publisher is not None:
+            await self.publisher.stop()
+
+        if self.exporter is not None:
+            await self.exporter.stop()
+
+        if self.loop_monitor is not None:
+            await self.loop_monitor.stop()
+
+        if self.telemetry is not None:
+            self.telemetry.close()
+            self.telemetry = None
+
+        journal.close()
+        recorder.close()
+
+        return await super().stop()
+
+    def parse_command(self, command: IEBCommand) -> IEBCommand:
+        """Parses a command, recording its duration in the metrics registry."""
+
+        start = time.perf_counter()
+        command.add_done_callback(functools.partial(self._record_command, start))
+
+        return super().parse_command(command)
+
+    def _record_command(self, start: float, command: IEBCommand):
+        """Records the duration of a command when it is done.
+
+        Streamed commands run until they are stopped, so their duration is not
+        recorded.
+
+        """
+
+        # Use the command group and subcommand (e.g., "shutter open") as the name,
+        # which keeps the number of different names bounded.
+        words = command.body.split()
+        if len(words) == 0:
+            return
+
+        if any(word == "--stream" or word.startswith("--stream=") for word in words):
+            return
+
+        name = words[0]
+        if isinstance(self.parser.commands.get(name), click.Group) and len(words) > 1:
+            name += " " + words[1]
+
+        registry.observe_command(
+            name,
+            time.perf_counter() - start,
+            failed=command.status.did_fail,
+        )
+
+    def add_shutter_callbacks(self):
+        """Calls `.record_shutter_transition` when a shutter completes a move."""
+
+        for controller in self.controllers.values():
+            if "shutter" not in controller.motors:
+                continue
+
+            callbacks = controller.motors["shutter"].callbacks
+            if self.record_shutter_transition not in callbacks:
+                callbacks.append(self.record_shutter_transition)
+
+    def record_shutter_transition(
+        self,
+        motor: MotorController,
+        position: str,
+        timestamp: float,
+    ) -> ShutterTransition:
+        """Captures the last known status of a spectrograph when its shutter moves.
+
+        Called when the shutter completes a move. The values are taken from
+        the `.Snapshot` of the latest status replies, without reading the
+        devices. The transition is broadcast as ``shutter_transition`` and
+        kept in `.transitions`.
+
+        """
+
+        spec = motor.spec
+
+        keywords = [
+            f"{spec}_sensors",
+            f"{spec}_relays",
+            f"{spec}_hartmann_left",
+            f"{spec}_hartmann_right",
+            "transducer",
+            "depth",
+        ]
+        values = self.snapshot.get(keywords)
+
+        # The transducer keyword includes the cameras of all the spectrographs.
+        if "transducer" in values and spec in self.controllers:
+            cameras = self.controllers[spec].pressure
+            values["transducer"] = {
+                key: value
+                for key, value in values["transducer"].items()
+                if key.split("_")[0] in cameras
+            }
+
+        transition = ShutterTransition(
+            spec=spec,
+            time=timestamp,
+            position=position,
+            values=values,
+            updated={key: self.snapshot.times[key] for key in values},
+        )
+
+        max_transitions = self.config.get("shutter_transitions", {}).get(
+            "max_transitions",
+            100,
+        )
+        if spec not in self.transitions:
+            self.transitions[spec] = deque(maxlen=max_transitions)
+        self.transitions[spec].append(transition)
+
+        self.write("i", message={"shutter_transition": transition.to_dict()})
+
+        return transition
+
+    async def probe_devices(self) -> dict[str, dict[str, bool] | bool]:
+        """Concurrently checks the connectivity to all the devices.
+
+        All the devices in all the enabled spectrographs, and the depth gauges,
+        are probed at the same time using the ``timeouts.controller_connect``
+        timeout from the configuration.
+
+        Returns
+        -------
+        readiness
+            A mapping of spectrograph to the readiness of each one of its
+            devices (see `.IEBController.probe`). If depth gauges are
+            configured, the ``depth`` key indicates whether they are reachable.
+
+        """
+
+        timeout = self.config.get("timeouts", {}).get("controller_connect", 1)
+
+        tasks: list[Awaitable] = [self.controllers.probe_all(timeout=timeout)]
+        if self.depth_gauges is not None:
+            tasks.append(self.depth_gauges.probe(timeout=timeout))
+
+        results = await asyncio.gather(*tasks)
+
+        readiness: dict[str, dict[str, bool] | bool] = {}
+        for spec, result in results[0].items():
+            readiness[spec] = result.value if result.ok else False
+        if self.depth_gauges is not None:
+            readiness["depth"] = results[1]
+
+        self.readiness = readiness
+
+        return readiness
+
+    async def report_readiness(self):
+        """Probes the devices and broadcasts the readiness keywords."""
+
+        readiness = await self.probe_devices()
+
+        for name, value in readiness.items():
+            if value is False or (isinstance(value, dict) and not all(value.values())):
+                self.log.warning(f"Some {name} devices are not reachable: {value}")
+
+        message = {f"{name}_readiness": value for name, value in readiness.items()}
+        self.write("i", message=message)
+
+        return readiness
+
+    def get_telemetry_columns(self) -> list[str]:
+        """Returns the names of the telemetry columns for the current devices.
+
+        These are ``<spec>_<sensor>`` for the WAGO sensors, ``<camera>_pressure``
+        and ``<camera>_temperature`` for the pressure transducers, and
+        ``depth_<channel>`` for the depth gauges. They match the keys used in
+        the replies of the status commands.
+
+        """
+
+        columns: list[str] = []
+        for spec, controller in self.controllers.items():
+            columns += [f"{spec}_{name}" for name in controller.wago.get_sensor_names()]
+
+        for controller in self.controllers.values():
+            for camera in controller.pressure:
+                columns += [f"{camera}_pressure", f"{camera}_temperature"]
+
+        if self.depth_gauges is not None:
+            columns += ["depth_a", "depth_b", "depth_c"]
+
+        return list(dict.fromkeys(columns))
+
+    def open_telemetry(self) -> TelemetryStore | None:
+        """Opens the telemetry store defined in the ``telemetry`` configuration.
+
+        If the store cannot be opened (for example because the devices have
+        changed and the columns do not match those in the file) a warning is
+        issued and telemetry is not recorded.
+
+        """
+
+        telemetry_config = self.config.get("telemetry", {})
+        if not telemetry_config.get("enabled", False):
+            return None
+
+        try:
+            self.telemetry = TelemetryStore(
+                telemetry_config["path"],
+                columns=self.get_telemetry_columns(),
+                capacity=telemetry_config.get("capacity", 1_000_000),
+            )
+        except Exception as err:
+            self.log.warning(f"Cannot open the telemetry store: {err}")
+            self.telemetry = None
+
+        return self.telemetry
+
+    def record_telemetry(
+        self,
+        values: dict[str, float],
+        timestamp: float | None = None,
+    ):
+        """Appends a sample to the telemetry store, if enabled.
+
+        Parameters
+        ----------
+        values
+            A mapping of telemetry column to value.
+        timestamp
+            The UNIX time of the sample. Defaults to the current time.
+
+        """
+
+        if self.telemetry is None or len(values) == 0:
+            return
+
+        try:
+            self.telemetry.append(values, timestamp=timestamp)
+        except Exception as err:
+            self.log.warning(f"Failed recording telemetry: {err}")
+
+    def check_alarms(
+        self,
+        message: dict[str, Any],
+        timestamp: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Evaluates the alarm rules on a status message.
+
+        Each alarm that is raised or cleared is broadcast as an ``alarm``
+        keyword, as a warning or error if raised.
+
+        Parameters
+        ----------
+        message
+            The status keywords, as returned by the status commands.
+        timestamp
+            The UNIX time of the values. Defaults to the current time.
+
+        Returns
+        -------
+        alarms
+            The alarms that have been raised or cleared.
+
+        """
+
+        if not self.alarms.enabled:
+            return []
+
+        try:
+            alarms = self.alarms.evaluate(message, now=timestamp)
+        except Exception as err:
+            self.log.warning(f"Failed evaluating the alarms: {err}")
+            return []
+
+        for alarm in alarms:
+            if not alarm["active"]:
+                level = "i"
+            elif alarm["severity"] == "error":
+                level = "e"
+            else:
+                level = "w"
+            self.write(level, message={"alarm": alarm})
+
+        return alarms
+
+    def check_anomalies(
+        self,
+        values: dict[str, float],
+        timestamp: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Checks the WAGO sensor values for anomalies, if enabled.
+
+        Each anomaly that is raised is broadcast as a ``sensor_anomaly``
+        warning, and as an informational message when it is cleared.
+
+        Parameters
+        ----------
+        values
+            A mapping of ``<spec>_<sensor>`` to value, as recorded in the
+            telemetry store.
+        timestamp
+            The UNIX time of the values. Defaults to the current time.
+
+        Returns
+        -------
+        anomalies
+            The anomalies that have been raised or cleared.
+
+        """
+
+        if self.anomalies is None:
+            return []
+
+        try:
+            anomalies = self.anomalies.update(values, now=timestamp)
+        except Exception as err:
+            self.log.warning(f"Failed checking for anomalies: {err}")
+            return []
+
+        for anomaly in anomalies:
+            level = "w" if anomaly["active"] else "i"
+            self.write(level, message={"sensor_anomaly": anomaly})
+
+        return anomalies
 
     @classmethod
     def from_config(cls, config: dict | str | None, *args, **kwargs):
@@ -92,6 +549,9 @@ class IEBActor(AMQPActor):
 
         instance = super().from_config(config["actor"], *args, **kwargs)
 
+        # Keep the full configuration, not only the actor section.
+        instance.config = config
+
         controllers: list[IEBController] = []
 
         for spec in config.get("enabled_specs", []):
@@ -112,7 +572,14 @@ class IEBActor(AMQPActor):
             )
             controllers.append(controller)
 
-        instance.controllers = {contr.spec: contr for contr in controllers}
+        instance.controllers = IEBFleet(controllers)
+        instance.add_shutter_callbacks()
+
+        instance.leak_rates = LeakRateMonitor.from_config(config.get("leak_rate", {}))
+        instance.alarms = AlarmEngine.from_config(config.get("alarms", {}))
+        instance.anomalies = AnomalyDetector.from_config(
+            config.get("anomaly_detection", {})
+        )
 
         if (depth_gauges := config.get("depth_gauges", None)) is not None:
             instance.depth_gauges = DepthGauges(**depth_gauges.copy())
@@ -121,4 +588,4 @@ class IEBActor(AMQPActor):
 
 
 IEBCommand = Command[IEBActor]
-ControllersType = dict[str, IEBController]
+ControllersType = IEBFleet
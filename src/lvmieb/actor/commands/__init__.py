@@ -6,9 +6,9 @@
 # @Filename: __init__.py
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
-import glob
+from __future__ import annotations
+
 import importlib
-import os
 
 import click
 
@@ -23,32 +23,102 @@ from clu.parsers.click import (
 )
 
 
-@click.group(cls=CluGroup)
-def parser(*args):
-    pass
+__all__ = ["parser", "COMMANDS", "LazyCluGroup"]
 
 
-parser.add_command(ping)
-parser.add_command(version)
-parser.add_command(help_)
-parser.add_command(get_command_model)
+# Static registry of the actor commands. Each entry maps the name of the command
+# to the "module:attribute" where it is defined. The module is only imported the
+# first time the command is invoked (or listed, for example in the help).
+COMMANDS: dict[str, str] = {
+    "alarms": "lvmieb.actor.commands.alarms:alarms",
+    "debug": "lvmieb.actor.commands.debug:debug",
+    "depth": "lvmieb.actor.commands.depth:depth",
+    "hartmann": "lvmieb.actor.commands.hartmann:hartmann",
+    "history": "lvmieb.actor.commands.history:history",
+    "journal": "lvmieb.actor.commands.journal:journal",
+    "lookup": "lvmieb.actor.commands.lookup:lookup",
+    "metrics": "lvmieb.actor.commands.metrics:metrics",
+    "readiness": "lvmieb.actor.commands.readiness:readiness",
+    "shutter": "lvmieb.actor.commands.shutter:shutter",
+    "status": "lvmieb.actor.commands.status:status",
+    "stream": "lvmieb.actor.commands.stream:stream",
+    "transducer": "lvmieb.actor.commands.transducer:transducer",
+    "wago": "lvmieb.actor.commands.wago:wago",
+}
+
+
+def _import_command(path: str) -> click.Command:
+    """Imports a command from a ``module:attribute`` string."""
+
+    module_name, attribute = path.split(":")
+    module = importlib.import_module(module_name)
+
+    command = getattr(module, attribute)
+    if not isinstance(command, click.Command):
+        raise ValueError(f"{path!r} is not a click command.")
+
+    return command
+
+
+class _LazyCommandDict(dict):
+    """A dictionary of commands that resolves lazy commands on access.
+
+    `.CluGroup` helpers such as ``help`` access ``group.commands`` directly so
+    we need lookups in the dictionary to trigger the import.
+
+    """
+
+    def __init__(self, commands: dict[str, click.Command], lazy: dict[str, str]):
+        super().__init__(commands)
+        self.lazy = lazy
 
+    def __missing__(self, name: str) -> click.Command:
+        if name not in self.lazy:
+            raise KeyError(name)
 
-# Autoimport all modules in this directory so that they are added to the parser.
+        command = _import_command(self.lazy[name])
+        self[name] = command
 
-exclusions = ["__init__.py"]
+        return command
 
-cwd = os.getcwd()
-os.chdir(os.path.dirname(os.path.realpath(__file__)))
+    def __contains__(self, name: object) -> bool:
+        return super().__contains__(name) or name in self.lazy
 
-files = [
-    file_ for file_ in glob.glob("**/*.py", recursive=True) if file_ not in exclusions
-]
+    def get(self, name: str, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
 
-for file_ in files:
-    modname = file_[0:-3].replace("/", ".")
-    mod = importlib.import_module(
-        "lvmieb.actor.commands." + modname
-    )  # changged by CK 2021/03/30
 
-os.chdir(cwd)
+class LazyCluGroup(CluGroup):
+    """A `.CluGroup` that imports its subcommands on first use.
+
+    Parameters
+    ----------
+    lazy_subcommands
+        A mapping of command name to the ``module:attribute`` path where the
+        command is defined.
+
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] = {}, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.commands = _LazyCommandDict(self.commands, lazy_subcommands.copy())
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        assert isinstance(self.commands, _LazyCommandDict)
+
+        return sorted(set(self.commands.keys()) | set(self.commands.lazy))
+
+
+@click.group(cls=LazyCluGroup, lazy_subcommands=COMMANDS)
+def parser(*args):
+    pass
+
+
+parser.add_command(ping)
+parser.add_command(version)
+parser.add_command(help_)
+parser.add_command(get_command_model)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: alarms.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from clu.parsers.click import CluCommand
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBCommand
+
+
+__all__ = ["alarms"]
+
+
+@click.command(cls=CluCommand)
+async def alarms(command: IEBCommand, controllers: ControllersType):
+    """Reports the active alarms.
+
+    The alarms are evaluated on the values read by the status commands and
+    the telemetry publisher. The rules are defined in the alarms configuration.
+
+    """
+
+    if not command.actor.alarms.enabled:
+        return command.fail(error="No alarm rules are defined.")
+
+    return command.finish(alarms=command.actor.alarms.get_active())
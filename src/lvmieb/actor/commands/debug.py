@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: debug.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import pathlib
+import pstats
+import tempfile
+import time
+
+from typing import TYPE_CHECKING
+
+import click
+
+from clu.parsers.click import CluGroup
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBActor, IEBCommand
+
+
+__all__ = ["debug"]
+
+
+# Maximum duration of a profiling window, in seconds.
+MAX_PROFILE_TIME = 300
+
+# Only one profiler can be active at a time.
+_profile_lock = asyncio.Lock()
+
+
+def get_output_dir(actor: IEBActor) -> pathlib.Path:
+    """Returns the directory where the actor writes its logs."""
+
+    if actor.log.fh is not None:
+        return pathlib.Path(actor.log.fh.baseFilename).parent
+
+    log_dir = actor.config.get("actor", {}).get("log_dir", None)
+    if log_dir:
+        return pathlib.Path(log_dir).expanduser()
+
+    return pathlib.Path(tempfile.gettempdir())
+
+
+def get_hot_functions(
+    stats: pstats.Stats,
+    sort: str = "cumulative",
+    top: int = 20,
+    filter: str | None = None,
+) -> list[dict]:
+    """Returns the top functions from a set of profiling statistics."""
+
+    rows = []
+    for (filename, lineno, function), values in stats.stats.items():  # type: ignore
+        if filter and filter not in filename:
+            continue
+
+        _, ncalls, tottime, cumtime, _ = values
+        rows.append(
+            {
+                "function": f"{function} ({filename}:{lineno})",
+                "ncalls": ncalls,
+                "tottime": round(tottime, 6),
+                "cumtime": round(cumtime, 6),
+            }
+        )
+
+    key = "cumtime" if sort == "cumulative" else "tottime"
+    rows.sort(key=lambda row: row[key], reverse=True)
+
+    return rows[:top]
+
+
+@click.group(cls=CluGroup)
+def debug(*args):
+    """Tools to debug the performance of the actor."""
+
+    pass
+
+
+@debug.command()
+async def loop(command: IEBCommand, controllers: ControllersType):
+    """Reports the event loop lag and the slow callbacks."""
+
+    monitor = command.actor.loop_monitor
+    if monitor is None or not monitor.running:
+        return command.fail(error="The loop monitor is not running.")
+
+    return command.finish(loop_health=monitor.to_dict())
+
+
+@debug.command()
+@click.argument("SECONDS", type=click.FloatRange(0, MAX_PROFILE_TIME, min_open=True))
+@click.option(
+    "--sort",
+    type=click.Choice(["cumulative", "tottime"]),
+    default="cumulative",
+    help="How to sort the functions in the reply.",
+)
+@click.option("--top", type=int, default=20, help="Number of functions to report.")
+@click.option(
+    "--filter",
+    "filter_",
+    type=str,
+    help="Only report functions whose file path contains this string.",
+)
+async def profile(
+    command: IEBCommand,
+    controllers: ControllersType,
+    seconds: float,
+    sort: str = "cumulative",
+    top: int = 20,
+    filter_: str | None = None,
+):
+    """Profiles the actor for a number of SECONDS.
+
+    The profiler runs in the event loop thread, so it captures all the
+    commands and tasks running during the window. The statistics are saved
+    to the log directory and the hottest functions are reported.
+
+    """
+
+    if _profile_lock.locked():
+        return command.fail(error="A profiling session is already running.")
+
+    async with _profile_lock:
+        command.info(text=f"Profiling the actor for {seconds} seconds.")
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.disable()
+
+    output_dir = get_output_dir(command.actor)
+    timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+    path = output_dir / f"profile_{timestamp}.prof"
+
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
+    except OSError as err:
+        command.warning(text=f"Failed saving the profiling statistics: {err}")
+        path = None
+
+    stats = pstats.Stats(profiler)
+    hot_functions = get_hot_functions(stats, sort=sort, top=top, filter=filter_)
+
+    return command.finish(
+        profile={
+            "file": str(path) if path else "",
+            "duration": seconds,
+            "functions": hot_functions,
+        }
+    )
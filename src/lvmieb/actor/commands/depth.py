@@ -3,50 +3,79 @@
 
 from __future__ import annotations
 
+import functools
+
 from typing import TYPE_CHECKING
 
 import click
 
-from . import parser
+from clu.parsers.click import CluGroup
+
+from lvmieb.actor.poller import reply_status, since_option, stream_option
 
 
 if TYPE_CHECKING:
-    from lvmieb.actor import ControllersType, IEBCommand
+    from lvmieb.actor import ControllersType, IEBActor, IEBCommand
 
 
 __all__ = ["depth"]
 
 
-@parser.group()
+@click.group(cls=CluGroup)
 def depth(*args):
     """Controls the linear gauge depth."""
     pass
 
 
+async def read_depth(
+    actor: IEBActor,
+    camera: str | None = None,
+) -> tuple[dict[str, dict[str, float | str]], list[str]]:
+    """Reads the depth gauges and records them in the telemetry store.
+
+    Returns the ``depth`` keyword and an empty list of warnings.
+
+    """
+
+    depth_gauges = actor.depth_gauges
+    assert depth_gauges is not None
+
+    depth = await depth_gauges.read()
+
+    telemetry = {f"depth_{channel.lower()}": value for channel, value in depth.items()}
+    actor.record_telemetry(telemetry)
+
+    camera = camera or depth_gauges.camera or "?"
+    return {"depth": {"camera": camera, **depth}}, []
+
+
 @depth.command()
 @click.option(
     "--camera",
     type=str,
     help="Temporarily sets the camera to which the probes are connected.",
 )
+@stream_option
+@since_option
 async def status(
     command: IEBCommand,
     controllers: ControllersType,
     camera: str | None = None,
+    stream: float | None = None,
+    since: str | None = None,
 ):
     """Returns the measurements from the depth probes."""
 
-    depth_gauges = command.actor.depth_gauges
-    if depth_gauges is None:
+    if command.actor.depth_gauges is None:
         return command.fail(error="Depth gauge configuration not defined.")
 
-    try:
-        depth = await depth_gauges.read()
-    except Exception as err:
-        return command.fail(error=err)
-
-    camera = camera or depth_gauges.camera or "?"
-    return command.finish({"depth": {"camera": camera, **depth}})
+    return await reply_status(
+        command,
+        ("depth", camera),
+        functools.partial(read_depth, command.actor, camera),
+        stream=stream,
+        since=since,
+    )
 
 
 @depth.command(name="set-camera")
@@ -7,16 +7,16 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 
 from typing import TYPE_CHECKING
 
 import click
 
-from lvmieb.controller.maskbits import MotorStatus
-from lvmieb.exceptions import MotorControllerError
+from clu.parsers.click import CluGroup
 
-from . import parser
+from lvmieb.actor.poller import reply_status, since_option, stream_option
+from lvmieb.controller.maskbits import MotorStatus
 
 
 if TYPE_CHECKING:
@@ -26,7 +26,11 @@ if TYPE_CHECKING:
 __all__ = ["hartmann"]
 
 
-@parser.group()
+SIDES = ["left", "right"]
+HARTMANNS = [f"hartmann_{name}" for name in SIDES]
+
+
+@click.group(cls=CluGroup)
 def hartmann(*args):
     """Control the hartmann doors."""
 
@@ -58,25 +62,19 @@ async def open(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
-    tasks = []
-    if side == "all" or side == "left":
-        tasks.append(controller.motors["hartmann_left"].move(open=True))
-    if side == "all" or side == "right":
-        tasks.append(controller.motors["hartmann_right"].move(open=True))
-
     command.info(text=f"Opening {side} hartmann(s)")
 
-    results = []
-    try:
-        results = await asyncio.gather(*tasks)
-    except MotorControllerError as err:
-        return command.fail(error=err)
+    results = await controllers.map_motors(
+        lambda motor: motor.move(open=True),
+        [f"hartmann_{name}" for name in SIDES if side in ["all", name]],
+        spectro,
+    )
+    if not results.ok:
+        return command.fail(error=results.failed[spectro])
 
     await (await command.child_command(f"hartmann status {spectro}"))
 
-    if False in results:
+    if not all(results[spectro].value.values()):
         return command.fail("Failed executing command.")
 
     return command.finish()
@@ -107,36 +105,78 @@ async def close(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
-    tasks = []
-    if side == "all" or side == "left":
-        tasks.append(controller.motors["hartmann_left"].move(open=False))
-    if side == "all" or side == "right":
-        tasks.append(controller.motors["hartmann_right"].move(open=False))
-
     command.info(text=f"Closing {side} hartmann(s)")
 
-    results = []
-    try:
-        results = await asyncio.gather(*tasks)
-    except MotorControllerError as err:
-        return command.fail(error=err)
+    results = await controllers.map_motors(
+        lambda motor: motor.move(open=False),
+        [f"hartmann_{name}" for name in SIDES if side in ["all", name]],
+        spectro,
+    )
+    if not results.ok:
+        return command.fail(error=results.failed[spectro])
 
     await (await command.child_command(f"hartmann status {spectro}"))
 
-    if False in results:
+    if not all(results[spectro].value.values()):
         return command.fail("Failed executing command.")
 
     return command.finish()
 
 
+async def read_hartmanns(
+    controllers: ControllersType,
+    spectro_list: list[str],
+) -> tuple[dict[str, dict[str, bool | str]], list[str]]:
+    """Reads the status of the Hartmann doors.
+
+    Returns the ``<spec>_hartmann_<side>`` keywords and a list of warnings.
+
+    """
+
+    results = await controllers.map_motors(
+        lambda motor: motor.get_status(),
+        HARTMANNS,
+        spectro_list,
+    )
+
+    hd_status = {}
+    warnings = []
+    for spectro_name, result in results.items():
+        if not result.ok or result.value is None:
+            warnings.append(f"Failed to read {spectro_name} hartmanns.")
+            continue
+
+        for name in SIDES:
+            motor_status, bits = result.value[f"hartmann_{name}"]
+
+            power = motor_status & MotorStatus.POWER_ON
+            open = motor_status & MotorStatus.OPEN
+            invalid = motor_status & (
+                MotorStatus.POSITION_INVALID
+                | MotorStatus.POSITION_UNKNOWN
+                | MotorStatus.POWER_UNKNOWN
+            )
+
+            hd_status[f"{spectro_name}_hartmann_{name}"] = {
+                "power": power.value > 0,
+                "open": open.value > 0,
+                "invalid": invalid.value > 0,
+                "bits": bits or "?",
+            }
+
+    return hd_status, warnings
+
+
 @hartmann.command()
 @click.argument("spectro", type=str, required=False)
+@stream_option
+@since_option
 async def status(
     command: IEBCommand,
     controllers: ControllersType,
     spectro: str | None = None,
+    stream: float | None = None,
+    since: str | None = None,
 ):
     """Reports the position of the Hartmann doors."""
 
@@ -148,37 +188,14 @@ async def status(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
-    tasks = []
-    tasks.append(controller.motors["hartmann_left"].get_status())
-    tasks.append(controller.motors["hartmann_right"].get_status())
-
-    result_hartmann = await asyncio.gather(*tasks)
-
-    hd_status = {}
-    for i, name in enumerate(["left", "right"]):
-        motor_status, bits = result_hartmann[i]
-
-        power = motor_status & MotorStatus.POWER_ON
-        open = motor_status & MotorStatus.OPEN
-        invalid = motor_status & (
-            MotorStatus.POSITION_INVALID
-            | MotorStatus.POSITION_UNKNOWN
-            | MotorStatus.POWER_UNKNOWN
-        )
-
-        hd_status[name] = {
-            "power": power.value > 0,
-            "open": open.value > 0,
-            "invalid": invalid.value > 0,
-            "bits": bits or "?",
-        }
-
-    command.info({f"{spectro}_hartmann_left": hd_status["left"]})
-    command.info({f"{spectro}_hartmann_right": hd_status["right"]})
-
-    return command.finish()
+    return await reply_status(
+        command,
+        ("hartmann", spectro),
+        functools.partial(read_hartmanns, controllers, [spectro]),
+        stream=stream,
+        split=True,
+        since=since,
+    )
 
 
 @hartmann.command()
@@ -198,18 +215,15 @@ async def init(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
     command.info(text="Initializing all hartmanns")
 
-    tasks = []
-    for hd in ["hartmann_left", "hartmann_right"]:
-        tasks.append(controller.motors[hd].send_command("init"))
-
-    try:
-        await asyncio.gather(*tasks)
-    except MotorControllerError as err:
-        return command.fail(error=err)
+    results = await controllers.map_motors(
+        lambda motor: motor.send_command("init"),
+        HARTMANNS,
+        spectro,
+    )
+    if not results.ok:
+        return command.fail(error=results.failed[spectro])
 
     return command.finish()
 
@@ -231,17 +245,14 @@ async def home(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
     command.info(text="Homing all hartmanns")
 
-    tasks = []
-    for hd in ["hartmann_left", "hartmann_right"]:
-        tasks.append(controller.motors[hd].send_command("home"))
-
-    try:
-        await asyncio.gather(*tasks)
-    except MotorControllerError as err:
-        return command.fail(error=err)
+    results = await controllers.map_motors(
+        lambda motor: motor.send_command("home"),
+        HARTMANNS,
+        spectro,
+    )
+    if not results.ok:
+        return command.fail(error=results.failed[spectro])
 
     return command.finish()
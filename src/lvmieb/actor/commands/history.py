@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: history.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import time
+
+from typing import TYPE_CHECKING
+
+import click
+
+from clu.parsers.click import CluCommand
+
+from lvmieb.exceptions import LvmIebError
+from lvmieb.telemetry import parse_duration, parse_time
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBCommand
+
+
+__all__ = ["history"]
+
+
+@click.command(cls=CluCommand)
+@click.argument("SENSORS", type=str, nargs=-1, required=True)
+@click.option(
+    "--since",
+    type=str,
+    default="1h",
+    show_default=True,
+    help="Start of the interval. A UNIX time, an ISO date, or a duration ago.",
+)
+@click.option(
+    "--until",
+    type=str,
+    help="End of the interval. Defaults to now.",
+)
+@click.option(
+    "--bin",
+    "bin_size",
+    type=str,
+    default="60s",
+    show_default=True,
+    help="Size of the time bins, for example 30s, 5m, or 1h.",
+)
+async def history(
+    command: IEBCommand,
+    controllers: ControllersType,
+    sensors: tuple[str, ...],
+    since: str = "1h",
+    until: str | None = None,
+    bin_size: str = "60s",
+):
+    """Returns the recorded history of one or more sensors.
+
+    SENSORS are telemetry columns such as sp1_t1, r1_pressure, or depth_a. For
+    each time bin the number of samples and the min, mean, max and last value
+    are returned.
+
+    """
+
+    store = command.actor.telemetry
+    if store is None:
+        return command.fail(error="Telemetry recording is not enabled.")
+
+    now = time.time()
+
+    try:
+        since_time = parse_time(since, now=now)
+        until_time = parse_time(until, now=now) if until is not None else now
+        bin_seconds = parse_duration(bin_size)
+        result = store.history(
+            list(sensors),
+            since=since_time,
+            until=until_time,
+            bin_size=bin_seconds,
+        )
+    except LvmIebError as err:
+        return command.fail(error=str(err))
+
+    sensor_history = {
+        name: {key: values.tolist() for key, values in bins.items()}
+        for name, bins in result.items()
+    }
+
+    return command.finish(
+        history={
+            "since": round(since_time, 3),
+            "until": round(until_time, 3),
+            "bin": bin_seconds,
+            "sensors": sensor_history,
+        }
+    )
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: journal.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import time
+
+from typing import TYPE_CHECKING
+
+import click
+
+from clu.parsers.click import CluCommand
+
+from lvmieb.controller.journal import journal as command_journal
+from lvmieb.exceptions import LvmIebError
+from lvmieb.telemetry import parse_time
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBCommand
+
+
+__all__ = ["journal"]
+
+
+@click.command(cls=CluCommand)
+@click.option(
+    "--since",
+    type=str,
+    default="1h",
+    show_default=True,
+    help="Start of the interval. A UNIX time, an ISO date, or a duration ago.",
+)
+@click.option("--until", type=str, help="End of the interval. Defaults to now.")
+@click.option("--spec", type=str, help="Only return operations for this spectrograph.")
+@click.option("--device", type=str, help="Only return operations for this device.")
+@click.option(
+    "--operation",
+    type=click.Choice(["move", "init", "home", "set_relay"]),
+    help="Only return this operation.",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(1),
+    default=100,
+    show_default=True,
+    help="Maximum number of entries, the latest first.",
+)
+async def journal(
+    command: IEBCommand,
+    controllers: ControllersType,
+    since: str = "1h",
+    until: str | None = None,
+    spec: str | None = None,
+    device: str | None = None,
+    operation: str | None = None,
+    limit: int = 100,
+):
+    """Returns the journaled hardware operations in a time range."""
+
+    if not command_journal.enabled:
+        return command.fail(error="The command journal is not enabled.")
+
+    now = time.time()
+
+    try:
+        since_time = parse_time(since, now=now)
+        until_time = parse_time(until, now=now) if until is not None else now
+        entries = command_journal.query(
+            since=since_time,
+            until=until_time,
+            spec=spec,
+            device=device,
+            operation=operation,
+            limit=limit,
+        )
+    except LvmIebError as err:
+        return command.fail(error=str(err))
+
+    return command.finish(
+        journal={
+            "since": round(since_time, 3),
+            "until": round(until_time, 3),
+            "entries": entries[::-1],
+        }
+    )
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: lookup.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import time
+
+from typing import TYPE_CHECKING
+
+import click
+
+from clu.parsers.click import CluCommand
+
+from lvmieb.exceptions import LvmIebError
+from lvmieb.telemetry import parse_duration, parse_time
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBCommand
+
+
+__all__ = ["lookup"]
+
+
+@click.command(cls=CluCommand)
+@click.argument("TIMES", type=str, nargs=-1, required=True)
+@click.option(
+    "-s",
+    "--sensor",
+    "sensors",
+    type=str,
+    multiple=True,
+    help="A telemetry column to return. Can be repeated. Defaults to all.",
+)
+@click.option(
+    "--method",
+    type=click.Choice(["linear", "nearest"]),
+    default="linear",
+    show_default=True,
+    help="Interpolate between the samples around each time, or use the nearest.",
+)
+@click.option(
+    "--max-gap",
+    type=str,
+    default="10m",
+    show_default=True,
+    help="Ignore samples farther than this from each time.",
+)
+async def lookup(
+    command: IEBCommand,
+    controllers: ControllersType,
+    times: tuple[str, ...],
+    sensors: tuple[str, ...] = (),
+    method: str = "linear",
+    max_gap: str = "10m",
+):
+    """Returns the recorded sensor values at one or more times.
+
+    TIMES are UNIX times, ISO dates, or durations ago (for example, the times
+    at which the shutter opened and closed). The values are read from the
+    telemetry store; the devices are not queried.
+
+    """
+
+    store = command.actor.telemetry
+    if store is None:
+        return command.fail(error="Telemetry recording is not enabled.")
+
+    now = time.time()
+
+    try:
+        lookup_times = [parse_time(value, now=now) for value in times]
+        result = store.lookup(
+            lookup_times,
+            columns=list(sensors) if len(sensors) > 0 else None,
+            method=method,
+            max_gap=parse_duration(max_gap),
+        )
+    except LvmIebError as err:
+        return command.fail(error=str(err))
+
+    return command.finish(
+        lookup={
+            "method": method,
+            "times": [round(value, 3) for value in lookup_times],
+            "sensors": result,
+        }
+    )
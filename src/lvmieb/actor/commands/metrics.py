@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: metrics.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from clu.parsers.click import CluCommand
+
+from lvmieb.controller.metrics import registry
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBCommand
+
+
+__all__ = ["metrics"]
+
+
+@click.command(cls=CluCommand)
+@click.argument("DEVICE", type=str, required=False)
+@click.option("--reset", is_flag=True, help="Clears the metrics after reporting.")
+async def metrics(
+    command: IEBCommand,
+    controllers: ControllersType,
+    device: str | None = None,
+    reset: bool = False,
+):
+    """Reports latency and error metrics for each device and operation.
+
+    DEVICE can be used to limit the output to a single device, for example
+    sp1.shutter or depth.
+
+    """
+
+    device_metrics = registry.to_dict(device=device)
+
+    if reset:
+        registry.reset()
+
+    return command.finish(metrics=device_metrics)
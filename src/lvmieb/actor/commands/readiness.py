@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: readiness.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from clu.parsers.click import CluCommand
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBCommand
+
+
+__all__ = ["readiness"]
+
+
+@click.command(cls=CluCommand)
+async def readiness(command: IEBCommand, controllers: ControllersType):
+    """Probes all the devices and reports which ones are reachable."""
+
+    result = await command.actor.probe_devices()
+    readiness = {f"{name}_readiness": value for name, value in result.items()}
+
+    return command.finish(readiness)
@@ -8,16 +8,16 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 
 from typing import TYPE_CHECKING
 
 import click
 
-from lvmieb.controller.maskbits import MotorStatus
-from lvmieb.exceptions import MotorControllerError
+from clu.parsers.click import CluGroup
 
-from . import parser
+from lvmieb.actor.poller import reply_status, since_option, stream_option
+from lvmieb.controller.maskbits import MotorStatus
 
 
 if TYPE_CHECKING:
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
 __all__ = ["shutter"]
 
 
-@parser.group()
+@click.group(cls=CluGroup)
 def shutter(*args):
     """Control the shutter."""
 
@@ -51,16 +51,11 @@ async def open(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
-    tasks = []
-    tasks.append(controller.motors["shutter"].move(open=True))
-
     command.info(text="Opening shutter")
-    try:
-        await asyncio.gather(*tasks)
-    except MotorControllerError as err:
-        return command.fail(error=err)
+
+    results = await controllers.move_all("shutter", open=True, specs=spectro)
+    if not results.ok:
+        return command.fail(error=results.failed[spectro])
 
     await (await command.child_command(f"shutter status {spectro}"))
 
@@ -84,28 +79,66 @@ async def close(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
-    tasks = []
-    tasks.append(controller.motors["shutter"].move(open=False))
-
     command.info(text="Closing shutter")
-    try:
-        await asyncio.gather(*tasks)
-    except MotorControllerError as err:
-        return command.fail(error=err)
+
+    results = await controllers.move_all("shutter", open=False, specs=spectro)
+    if not results.ok:
+        return command.fail(error=results.failed[spectro])
 
     await (await command.child_command(f"shutter status {spectro}"))
 
     return command.finish()
 
 
+async def read_shutter(
+    controllers: ControllersType,
+    spectro_list: list[str],
+) -> tuple[dict[str, dict[str, bool | str]], list[str]]:
+    """Reads the shutter status.
+
+    Returns the ``<spec>_shutter`` keywords and a list of warnings.
+
+    """
+
+    results = await controllers.get_status_all("shutter", spectro_list)
+
+    shutters = {}
+    warnings = []
+    for spectro_name, result in results.items():
+        if not result.ok or result.value is None:
+            warnings.append(f"Failed to read {spectro_name} shutter.")
+            continue
+
+        motor_status, bits = result.value
+
+        power = motor_status & MotorStatus.POWER_ON
+        open = motor_status & MotorStatus.OPEN
+        invalid = motor_status & (
+            MotorStatus.POSITION_INVALID
+            | MotorStatus.POSITION_UNKNOWN
+            | MotorStatus.POWER_UNKNOWN
+        )
+
+        shutters[f"{spectro_name}_shutter"] = {
+            "power": power.value > 0,
+            "open": open.value > 0,
+            "invalid": invalid.value > 0,
+            "bits": bits or "?",
+        }
+
+    return shutters, warnings
+
+
 @shutter.command()
 @click.argument("spectro", type=str, required=False)
+@stream_option
+@since_option
 async def status(
     command: IEBCommand,
     controllers: ControllersType,
     spectro: str | None = None,
+    stream: float | None = None,
+    since: str | None = None,
 ):
     """Reports the position of the shutter."""
 
@@ -117,33 +150,14 @@ async def status(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
-    tasks = []
-    tasks.append(controller.motors["shutter"].get_status())
-
-    result_shutter = await asyncio.gather(*tasks)
-
-    shutter_status = {}
-    motor_status, bits = result_shutter[0]
-
-    power = motor_status & MotorStatus.POWER_ON
-    open = motor_status & MotorStatus.OPEN
-    invalid = motor_status & (
-        MotorStatus.POSITION_INVALID
-        | MotorStatus.POSITION_UNKNOWN
-        | MotorStatus.POWER_UNKNOWN
+    return await reply_status(
+        command,
+        ("shutter", spectro),
+        functools.partial(read_shutter, controllers, [spectro]),
+        stream=stream,
+        since=since,
     )
 
-    shutter_status = {
-        "power": power.value > 0,
-        "open": open.value > 0,
-        "invalid": invalid.value > 0,
-        "bits": bits or "?",
-    }
-
-    return command.finish({f"{spectro}_shutter": shutter_status})
-
 
 @shutter.command()
 @click.argument("spectro", type=str, required=False)
@@ -162,17 +176,11 @@ async def init(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
     command.info(text="Initializing shutter")
 
-    tasks = []
-    tasks.append(controller.motors["shutter"].send_command("init"))
-
-    try:
-        await asyncio.gather(*tasks)
-    except MotorControllerError as err:
-        return command.fail(error=err)
+    results = await controllers.send_command_all("shutter", "init", specs=spectro)
+    if not results.ok:
+        return command.fail(error=results.failed[spectro])
 
     return command.finish()
 
@@ -194,16 +202,45 @@ async def home(
     if spectro not in controllers:
         return command.fail(error=f"Spectrograph {spectro!r} is not available.")
 
-    controller = controllers[spectro]
-
     command.info(text="Homing shutter")
 
-    tasks = []
-    tasks.append(controller.motors["shutter"].send_command("home"))
-
-    try:
-        await asyncio.gather(*tasks)
-    except MotorControllerError as err:
-        return command.fail(error=err)
+    results = await controllers.send_command_all("shutter", "home", specs=spectro)
+    if not results.ok:
+        return command.fail(error=results.failed[spectro])
 
     return command.finish()
+
+
+@shutter.command()
+@click.argument("spectro", type=str, required=False)
+@click.option(
+    "-n",
+    "--last",
+    type=click.IntRange(1),
+    default=1,
+    show_default=True,
+    help="Number of transitions to return, the latest first.",
+)
+async def transitions(
+    command: IEBCommand,
+    controllers: ControllersType,
+    spectro: str | None = None,
+    last: int = 1,
+):
+    """Reports the status of the spectrograph when the shutter last moved."""
+
+    if spectro is None:
+        if len(controllers) > 1:
+            return command.fail("Multiple controllers present, SPECTRO is required.")
+        spectro = list(controllers.keys())[0]
+
+    if spectro not in controllers:
+        return command.fail(error=f"Spectrograph {spectro!r} is not available.")
+
+    recorded = list(command.actor.transitions.get(spectro, []))
+
+    return command.finish(
+        shutter_transitions=[
+            transition.to_dict() for transition in recorded[::-1][:last]
+        ]
+    )
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: status.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import functools
+
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from clu.parsers.click import CluCommand
+
+from lvmieb.actor.poller import reply_status, since_option, stream_option
+
+from .depth import read_depth
+from .hartmann import read_hartmanns
+from .shutter import read_shutter
+from .transducer import read_transducers
+from .wago import read_relays, read_sensors
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBActor, IEBCommand
+
+
+__all__ = ["status"]
+
+
+async def read_status(actor: IEBActor) -> tuple[dict[str, Any], list[str]]:
+    """Reads the status of all the devices.
+
+    Returns the keywords of all the status commands and a list of warnings.
+
+    """
+
+    fleet = actor.controllers
+    specs = list(fleet)
+
+    readers = [
+        read_sensors(actor, specs),
+        read_relays(actor, specs),
+        read_transducers(actor),
+        read_shutter(fleet, specs),
+        read_hartmanns(fleet, specs),
+    ]
+    if actor.depth_gauges is not None:
+        readers.append(read_depth(actor))
+
+    results = await asyncio.gather(*readers, return_exceptions=True)
+
+    message: dict[str, Any] = {}
+    warnings: list[str] = []
+    for result in results:
+        if isinstance(result, Exception):
+            warnings.append(f"Failed reading status: {result}")
+        else:
+            message.update(result[0])
+            warnings += result[1]
+
+    return message, warnings
+
+
+@click.command(cls=CluCommand)
+@stream_option
+@since_option
+async def status(
+    command: IEBCommand,
+    controllers: ControllersType,
+    stream: float | None = None,
+    since: str | None = None,
+):
+    """Reports the status of all the devices.
+
+    With --since, only the values that have changed since the status_token
+    TOKEN are output, with a new status_token. Use --since 0 to receive all the
+    values and a first token.
+
+    """
+
+    return await reply_status(
+        command,
+        ("status",),
+        functools.partial(read_status, command.actor),
+        stream=stream,
+        since=since,
+    )
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: stream.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from clu.parsers.click import CluGroup
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import ControllersType, IEBCommand
+
+
+__all__ = ["stream"]
+
+
+@click.group(cls=CluGroup)
+def stream(*args):
+    """Manages the status commands running with --stream."""
+
+    pass
+
+
+@stream.command(name="list")
+async def list_(command: IEBCommand, controllers: ControllersType):
+    """Lists the running streams."""
+
+    streams = command.actor.poller.streams.values()
+
+    return command.finish(streams=[stream.to_dict() for stream in streams])
+
+
+@stream.command()
+@click.argument("STREAM_ID", type=int, required=False)
+@click.option("--all", "stop_all", is_flag=True, help="Stops all the streams.")
+async def stop(
+    command: IEBCommand,
+    controllers: ControllersType,
+    stream_id: int | None = None,
+    stop_all: bool = False,
+):
+    """Stops a stream, or all of them with --all."""
+
+    poller = command.actor.poller
+
+    if stop_all:
+        stream_ids = list(poller.streams)
+    elif stream_id is not None:
+        stream_ids = [stream_id]
+    else:
+        return command.fail(error="STREAM_ID or --all are required.")
+
+    for id_ in stream_ids:
+        if not poller.stop_stream(id_):
+            return command.fail(error=f"Stream {id_} is not running.")
+
+    return command.finish()
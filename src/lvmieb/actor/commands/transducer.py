@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import functools
+import time
+
 from typing import TYPE_CHECKING
 
 import click
-import numpy
 
-from . import parser
+from clu.parsers.click import CluGroup
+
+from lvmieb.actor.poller import reply_status, since_option, stream_option
 
 
 if TYPE_CHECKING:
-    from lvmieb.actor.actor import ControllersType, IEBCommand
+    from lvmieb.actor.actor import ControllersType, IEBActor, IEBCommand
     from lvmieb.controller.controller import IEBController
 
 
@@ -42,29 +46,31 @@ async def read_transducer(
                 raise err
 
 
-@parser.group()
+@click.group(cls=CluGroup)
 def transducer(*args):
     """Reports pressure transducer values.."""
     pass
 
 
-@transducer.command()
-@click.argument("spectro", type=str, required=False)
-async def status(
-    command: IEBCommand,
-    controllers: ControllersType,
+async def read_transducers(
+    actor: IEBActor,
     spectro: str | None = None,
-):
-    """Returns the status of transducer."""
+) -> tuple[dict[str, dict[str, float]], list[str]]:
+    """Reads all the transducers and records them in the telemetry store.
+
+    The pressures are also added to the leak rate fit of each camera.
+
+    Returns the ``transducer`` keyword and a list of warnings.
+
+    """
 
     pres_result = {}
+    warnings = []
 
-    for controller_name in controllers:
+    for controller_name, controller in actor.controllers.items():
         if spectro is not None and controller_name != spectro:
             continue
 
-        controller = controllers[controller_name]
-
         # We read cameras and measurements sequentially instead of with a gather
         # to avoid too many concurrent accesses to the hardware. This could not matter
         # that much anymore, though.
@@ -74,13 +80,65 @@ async def status(
             for measurement in ["pressure", "temperature"]:
                 try:
                     if pressure_transducer.disabled:
-                        value = numpy.nan
+                        value = float("nan")
                     else:
                         value = await read_transducer(controller, cam, measurement)
                 except Exception as err:
-                    command.warning(f"Failed to read {measurement} from {cam}: {err}")
-                    value = numpy.nan
+                    warnings.append(f"Failed to read {measurement} from {cam}: {err}")
+                    value = float("nan")
 
                 pres_result[f"{cam}_{measurement}"] = value
 
-    command.finish(transducer=pres_result)
+    actor.record_telemetry(pres_result)
+    actor.leak_rates.update(pres_result, time.time())
+
+    return {"transducer": pres_result}, warnings
+
+
+@transducer.command()
+@click.argument("spectro", type=str, required=False)
+@stream_option
+@since_option
+async def status(
+    command: IEBCommand,
+    controllers: ControllersType,
+    spectro: str | None = None,
+    stream: float | None = None,
+    since: str | None = None,
+):
+    """Returns the status of transducer."""
+
+    return await reply_status(
+        command,
+        ("transducer", spectro),
+        functools.partial(read_transducers, command.actor, spectro),
+        stream=stream,
+        since=since,
+    )
+
+
+@transducer.command()
+@click.argument("spectro", type=str, required=False)
+async def leak(
+    command: IEBCommand,
+    controllers: ControllersType,
+    spectro: str | None = None,
+):
+    """Reports the leak or pump rate of each camera.
+
+    The rate is fitted to the pressures read by the status commands and the
+    telemetry publisher over the last leak_rate.window seconds.
+
+    """
+
+    if spectro is not None and spectro not in controllers:
+        return command.fail(error=f"Spectrograph {spectro!r} is not available.")
+
+    cameras = [
+        camera
+        for name, controller in controllers.items()
+        if spectro is None or name == spectro
+        for camera in controller.pressure
+    ]
+
+    return command.finish(leak_rate=command.actor.leak_rates.get_status(cameras))
@@ -7,31 +7,67 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 
 from typing import TYPE_CHECKING
 
 import click
 
-from . import parser
+from clu.parsers.click import CluGroup
+
+from lvmieb.actor.poller import reply_status, since_option, stream_option
 
 
 if TYPE_CHECKING:
-    from lvmieb.actor.actor import ControllersType, IEBCommand
+    from lvmieb.actor.actor import ControllersType, IEBActor, IEBCommand
 
 
-@parser.group()
+@click.group(cls=CluGroup)
 def wago(*args):
     """Controls the WAGO IOModule."""
     pass
 
 
+async def read_sensors(
+    actor: IEBActor,
+    spectro_list: list[str],
+) -> tuple[dict[str, dict[str, float]], list[str]]:
+    """Reads the WAGO sensors and records them in the telemetry store.
+
+    The values are also checked for anomalies (see `.IEBActor.check_anomalies`).
+
+    Returns the ``<spec>_sensors`` keywords and a list of warnings.
+
+    """
+
+    results = await actor.controllers.read_all_sensors(spectro_list)
+
+    sensors = {}
+    telemetry = {}
+    warnings = []
+    for spectro_name, result in results.items():
+        if not result.ok:
+            warnings.append(f"Failed to read {spectro_name} sensors.")
+            continue
+        sensors[f"{spectro_name}_sensors"] = result.value
+        telemetry.update({f"{spectro_name}_{k}": v for k, v in result.value.items()})
+
+    actor.record_telemetry(telemetry)
+    actor.check_anomalies(telemetry)
+
+    return sensors, warnings
+
+
 @wago.command()
 @click.argument("SPECTRO", type=str, required=False)
+@stream_option
+@since_option
 async def status(
     command: IEBCommand,
     controllers: ControllersType,
     spectro: str | None = None,
+    stream: float | None = None,
+    since: str | None = None,
 ):
     """Returns the status of WAGO sensors."""
 
@@ -41,36 +77,80 @@ async def status(
     else:
         spectro_list = [spectro]
 
-    tasks = []
-    for spectro_name in spectro_list:
+    for spectro_name in spectro_list.copy():
         if spectro_name not in controllers:
             command.warning(error=f"Spectrograph {spectro!r} is not available.")
-            continue
+            spectro_list.remove(spectro_name)
 
-        controller = controllers[spectro_name]
-        tasks.append(controller.wago.read_sensors())
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    if len(results) == 0:
+    if len(spectro_list) == 0:
         return command.fail("No data received.")
 
-    sensors = {}
-    for ii, spectro_name in enumerate(spectro_list):
-        result = results[ii]
-        if isinstance(result, Exception):
-            command.warning(f"Failed to read {spectro_name} sensors.")
+    return await reply_status(
+        command,
+        ("wago", *spectro_list),
+        functools.partial(read_sensors, command.actor, spectro_list),
+        stream=stream,
+        since=since,
+    )
+
+
+@wago.command()
+@click.argument("SPECTRO", type=str, required=False)
+async def anomalies(
+    command: IEBCommand,
+    controllers: ControllersType,
+    spectro: str | None = None,
+):
+    """Reports the rolling robust z-score of each WAGO sensor."""
+
+    detector = command.actor.anomalies
+    if detector is None:
+        return command.fail(error="Anomaly detection is not enabled.")
+
+    if spectro is not None and spectro not in controllers:
+        return command.fail(error=f"Spectrograph {spectro!r} is not available.")
+
+    channels = [
+        f"{spectro_name}_{sensor}"
+        for spectro_name, controller in controllers.items()
+        if spectro is None or spectro_name == spectro
+        for sensor in controller.wago.get_sensor_names()
+    ]
+
+    return command.finish(sensor_anomalies=detector.get_status(channels))
+
+
+async def read_relays(
+    actor: IEBActor,
+    spectro_list: list[str],
+) -> tuple[dict[str, dict[str, bool]], list[str]]:
+    """Reads the power relays.
+
+    Returns the ``<spec>_relays`` keywords and a list of warnings.
+
+    """
+
+    results = await actor.controllers.read_all_relays(spectro_list)
+
+    relays = {}
+    warnings = []
+    for spectro_name, result in results.items():
+        if not result.ok:
+            warnings.append(f"Failed to read {spectro_name} relays.")
             continue
-        sensors[f"{spectro_name}_sensors"] = result
+        relays[f"{spectro_name}_relays"] = result.value
 
-    return command.finish(**sensors)
+    return relays, warnings
 
 
 @wago.command()
 @click.argument("SPECTRO", type=str, required=False)
+@since_option
 async def getpower(
     command: IEBCommand,
     controllers: ControllersType,
     spectro: str | None = None,
+    since: str | None = None,
 ):
     """Returns the status of the power relays."""
 
@@ -80,28 +160,20 @@ async def getpower(
     else:
         spectro_list = [spectro]
 
-    tasks = []
-    for spectro_name in spectro_list:
+    for spectro_name in spectro_list.copy():
         if spectro_name not in controllers:
             command.warning(error=f"Spectrograph {spectro!r} is not available.")
-            continue
-
-        controller = controllers[spectro_name]
-        tasks.append(controller.wago.read_relays())
+            spectro_list.remove(spectro_name)
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    if len(results) == 0:
+    if len(spectro_list) == 0:
         return command.fail("No data received.")
 
-    relays = {}
-    for ii, spectro_name in enumerate(spectro_list):
-        result = results[ii]
-        if isinstance(result, Exception):
-            command.warning(f"Failed to read {spectro_name} relays.")
-            continue
-        relays[f"{spectro_name}_relays"] = result
-
-    return command.finish(**relays)
+    return await reply_status(
+        command,
+        ("relays", *spectro_list),
+        functools.partial(read_relays, command.actor, spectro_list),
+        since=since,
+    )
 
 
 @wago.command()
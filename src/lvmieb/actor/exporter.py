@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: exporter.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import math
+
+from lvmieb.controller.metrics import Histogram, MetricsRegistry, registry
+
+
+__all__ = ["PrometheusExporter"]
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escapes a label value."""
+
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: dict[str, str] | tuple[tuple[str, str], ...]) -> str:
+    """Formats a set of labels."""
+
+    items = labels.items() if isinstance(labels, dict) else labels
+    if not items:
+        return ""
+
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in items) + "}"
+
+
+def _value(value: float | int) -> str:
+    """Formats a sample value."""
+
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+
+    return repr(value)
+
+
+def _header(name: str, kind: str, description: str) -> list[str]:
+    """Returns the ``HELP`` and ``TYPE`` lines for a metric."""
+
+    return [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+
+
+def _histogram(name: str, histogram: Histogram, labels: dict[str, str]) -> list[str]:
+    """Formats the samples of a histogram. Buckets are cumulative."""
+
+    lines = []
+
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts):
+        cumulative += count
+        bucket_labels = _labels({**labels, "le": repr(bound)})
+        lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+
+    inf_labels = _labels({**labels, "le": "+Inf"})
+    lines.append(f"{name}_bucket{inf_labels} {histogram.count}")
+    lines.append(f"{name}_sum{_labels(labels)} {_value(histogram.sum)}")
+    lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+    return lines
+
+
+class PrometheusExporter:
+    """Serves the contents of a `.MetricsRegistry` in Prometheus text format.
+
+    This is a minimal HTTP server that runs in the actor event loop. It only
+    answers ``GET /metrics`` and renders values already in the registry, so
+    scraping never triggers any communication with the hardware.
+
+    Parameters
+    ----------
+    host
+        The host on which to serve the metrics.
+    port
+        The port on which to serve the metrics. If zero, a free port is used.
+    metrics
+        The registry to export. Defaults to the global registry.
+
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 9110,
+        metrics: MetricsRegistry | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.metrics = metrics or registry
+
+        self.server: asyncio.Server | None = None
+
+    async def start(self):
+        """Starts the HTTP server."""
+
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+        return self
+
+    async def stop(self):
+        """Stops the HTTP server."""
+
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    def render(self) -> str:
+        """Renders the registry in Prometheus text format."""
+
+        lines: list[str] = []
+
+        families = [
+            ("connect", "lvmieb_device_connect_seconds", "Time to connect to a device"),
+            ("request", "lvmieb_device_request_seconds", "Time to complete a request"),
+        ]
+        for attr, name, description in families:
+            lines += _header(name, "histogram", description)
+            for device, operations in self.metrics.devices.items():
+                for operation, metrics in operations.items():
+                    labels = {"device": device, "operation": operation}
+                    lines += _histogram(name, getattr(metrics, attr), labels)
+
+        counters = [
+            ("bytes_sent", "lvmieb_device_bytes_sent_total", "Bytes sent"),
+            ("bytes_received", "lvmieb_device_bytes_received_total", "Bytes read"),
+            ("timeouts", "lvmieb_device_timeouts_total", "Timed out requests"),
+            ("errors", "lvmieb_device_errors_total", "Failed requests"),
+        ]
+        for attr, name, description in counters:
+            lines += _header(name, "counter", description)
+            for device, operations in self.metrics.devices.items():
+                for operation, metrics in operations.items():
+                    labels = _labels({"device": device, "operation": operation})
+                    lines.append(f"{name}{labels} {getattr(metrics, attr)}")
+
+        name = "lvmieb_command_duration_seconds"
+        lines += _header(name, "histogram", "Duration of the actor commands")
+        for command, metrics in self.metrics.commands.items():
+            lines += _histogram(name, metrics.request, {"command": command})
+
+        name = "lvmieb_command_failures_total"
+        lines += _header(name, "counter", "Number of failed actor commands")
+        for command, metrics in self.metrics.commands.items():
+            lines.append(f"{name}{_labels({'command': command})} {metrics.errors}")
+
+        for gauge in self.metrics.gauges.values():
+            lines += _header(gauge.name, "gauge", gauge.description or gauge.name)
+            for labels, value in gauge.values.items():
+                lines.append(f"{gauge.name}{_labels(labels)} {_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handles an HTTP request."""
+
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, OSError):
+            writer.close()
+            return
+        except asyncio.LimitOverrunError:
+            request = b""
+
+        request_line = request.split(b"\r\n", 1)[0].decode(errors="replace").split()
+
+        if len(request_line) < 2 or request_line[0] not in ("GET", "HEAD"):
+            status, body = "405 Method Not Allowed", b""
+        elif request_line[1].split("?")[0] != "/metrics":
+            status, body = "404 Not Found", b""
+        else:
+            status, body = "200 OK", self.render().encode()
+
+        headers = (
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+
+        writer.write(headers.encode())
+        if request_line and request_line[0] != "HEAD":
+            writer.write(body)
+
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: monitor.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+
+from typing import Any, Callable
+
+from lvmieb.controller.metrics import Histogram, registry
+from lvmieb.exceptions import LvmIebError
+
+
+__all__ = ["LoopMonitor", "describe_callback"]
+
+
+LAG_GAUGE = registry.gauge(
+    "lvmieb_loop_lag_seconds",
+    "Last measured scheduling delay of the actor event loop",
+)
+SLOW_GAUGE = registry.gauge(
+    "lvmieb_loop_slow_callbacks",
+    "Number of event loop callbacks that exceeded the slow callback threshold",
+)
+
+
+def describe_callback(callback: Callable) -> str:
+    """Returns a human-readable description of where a callback comes from.
+
+    For task steps this is the qualified name and source location of the
+    coroutine the task is running.
+
+    """
+
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = owner.get_coro()
+        code = getattr(coro, "cr_code", None)
+        name = getattr(coro, "__qualname__", repr(coro))
+        if code is not None:
+            return f"{name} ({code.co_filename}:{code.co_firstlineno})"
+        return name
+
+    func = getattr(callback, "func", callback)  # functools.partial
+    code = getattr(func, "__code__", None)
+    name = getattr(func, "__qualname__", repr(func))
+    if code is not None:
+        return f"{name} ({code.co_filename}:{code.co_firstlineno})"
+
+    return name
+
+
+class LoopMonitor:
+    """Measures the event loop lag and detects slow callbacks.
+
+    The lag is measured by sleeping for ``interval`` seconds and comparing the
+    time at which the loop wakes us up with the expected time. A lag longer
+    than ``slow_callback`` means that a callback blocked the loop, and it is
+    recorded as a slow callback of unknown origin. The loop
+    ``slow_callback_duration`` is also set, so that if the loop runs in debug
+    mode asyncio logs the slow callbacks.
+
+    To find out which callbacks block the loop, ``time_callbacks`` wraps
+    `asyncio.Handle._run` to time each callback run by the loop. This affects
+    all the callbacks in the process, so it is meant for debugging, and only
+    one monitor can do it at a time.
+
+    Parameters
+    ----------
+    interval
+        How often to measure the loop lag, in seconds.
+    slow_callback
+        Callbacks that run for longer than this number of seconds are flagged.
+    log
+        A logger to which to report slow callbacks. If `None`, slow callbacks
+        are only recorded.
+    max_records
+        Number of slow callbacks to keep in `.slow_callbacks`.
+    time_callbacks
+        Whether to time each callback and record the origin of the slow ones.
+
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        slow_callback: float = 0.05,
+        log: Any | None = None,
+        max_records: int = 50,
+        time_callbacks: bool = False,
+    ):
+        self.interval = interval
+        self.slow_callback = slow_callback
+        self.log = log
+        self.time_callbacks = time_callbacks
+
+        self.lag = Histogram()
+        self.last_lag: float = 0.0
+
+        self.n_slow: int = 0
+        self.slow_callbacks: deque[dict[str, Any]] = deque(maxlen=max_records)
+
+        self._task: asyncio.Task | None = None
+
+        # The original and wrapped Handle._run, while patched by this monitor.
+        self._original_run: Callable | None = None
+        self._patched_run: Callable | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor is running."""
+
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Starts monitoring the running loop.
+
+        Raises `.LvmIebError` if ``time_callbacks`` is set and another monitor
+        is already timing the callbacks.
+
+        """
+
+        if self.running:
+            return self
+
+        if self.time_callbacks:
+            self._patch_handle()
+
+        loop = asyncio.get_running_loop()
+        loop.slow_callback_duration = self.slow_callback
+
+        self._task = loop.create_task(self._measure_lag())
+
+        return self
+
+    async def stop(self):
+        """Stops the monitor."""
+
+        self._unpatch_handle()
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns a summary of the loop health."""
+
+        return {
+            "lag": {"last": round(self.last_lag, 6), **self.lag.to_dict()},
+            "slow_callback_threshold": self.slow_callback,
+            "n_slow_callbacks": self.n_slow,
+            "slow_callbacks": list(self.slow_callbacks),
+        }
+
+    def record_slow_callback(self, callback: Callable | None, duration: float):
+        """Records a callback that took longer than the threshold.
+
+        ``callback`` is `None` if the callback is not known.
+
+        """
+
+        origin = "unknown" if callback is None else describe_callback(callback)
+
+        self.n_slow += 1
+        SLOW_GAUGE.set(self.n_slow)
+
+        self.slow_callbacks.append(
+            {
+                "time": round(time.time(), 3),
+                "duration": round(duration, 6),
+                "origin": origin,
+            }
+        )
+
+        if self.log is not None:
+            self.log.warning(
+                f"Slow callback {origin} blocked the event loop for {duration:.3f} s."
+            )
+
+    async def _measure_lag(self):
+        """Continuously measures the scheduling delay."""
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+
+            self.last_lag = max(loop.time() - start - self.interval, 0.0)
+            self.lag.observe(self.last_lag)
+            LAG_GAUGE.set(self.last_lag)
+
+            # When timing the callbacks, the callback is recorded with its origin.
+            if self._patched_run is None and self.last_lag > self.slow_callback:
+                self.record_slow_callback(None, self.last_lag)
+
+    def _patch_handle(self):
+        """Wraps `asyncio.Handle._run` to time each callback."""
+
+        original_run = asyncio.events.Handle._run
+        if getattr(original_run, "_loop_monitor", None) is not None:
+            raise LvmIebError("Another loop monitor is already timing callbacks.")
+
+        perf_counter = time.perf_counter
+        monitor = self
+
+        def _run(handle: asyncio.Handle):
+            start = perf_counter()
+            original_run(handle)
+            duration = perf_counter() - start
+
+            if duration > monitor.slow_callback:
+                monitor.record_slow_callback(handle._callback, duration)  # type: ignore
+
+        _run._loop_monitor = self  # type: ignore
+
+        self._original_run = original_run
+        self._patched_run = _run
+
+        asyncio.events.Handle._run = _run  # type: ignore
+
+    def _unpatch_handle(self):
+        """Restores the original `asyncio.Handle._run`, if patched by this monitor."""
+
+        if self._patched_run is None:
+            return
+
+        # Only restore it if nothing else has replaced our wrapper since.
+        if asyncio.events.Handle._run is self._patched_run:
+            asyncio.events.Handle._run = self._original_run  # type: ignore
+
+        self._original_run = None
+        self._patched_run = None
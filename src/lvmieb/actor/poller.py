@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: poller.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+)
+
+import click
+
+from lvmieb.controller.metrics import registry
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBCommand
+    from lvmieb.actor.snapshot import Snapshot
+
+
+__all__ = ["Poller", "Stream", "reply_status", "stream_option", "since_option"]
+
+
+Reader = Callable[[], Awaitable[Any]]
+
+
+POLL_LAG_GAUGE = registry.gauge(
+    "lvmieb_poll_lag_seconds",
+    "Delay of the last read of a polled source with respect to its schedule",
+)
+
+
+#: Option added to the status commands to stream the status.
+stream_option = click.option(
+    "--stream",
+    type=click.FloatRange(0, min_open=True),
+    metavar="INTERVAL",
+    help="Output the status every INTERVAL seconds until the command is stopped.",
+)
+
+#: Option added to the status commands to only output what changed since a token.
+since_option = click.option(
+    "--since",
+    type=str,
+    metavar="TOKEN",
+    help="Only output the values that changed since the status_token TOKEN.",
+)
+
+
+class _Subscriber:
+    """A consumer of the values read from a source."""
+
+    __slots__ = ("interval", "queue", "last")
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self.last = 0.0
+
+    def deliver(self, value: Any, now: float):
+        """Delivers a value, if enough time has passed since the last one."""
+
+        # Allow some slack so that a subscriber at the same interval as the
+        # source does not skip every other reading due to jitter.
+        if now - self.last < self.interval * 0.9:
+            return
+
+        self.last = now
+
+        # If the consumer has not picked up the previous value, replace it.
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(value)
+
+
+class _Source:
+    """A periodically read source of values shared by several subscribers.
+
+    How late each read starts with respect to its schedule (one interval after
+    the previous read) is recorded in the ``lvmieb_poll_lag_seconds`` gauge,
+    labelled with the ``name`` of the source.
+
+    """
+
+    def __init__(self, reader: Reader, name: str = ""):
+        self.reader = reader
+        self.name = name
+        self.subscribers: list[_Subscriber] = []
+        self.task: asyncio.Task | None = None
+
+    @property
+    def interval(self) -> float:
+        """The polling interval, the shortest of the subscribers."""
+
+        return min(subscriber.interval for subscriber in self.subscribers)
+
+    async def run(self):
+        """Reads the source and delivers the values to the subscribers."""
+
+        loop = asyncio.get_running_loop()
+        due = loop.time()
+
+        try:
+            while len(self.subscribers) > 0:
+                POLL_LAG_GAUGE.set(max(loop.time() - due, 0.0), source=self.name)
+
+                try:
+                    value = await self.reader()
+                except Exception as err:
+                    value = err
+
+                now = loop.time()
+                for subscriber in self.subscribers:
+                    subscriber.deliver(value, now)
+
+                due = now + self.interval
+                await asyncio.sleep(self.interval)
+        finally:
+            POLL_LAG_GAUGE.remove(source=self.name)
+
+
+class Stream:
+    """A streaming command.
+
+    Parameters
+    ----------
+    id
+        The unique identifier of the stream.
+    command
+        The command that is streaming.
+    interval
+        The interval between replies, in seconds.
+    task
+        The task running the command, which is cancelled to stop the stream.
+
+    """
+
+    def __init__(
+        self,
+        id: int,
+        command: IEBCommand,
+        interval: float,
+        task: asyncio.Task | None,
+    ):
+        self.id = id
+        self.command = command
+        self.interval = interval
+        self.task = task
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns a description of the stream."""
+
+        return {
+            "id": self.id,
+            "command": self.command.raw_command_string,
+            "interval": self.interval,
+        }
+
+
+class Poller:
+    """Polls the devices on behalf of any number of subscribers.
+
+    Each source of values is identified by a key (for example
+    ``("shutter", "sp1")``) and read by a single task, at the shortest interval
+    requested by its subscribers. Subscribers that requested a longer interval
+    receive only some of the values. The task stops when the last subscriber
+    is gone. This way several clients streaming the same status cost a single
+    set of requests to the hardware.
+
+    """
+
+    def __init__(self):
+        self.sources: dict[Hashable, _Source] = {}
+        self.streams: dict[int, Stream] = {}
+
+        self._stream_id = itertools.count(1)
+
+    async def subscribe(
+        self,
+        key: Hashable,
+        reader: Reader,
+        interval: float,
+    ) -> AsyncIterator[Any]:
+        """Yields the values of a source every ``interval`` seconds.
+
+        If the reader raises an exception, the exception is yielded instead of
+        a value. The subscription is cancelled when the iteration stops.
+
+        Parameters
+        ----------
+        key
+            The key that identifies the source. Subscriptions with the same key
+            share the source.
+        reader
+            A coroutine function that reads the source. It is only used if the
+            source does not exist already.
+        interval
+            The interval between values, in seconds.
+
+        """
+
+        source = self.sources.get(key, None)
+        if source is None:
+            name = " ".join(map(str, key)) if isinstance(key, tuple) else str(key)
+            source = self.sources[key] = _Source(reader, name=name)
+
+        subscriber = _Subscriber(interval)
+        source.subscribers.append(subscriber)
+
+        if source.task is None or source.task.done():
+            source.task = asyncio.create_task(source.run())
+
+        try:
+            while True:
+                yield await subscriber.queue.get()
+        finally:
+            source.subscribers.remove(subscriber)
+            if len(source.subscribers) == 0:
+                if source.task is not None:
+                    source.task.cancel()
+                if self.sources.get(key, None) is source:
+                    self.sources.pop(key)
+
+    async def stream(
+        self,
+        command: IEBCommand,
+        key: Hashable,
+        reader: Reader,
+        interval: float,
+    ) -> AsyncIterator[Any]:
+        """Subscribes to a source on behalf of a command.
+
+        As `.subscribe`, but registers the command as a `.Stream` that can be
+        listed and stopped. The command is informed of its stream identifier
+        with the ``stream`` keyword.
+
+        """
+
+        task = asyncio.current_task()
+        stream = Stream(next(self._stream_id), command, interval, task)
+        self.streams[stream.id] = stream
+
+        command.info(stream=stream.to_dict())
+
+        try:
+            async for value in self.subscribe(key, reader, interval):
+                yield value
+        finally:
+            self.streams.pop(stream.id, None)
+
+    def stop_stream(self, stream_id: int) -> bool:
+        """Stops a stream. Returns `False` if the stream does not exist."""
+
+        stream = self.streams.get(stream_id, None)
+        if stream is None or stream.task is None:
+            return False
+
+        stream.task.cancel()
+
+        return True
+
+    async def stop(self):
+        """Stops all the streams and sources."""
+
+        for stream in list(self.streams.values()):
+            if stream.task is not None:
+                stream.task.cancel()
+
+        for source in list(self.sources.values()):
+            if source.task is not None:
+                source.task.cancel()
+
+        self.streams.clear()
+        self.sources.clear()
+
+
+async def reply_status(
+    command: IEBCommand,
+    key: Hashable,
+    reader: Callable[[], Awaitable[tuple[dict[str, Any], list[str]]]],
+    stream: float | None = None,
+    split: bool = False,
+    since: str | None = None,
+):
+    """Replies to a status command, either once or streaming.
+
+    The values read are recorded in the actor `.Snapshot` and checked against
+    the alarm rules (see `.IEBActor.check_alarms`). When not streaming and
+    ``since`` is set, only the values that have changed are output and the
+    command finishes with a ``status_token`` keyword that can be passed back as
+    ``since`` in the next call. An invalid token (for example ``0``) returns all
+    the values and a new token. Without ``since`` the replies are unchanged.
+
+    Parameters
+    ----------
+    command
+        The command to which to reply.
+    key
+        The key of the source in the actor `.Poller`.
+    reader
+        A coroutine function that returns the message with the status keywords
+        and a list of warnings.
+    stream
+        If `None`, the reader is called once and the command finishes with the
+        message. Otherwise, the message is output every ``stream`` seconds
+        until the command is cancelled.
+    split
+        Output each keyword in a separate reply.
+    since
+        A token from a previous reply. If set, only the keywords and fields
+        that have changed since are output.
+
+    """
+
+    snapshot: Snapshot = command.actor.snapshot
+
+    def output(message: dict[str, Any], warnings: list[str]):
+        for warning in warnings:
+            command.warning(warning)
+
+        if split:
+            for keyword, value in message.items():
+                command.info({keyword: value})
+        elif stream is not None:
+            command.info(message)
+
+    if stream is None:
+        try:
+            message, warnings = await reader()
+        except Exception as err:
+            return command.fail(error=err)
+
+        token = snapshot.update(message)
+        command.actor.check_alarms(message)
+        if since is not None:
+            message = snapshot.delta(since, keywords=message.keys())
+
+        output(message, warnings)
+
+        # Only output the token if the client is asking for deltas, so that the
+        # replies of the clients and commands that do not use it are not affected.
+        if since is None:
+            return command.finish() if split else command.finish(message)
+        elif split:
+            return command.finish(status_token=token)
+        else:
+            return command.finish(message, status_token=token)
+
+    poller: Poller = command.actor.poller
+    async for reading in poller.stream(command, key, reader, stream):
+        if isinstance(reading, Exception):
+            command.warning(error=str(reading))
+        else:
+            snapshot.update(reading[0])
+            command.actor.check_alarms(reading[0])
+            output(*reading)
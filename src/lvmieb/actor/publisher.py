@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: publisher.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import functools
+
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Mapping
+
+from lvmieb.telemetry import AdaptiveInterval, DeadbandFilter
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+
+__all__ = ["TelemetryPublisher"]
+
+
+Reader = Callable[[], Awaitable[tuple[dict[str, dict[str, Any]], list[str]]]]
+
+
+class TelemetryPublisher:
+    """Periodically reads the sensors and broadcasts the values that changed.
+
+    Each sweep reads the WAGO sensors of all the spectrographs, the pressure
+    transducers, and the depth gauges, records the values in the telemetry
+    store, and broadcasts the ``<spec>_sensors``, ``transducer``, and
+    ``depth`` keywords in which any field is outside its deadband. Keywords
+    are always broadcast complete, as the status commands output them.
+
+    Parameters
+    ----------
+    actor
+        The actor that owns the devices and broadcasts the keywords.
+    interval
+        Seconds between sweeps.
+    deadband
+        The `.DeadbandFilter` used to decide which values to publish. Defaults
+        to publishing any change.
+    adaptive
+        If set, a mapping of subsystem (``wago``, ``pressure``, or ``depth``) to
+        the minimum and maximum polling intervals. Instead of sweeping every
+        ``interval`` seconds, the WAGO sensors and transducers of each
+        spectrograph, and the depth gauges, are then polled independently, at
+        an interval that follows how fast their values are changing (see
+        `.AdaptiveInterval`) relative to their deadband. Subsystems that are
+        not included use ``interval`` as both bounds.
+
+    """
+
+    def __init__(
+        self,
+        actor: IEBActor,
+        interval: float = 10,
+        deadband: DeadbandFilter | None = None,
+        adaptive: Mapping[str, tuple[float, float]] | None = None,
+    ):
+        self.actor = actor
+        self.interval = interval
+        self.deadband = deadband or DeadbandFilter()
+        self.adaptive = adaptive
+
+        # The last known value of each field of the published keywords.
+        self.values: dict[str, dict[str, Any]] = {}
+
+        # The adaptive interval of each source, keyed by (subsystem, spec).
+        self.intervals: dict[tuple[str, str | None], AdaptiveInterval] = {}
+
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the publisher is running."""
+
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Starts publishing."""
+
+        if not self.running:
+            run = self._run if self.adaptive is None else self._run_adaptive
+            self._task = asyncio.create_task(run())
+
+        return self
+
+    async def stop(self):
+        """Stops publishing."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_sources(self) -> dict[tuple[str, str | None], Reader]:
+        """Returns the readers of each subsystem, keyed by (subsystem, spec)."""
+
+        # Imported here to keep the command modules lazily loaded.
+        from lvmieb.actor.commands.depth import read_depth
+        from lvmieb.actor.commands.transducer import read_transducers
+        from lvmieb.actor.commands.wago import read_sensors
+
+        actor = self.actor
+
+        sources: dict[tuple[str, str | None], Reader] = {}
+        for spec in actor.controllers:
+            sources[("wago", spec)] = functools.partial(read_sensors, actor, [spec])
+            sources[("pressure", spec)] = functools.partial(
+                read_transducers,
+                actor,
+                spec,
+            )
+        if actor.depth_gauges is not None:
+            sources[("depth", None)] = functools.partial(read_depth, actor)
+
+        return sources
+
+    async def _read(self, reader: Reader) -> dict[str, dict[str, Any]]:
+        """Runs a reader, logging the warnings and errors."""
+
+        try:
+            keywords, warnings = await reader()
+        except Exception as err:
+            self.actor.log.warning(f"Failed reading telemetry: {err}")
+            return {}
+
+        for warning in warnings:
+            self.actor.log.warning(warning)
+
+        return keywords
+
+    async def sweep(self) -> dict[str, dict[str, Any]]:
+        """Reads all the sensors and records them in the telemetry store.
+
+        Returns
+        -------
+        message
+            The full keywords, as the status commands would return them.
+
+        """
+
+        # Imported here to keep the command modules lazily loaded.
+        from lvmieb.actor.commands.depth import read_depth
+        from lvmieb.actor.commands.transducer import read_transducers
+        from lvmieb.actor.commands.wago import read_sensors
+
+        actor = self.actor
+
+        readers = [
+            functools.partial(read_sensors, actor, list(actor.controllers)),
+            functools.partial(read_transducers, actor),
+        ]
+        if actor.depth_gauges is not None:
+            readers.append(functools.partial(read_depth, actor))
+
+        message: dict[str, dict[str, Any]] = {}
+        for reader in readers:
+            message.update(await self._read(reader))
+
+        return message
+
+    async def publish(
+        self,
+        message: dict[str, dict[str, Any]] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Broadcasts the keywords that changed significantly.
+
+        The keywords in the message are merged with the last known values,
+        so that a keyword read in parts (for example the ``transducer`` keyword
+        when each spectrograph is polled independently) is broadcast complete.
+        The values in the message also update the actor `.Snapshot`, and the
+        alarm rules are evaluated on them.
+
+        Parameters
+        ----------
+        message
+            The keywords to publish. If `None`, runs a sweep.
+
+        Returns
+        -------
+        published
+            The keywords that were broadcast.
+
+        """
+
+        if message is None:
+            message = await self.sweep()
+
+        # Keep the actor snapshot current, for example for the shutter transitions.
+        self.actor.snapshot.update(message)
+        self.actor.check_alarms(message)
+
+        for keyword, fields in message.items():
+            self.values.setdefault(keyword, {}).update(fields)
+
+        changed = self.deadband.filter(
+            {keyword: self.values[keyword].copy() for keyword in message}
+        )
+        if len(changed) > 0:
+            self.actor.write("i", message=changed)
+
+        return changed
+
+    async def _run(self):
+        """Publishes periodically."""
+
+        while True:
+            try:
+                await self.publish()
+            except Exception as err:
+                self.actor.log.warning(f"Failed publishing telemetry: {err}")
+
+            await asyncio.sleep(self.interval)
+
+    def get_resolution(self, name: str, value: float) -> float:
+        """Returns the deadband of a ``<keyword>.<field>`` for a value."""
+
+        deadband = self.deadband.get_deadband(name)
+
+        return max(deadband.absolute, deadband.relative * abs(value))
+
+    def get_adaptive_interval(
+        self,
+        subsystem: str,
+        spec: str | None,
+    ) -> AdaptiveInterval:
+        """Returns the `.AdaptiveInterval` for a source, creating it if needed."""
+
+        key = (subsystem, spec)
+        if key not in self.intervals:
+            assert self.adaptive is not None
+            bounds = self.adaptive.get(subsystem, (self.interval, self.interval))
+            self.intervals[key] = AdaptiveInterval(*bounds)
+
+        return self.intervals[key]
+
+    async def poll(
+        self,
+        subsystem: str,
+        spec: str | None,
+        reader: Reader,
+    ) -> dict[str, dict[str, Any]]:
+        """Reads a source and updates its adaptive interval.
+
+        Returns the keywords read, as the status commands would return them.
+
+        """
+
+        message = await self._read(reader)
+
+        values = {
+            f"{keyword}.{field}": value
+            for keyword, fields in message.items()
+            for field, value in fields.items()
+        }
+
+        loop = asyncio.get_running_loop()
+        adaptive_interval = self.get_adaptive_interval(subsystem, spec)
+        adaptive_interval.update(values, loop.time(), self.get_resolution)
+
+        return message
+
+    async def _run_adaptive(self):
+        """Polls each source at its adaptive interval and publishes the changes."""
+
+        loop = asyncio.get_running_loop()
+
+        sources = self.get_sources()
+        if len(sources) == 0:
+            return
+
+        due = {key: loop.time() for key in sources}
+
+        while True:
+            now = loop.time()
+            ready = [key for key, due_time in due.items() if due_time <= now]
+
+            try:
+                results = await asyncio.gather(
+                    *[self.poll(*key, sources[key]) for key in ready]
+                )
+
+                # The transducer keyword is split between the spectrographs.
+                message: dict[str, dict[str, Any]] = {}
+                for result in results:
+                    for keyword, fields in result.items():
+                        message.setdefault(keyword, {}).update(fields)
+
+                await self.publish(message)
+            except Exception as err:
+                self.actor.log.warning(f"Failed publishing telemetry: {err}")
+
+            now = loop.time()
+            for key in ready:
+                due[key] = now + self.get_adaptive_interval(*key).interval
+
+            await asyncio.sleep(max(min(due.values()) - loop.time(), 0))
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: snapshot.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import copy
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from typing import Any, Iterable, Mapping
+
+
+__all__ = ["Snapshot", "ShutterTransition"]
+
+
+def _equal(value: Any, other: Any) -> bool:
+    """Compares two values, considering NaNs equal."""
+
+    if isinstance(value, float) and isinstance(other, float):
+        if math.isnan(value) and math.isnan(other):
+            return True
+
+    return value == other
+
+
+class Snapshot:
+    """The last known value of each status keyword, with change tracking.
+
+    Every time a field of a keyword changes the snapshot version is increased
+    and the field is tagged with it. A token encodes the version of the
+    snapshot at a given time; `.delta` uses it to return only the fields that
+    have changed since. Tokens from a different actor instance (for example
+    after a restart) are not valid and result in the full values.
+
+    """
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:8]
+        self.version = 0
+
+        # Indexed by keyword and field. Keywords whose value is not a mapping
+        # are stored with field None.
+        self.values: dict[str, dict[str | None, Any]] = {}
+        self.versions: dict[str, dict[str | None, int]] = {}
+
+        # UNIX time at which each keyword was last updated.
+        self.times: dict[str, float] = {}
+
+    @property
+    def token(self) -> str:
+        """The token for the current version of the snapshot."""
+
+        return f"{self.epoch}-{self.version}"
+
+    def parse_token(self, token: str | None) -> int | None:
+        """Returns the version for a token, or `None` if the token is not valid."""
+
+        if token is None:
+            return None
+
+        epoch, _, version = token.partition("-")
+        if epoch != self.epoch or not version.isdigit():
+            return None
+
+        if int(version) > self.version:
+            return None
+
+        return int(version)
+
+    def update(self, message: dict[str, Any]) -> str:
+        """Updates the snapshot with a message. Returns the new token."""
+
+        changed = False
+        now = time.time()
+
+        for keyword, value in message.items():
+            self.times[keyword] = now
+
+            fields = value if isinstance(value, dict) else {None: value}
+
+            values = self.values.setdefault(keyword, {})
+            versions = self.versions.setdefault(keyword, {})
+
+            for field, field_value in fields.items():
+                if field in values and _equal(values[field], field_value):
+                    continue
+
+                if not changed:
+                    self.version += 1
+                    changed = True
+
+                values[field] = field_value
+                versions[field] = self.version
+
+        return self.token
+
+    def delta(
+        self,
+        token: str | None,
+        keywords: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Returns the keywords and fields that changed since a token.
+
+        Parameters
+        ----------
+        token
+            The token returned by an earlier `.update` or `.token`. If `None`
+            or not valid, all the values are returned.
+        keywords
+            The keywords to consider. Defaults to all of them.
+
+        """
+
+        since = self.parse_token(token)
+        since = -1 if since is None else since
+
+        keywords = self.values.keys() if keywords is None else keywords
+
+        delta: dict[str, Any] = {}
+        for keyword in keywords:
+            if keyword not in self.values:
+                continue
+
+            values = self.values[keyword]
+            versions = self.versions[keyword]
+
+            if None in values:
+                if versions[None] > since:
+                    delta[keyword] = values[None]
+                continue
+
+            changed = {
+                field: value
+                for field, value in values.items()
+                if versions[field] > since
+            }
+            if len(changed) > 0:
+                delta[keyword] = changed
+
+        return delta
+
+    def get(self, keywords: Iterable[str]) -> dict[str, Any]:
+        """Returns a copy of the last known values of some keywords.
+
+        Keywords that have never been output are not included.
+
+        """
+
+        values: dict[str, Any] = {}
+        for keyword in keywords:
+            if keyword not in self.values:
+                continue
+
+            fields = self.values[keyword]
+            if None in fields:
+                values[keyword] = copy.deepcopy(fields[None])
+            else:
+                values[keyword] = copy.deepcopy(fields)
+
+        return values
+
+
+@dataclass(frozen=True)
+class ShutterTransition:
+    """The last known status of a spectrograph when its shutter moved.
+
+    Parameters
+    ----------
+    spec
+        The spectrograph.
+    time
+        The UNIX time at which the shutter completed the move.
+    position
+        The new position of the shutter, ``open`` or ``closed``.
+    values
+        The last known value of the status keywords of the spectrograph (WAGO
+        sensors and relays, transducers, Hartmann doors, and depth gauges).
+    updated
+        The UNIX time at which each keyword in ``values`` was last updated.
+
+    """
+
+    spec: str
+    time: float
+    position: str
+    values: Mapping[str, Any]
+    updated: Mapping[str, float]
+
+    def __post_init__(self):
+        object.__setattr__(self, "values", MappingProxyType(dict(self.values)))
+        object.__setattr__(self, "updated", MappingProxyType(dict(self.updated)))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the transition as a dictionary that can be output."""
+
+        return {
+            "spec": self.spec,
+            "time": round(self.time, 3),
+            "position": self.position,
+            "values": copy.deepcopy(dict(self.values)),
+            "updated": {key: round(value, 3) for key, value in self.updated.items()},
+        }
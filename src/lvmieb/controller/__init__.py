@@ -1,5 +1,6 @@
 # encoding: utf-8
 
-__all__ = ["IEBController"]
+__all__ = ["IEBController", "ControllerSnapshot", "IEBFleet"]
 
-from .controller import IEBController
+from .controller import ControllerSnapshot, IEBController
+from .fleet import IEBFleet
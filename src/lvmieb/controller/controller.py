@@ -3,9 +3,60 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from typing import AsyncIterator, Sequence
+
+from lvmieb.controller.maskbits import MotorStatus
 from lvmieb.controller.motor import MotorController
 from lvmieb.controller.pressure import PressureTransducer
 from lvmieb.controller.wago import IEBWAGO
+from lvmieb.exceptions import LvmIebError
+
+
+__all__ = ["IEBController", "ControllerSnapshot", "SUBSYSTEMS"]
+
+
+#: The subsystems that can be read with `.IEBController.watch`.
+SUBSYSTEMS = ("sensors", "relays", "pressure", "motors")
+
+
+@dataclass
+class ControllerSnapshot:
+    """The status of the devices in an IEB at a given time.
+
+    Subsystems that were not requested are `None`. Reads that failed are
+    missing from their subsystem and the exception is stored in ``errors``,
+    keyed by the subsystem or ``<subsystem>.<device>``.
+
+    Parameters
+    ----------
+    spec
+        The spectrograph.
+    time
+        The UNIX time at which the reads started.
+    sensors
+        The WAGO temperature and humidity sensors.
+    relays
+        The WAGO power relays, `True` if closed.
+    pressure
+        The pressure and temperature of each transducer, keyed by camera.
+    motors
+        The status and proximity sensor bits of each motor controller.
+    errors
+        Exceptions raised while reading.
+
+    """
+
+    spec: str
+    time: float
+    sensors: dict[str, float] | None = None
+    relays: dict[str, bool] | None = None
+    pressure: dict[str, dict[str, float]] | None = None
+    motors: dict[str, tuple[MotorStatus, str | None]] | None = None
+    errors: dict[str, Exception] = field(default_factory=dict)
 
 
 class IEBController:
@@ -29,6 +80,130 @@ class IEBController:
         self.pressure = {p.camera: p for p in pressure}
         self.motors = {m.type: m for m in motors}
 
+    async def probe(self, timeout: float = 1) -> dict[str, bool]:
+        """Concurrently checks the connectivity to all the devices.
+
+        Parameters
+        ----------
+        timeout
+            The connection timeout for each device.
+
+        Returns
+        -------
+        readiness
+            A mapping of device name (``wago``, the motor type, or the camera
+            of the pressure transducer) to whether the device is reachable.
+            Disabled transducers are not probed.
+
+        """
+
+        devices = {"wago": self.wago, **self.motors}
+        for camera, transducer in self.pressure.items():
+            if not transducer.disabled:
+                devices[camera] = transducer
+
+        results = await asyncio.gather(
+            *[device.probe(timeout=timeout) for device in devices.values()]
+        )
+
+        return dict(zip(devices, results))
+
+    async def _read_transducer(self, camera: str) -> dict[str, float]:
+        """Reads the pressure and temperature of a transducer."""
+
+        transducer = self.pressure[camera]
+
+        # The two measurements go to the same device so we read them in series.
+        return {
+            "pressure": await transducer.read_pressure(),
+            "temperature": await transducer.read_temperature(),
+        }
+
+    async def read_snapshot(
+        self,
+        subsystems: Sequence[str] = SUBSYSTEMS,
+    ) -> ControllerSnapshot:
+        """Reads the status of several subsystems concurrently.
+
+        Parameters
+        ----------
+        subsystems
+            The subsystems to read. See `.SUBSYSTEMS`.
+
+        Returns
+        -------
+        snapshot
+            A `.ControllerSnapshot` with the status of the subsystems.
+
+        """
+
+        for subsystem in subsystems:
+            if subsystem not in SUBSYSTEMS:
+                raise LvmIebError(f"Invalid subsystem {subsystem!r}.")
+
+        snapshot = ControllerSnapshot(spec=self.spec, time=time.time())
+
+        # Each read is identified by (subsystem, device or None).
+        reads = {}
+        if "sensors" in subsystems:
+            reads[("sensors", None)] = self.wago.read_sensors()
+        if "relays" in subsystems:
+            reads[("relays", None)] = self.wago.read_relays()
+        if "pressure" in subsystems:
+            snapshot.pressure = {}
+            for camera, transducer in self.pressure.items():
+                if not transducer.disabled:
+                    reads[("pressure", camera)] = self._read_transducer(camera)
+        if "motors" in subsystems:
+            snapshot.motors = {}
+            for motor_type, motor in self.motors.items():
+                reads[("motors", motor_type)] = motor.get_status()
+
+        results = await asyncio.gather(*reads.values(), return_exceptions=True)
+
+        for (subsystem, device), result in zip(reads, results):
+            if isinstance(result, Exception):
+                name = subsystem if device is None else f"{subsystem}.{device}"
+                snapshot.errors[name] = result
+            elif device is None:
+                setattr(snapshot, subsystem, result)
+            else:
+                getattr(snapshot, subsystem)[device] = result
+
+        return snapshot
+
+    async def watch(
+        self,
+        subsystems: Sequence[str] = SUBSYSTEMS,
+        interval: float = 5.0,
+    ) -> AsyncIterator[ControllerSnapshot]:
+        """Periodically yields the status of the devices.
+
+        The subsystems are read concurrently (see `.read_snapshot`). Snapshots
+        are yielded at a fixed rate; if reading or processing a snapshot takes
+        longer than ``interval`` the next one is read immediately. ::
+
+            async for snapshot in controller.watch(["sensors", "motors"], 10):
+                print(snapshot.time, snapshot.sensors["t1"])
+
+        Parameters
+        ----------
+        subsystems
+            The subsystems to read. See `.SUBSYSTEMS`.
+        interval
+            The time between snapshots, in seconds.
+
+        """
+
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+
+        while True:
+            yield await self.read_snapshot(subsystems)
+
+            next_time = max(next_time + interval, loop.time())
+            await asyncio.sleep(next_time - loop.time())
+
     @classmethod
     def from_config(cls, spec: str, config: dict, wago_modules: dict = {}):
         """Creates an instance of `.IEBController` from a configuration file."""
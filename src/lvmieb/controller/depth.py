@@ -6,10 +6,22 @@ from __future__ import annotations
 import asyncio
 import re
 
+from lvmieb.controller.metrics import registry
+from lvmieb.controller.tools import check_connection
+
 
 __all__ = ["DepthGauges"]
 
 
+DEPTH_GAUGE = registry.gauge(
+    "lvmieb_depth",
+    "Last value, in mm, read from a depth gauge channel",
+)
+
+# Reply to a SEND command, with the channel and the value.
+REPLY_PATTERN = re.compile(rb"\r?(\S+) ([+\-0-9\.]+) mm")
+
+
 class DepthGauges:
     """Reads the value of Heidenhain depth gauges."""
 
@@ -18,30 +30,45 @@ class DepthGauges:
         self.port = port
         self.camera = camera
 
+    async def probe(self, timeout: float = 1) -> bool:
+        """Checks whether the depth gauge server accepts connections."""
+
+        return await check_connection(self.host, self.port, timeout=timeout)
+
     async def read(self):
         """Returns the measured values from the depth probes."""
 
         depth = {"A": -999.0, "B": -999.0, "C": -999.0}
 
         for channel in depth:
-            w = None
-            try:
-                conn = asyncio.open_connection(self.host, self.port)
-                r, w = await asyncio.wait_for(conn, 1)
-                w.write(("SEND " + channel + "\n").encode())
-                await w.drain()
-                reply = await asyncio.wait_for(r.readline(), 1)
-            except Exception:
-                raise ValueError("Failed retrieving data from depth probes.")
-            finally:
-                if w is not None:
-                    w.close()
-                    await w.wait_closed()
-
-            match = re.match(f"\r?{channel} ([+\\-0-9\\.]+) mm".encode(), reply)
-            if match:
-                depth[channel] = float(match.group(1).decode())
+            with registry.track("depth", "read") as tracker:
+                w = None
+                try:
+                    conn = asyncio.open_connection(self.host, self.port)
+                    r, w = await asyncio.wait_for(conn, 1)
+                    tracker.connected()
+
+                    message = ("SEND " + channel + "\n").encode()
+                    w.write(message)
+                    await w.drain()
+                    tracker.sent(len(message), message)
+
+                    reply = await asyncio.wait_for(r.readline(), 1)
+                    tracker.received(len(reply), reply)
+                except Exception:
+                    raise ValueError("Failed retrieving data from depth probes.")
+                finally:
+                    if w is not None:
+                        w.close()
+                        await w.wait_closed()
+
+            match = REPLY_PATTERN.match(reply)
+            if match and match.group(1).decode() == channel:
+                depth[channel] = float(match.group(2).decode())
             else:
                 raise ValueError(f"Failed parsing depth probe for channel {channel}")
 
+        for channel, value in depth.items():
+            DEPTH_GAUGE.set(value, channel=channel)
+
         return depth
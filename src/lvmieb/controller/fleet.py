@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: fleet.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    Sequence,
+    TypeVar,
+)
+
+from lvmieb.controller.controller import IEBController
+from lvmieb.controller.maskbits import MotorStatus
+from lvmieb.controller.motor import MotorController
+from lvmieb.exceptions import LvmIebError
+
+
+__all__ = ["IEBFleet", "FleetResult", "FleetResults"]
+
+
+T = TypeVar("T")
+
+
+class FleetResult(Generic[T]):
+    """The result of an operation on one spectrograph.
+
+    Parameters
+    ----------
+    spec
+        The spectrograph.
+    value
+        The value returned by the operation, if it succeeded.
+    error
+        The exception raised by the operation, if it failed.
+    elapsed
+        The time, in seconds, that the operation took.
+
+    """
+
+    __slots__ = ("spec", "value", "error", "elapsed")
+
+    def __init__(
+        self,
+        spec: str,
+        value: T | None = None,
+        error: Exception | None = None,
+        elapsed: float = 0.0,
+    ):
+        self.spec = spec
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        status = f"error={self.error!r}" if self.error else f"value={self.value!r}"
+        return f"<FleetResult {self.spec} ({status}, elapsed={self.elapsed:.3f})>"
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+
+        return self.error is None
+
+
+class FleetResults(dict[str, FleetResult[T]], Generic[T]):
+    """The results of an operation on several spectrographs, keyed by spec."""
+
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded in all the spectrographs."""
+
+        return all(result.ok for result in self.values())
+
+    @property
+    def succeeded(self) -> dict[str, T]:
+        """The values of the operations that succeeded."""
+
+        return {spec: r.value for spec, r in self.items() if r.ok}  # type: ignore
+
+    @property
+    def failed(self) -> dict[str, Exception]:
+        """The exceptions of the operations that failed."""
+
+        return {spec: r.error for spec, r in self.items() if r.error is not None}
+
+
+class IEBFleet(MutableMapping[str, IEBController]):
+    """A collection of `.IEBController` with batched operations.
+
+    The fleet behaves as a mapping of spectrograph name to controller. Batched
+    operations run concurrently on the selected spectrographs, with at most
+    ``max_concurrency`` of them at the same time, and return a `.FleetResults`
+    with the value or error, and the time taken, for each spectrograph. Batched
+    operations do not raise if one of the spectrographs fails.
+
+    Parameters
+    ----------
+    controllers
+        The controllers in the fleet.
+    max_concurrency
+        The maximum number of spectrographs to operate on at the same time.
+        If `None`, there is no limit.
+
+    """
+
+    def __init__(
+        self,
+        controllers: Iterable[IEBController] = (),
+        max_concurrency: int | None = 8,
+    ):
+        self.controllers = {controller.spec: controller for controller in controllers}
+        self.max_concurrency = max_concurrency
+
+    def __getitem__(self, spec: str) -> IEBController:
+        return self.controllers[spec]
+
+    def __setitem__(self, spec: str, controller: IEBController):
+        self.controllers[spec] = controller
+
+    def __delitem__(self, spec: str):
+        del self.controllers[spec]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.controllers)
+
+    def __len__(self) -> int:
+        return len(self.controllers)
+
+    def __repr__(self):
+        return f"<IEBFleet ({', '.join(self.controllers)})>"
+
+    def select(self, specs: str | Sequence[str] | None = None) -> list[str]:
+        """Returns a list of spectrographs, validating that they exist.
+
+        Parameters
+        ----------
+        specs
+            A spectrograph or list of spectrographs. If `None`, returns all the
+            spectrographs in the fleet.
+
+        Raises
+        ------
+        LvmIebError
+            If any of the spectrographs is not in the fleet.
+
+        """
+
+        if specs is None:
+            return list(self.controllers)
+
+        if isinstance(specs, str):
+            specs = [specs]
+
+        for spec in specs:
+            if spec not in self.controllers:
+                raise LvmIebError(f"Spectrograph {spec!r} is not available.")
+
+        return list(specs)
+
+    async def map(
+        self,
+        func: Callable[[IEBController], Awaitable[T]],
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[T]:
+        """Runs a coroutine function concurrently on several spectrographs.
+
+        Parameters
+        ----------
+        func
+            A function that receives the `.IEBController` and returns an
+            awaitable.
+        specs
+            The spectrographs on which to run. See `.select`.
+
+        Returns
+        -------
+        results
+            A `.FleetResults` mapping of spectrograph to `.FleetResult`.
+
+        """
+
+        selected = self.select(specs)
+
+        if self.max_concurrency is None:
+            semaphore = None
+        else:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(spec: str) -> FleetResult[T]:
+            if semaphore is not None:
+                await semaphore.acquire()
+
+            start = time.perf_counter()
+            try:
+                value = await func(self.controllers[spec])
+                return FleetResult(spec, value, elapsed=time.perf_counter() - start)
+            except Exception as err:
+                return FleetResult(spec, error=err, elapsed=time.perf_counter() - start)
+            finally:
+                if semaphore is not None:
+                    semaphore.release()
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*[run(spec) for spec in selected])
+
+        fleet_results: FleetResults[T] = FleetResults(zip(selected, results))
+        fleet_results.elapsed = time.perf_counter() - start
+
+        return fleet_results
+
+    async def map_motors(
+        self,
+        func: Callable[[MotorController], Awaitable[T]],
+        motors: Sequence[str],
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[dict[str, T]]:
+        """Runs a coroutine function on several motors of each spectrograph.
+
+        The motors of a spectrograph run concurrently, as a single operation
+        of the batch (see `.map`). If any of them fails, the operation fails.
+
+        Parameters
+        ----------
+        func
+            A function that receives the `.MotorController` and returns an
+            awaitable.
+        motors
+            The motors on which to run, for example ``hartmann_left`` and
+            ``hartmann_right``.
+        specs
+            The spectrographs on which to run. See `.select`.
+
+        Returns
+        -------
+        results
+            A `.FleetResults` mapping of spectrograph to `.FleetResult`, whose
+            value is a mapping of motor to the value returned by ``func``.
+
+        """
+
+        async def run(controller: IEBController) -> dict[str, T]:
+            values = await asyncio.gather(
+                *[func(controller.motors[motor]) for motor in motors]
+            )
+            return dict(zip(motors, values))
+
+        return await self.map(run, specs)
+
+    async def read_all_sensors(
+        self,
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[dict[str, float]]:
+        """Reads the WAGO temperature and humidity sensors."""
+
+        return await self.map(lambda c: c.wago.read_sensors(), specs)
+
+    async def read_all_relays(
+        self,
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[dict[str, bool]]:
+        """Reads the WAGO power relays."""
+
+        return await self.map(lambda c: c.wago.read_relays(), specs)
+
+    async def set_power_all(
+        self,
+        relay: str,
+        closed: bool = True,
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[Any]:
+        """Opens or closes a power relay.
+
+        Parameters
+        ----------
+        relay
+            The name of the relay, for example ``shutter``.
+        closed
+            Whether to close (power on) or open (power off) the relay.
+        specs
+            The spectrographs on which to set the relay.
+
+        """
+
+        return await self.map(lambda c: c.wago.set_relay(relay, closed=closed), specs)
+
+    async def get_status_all(
+        self,
+        motor: str,
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[tuple[MotorStatus, str | None]]:
+        """Returns the status of a motor controller (see `.MotorController`)."""
+
+        return await self.map(lambda c: c.motors[motor].get_status(), specs)
+
+    async def move_all(
+        self,
+        motor: str,
+        open: bool | None = None,
+        force: bool = False,
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[bool]:
+        """Moves a motor (shutter or Hartmann door).
+
+        Parameters
+        ----------
+        motor
+            The motor to move, one of ``shutter``, ``hartmann_left``, or
+            ``hartmann_right``.
+        open
+            Whether to open or close the device. If `None`, toggles it.
+        force
+            Move the device even if it is already at the requested position.
+        specs
+            The spectrographs on which to move the motor.
+
+        """
+
+        return await self.map(
+            lambda c: c.motors[motor].move(open=open, force=force),
+            specs,
+        )
+
+    async def send_command_all(
+        self,
+        motor: str,
+        command: str,
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[bytes]:
+        """Sends a command to a motor controller (see `.MotorController`).
+
+        Parameters
+        ----------
+        motor
+            The motor controller, one of ``shutter``, ``hartmann_left``, or
+            ``hartmann_right``.
+        command
+            The command to send, for example ``init`` or ``home``.
+        specs
+            The spectrographs on which to send the command.
+
+        """
+
+        return await self.map(lambda c: c.motors[motor].send_command(command), specs)
+
+    async def probe_all(
+        self,
+        timeout: float = 1,
+        specs: str | Sequence[str] | None = None,
+    ) -> FleetResults[dict[str, bool]]:
+        """Checks the connectivity to the devices (see `.IEBController.probe`)."""
+
+        return await self.map(lambda c: c.probe(timeout=timeout), specs)
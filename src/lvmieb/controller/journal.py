@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: journal.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import pathlib
+import time
+import warnings
+from array import array
+
+from typing import Any, BinaryIO
+
+import numpy
+
+from lvmieb.exceptions import LvmIebError, LvmIebUserWarning
+
+
+__all__ = ["CommandJournal", "journal"]
+
+
+# Index record: the time at which the entry was written (d) and the offset of
+# the entry in the journal (Q).
+INDEX_DTYPE = numpy.dtype([("time", "<f8"), ("offset", "<u8")])
+
+
+class _JournalEntry:
+    """Context manager returned by `.CommandJournal.entry`.
+
+    The operation can update ``initial``, ``requested``, ``observed``, and
+    ``success`` while it runs. The entry is written when the context exits.
+    If an exception is raised, ``success`` is `False` and the error recorded.
+    Failing to write the entry issues a warning but does not raise, so that
+    the operation is not reported as failed.
+
+    """
+
+    __slots__ = (
+        "journal",
+        "spec",
+        "device",
+        "operation",
+        "requested",
+        "initial",
+        "observed",
+        "success",
+        "start",
+    )
+
+    def __init__(
+        self,
+        journal: CommandJournal,
+        spec: str,
+        device: str,
+        operation: str,
+        requested: Any = None,
+    ):
+        self.journal = journal
+        self.spec = spec
+        self.device = device
+        self.operation = operation
+        self.requested = requested
+        self.initial: Any = None
+        self.observed: Any = None
+        self.success: bool | None = None
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.journal.enabled:
+            return False
+
+        end = time.time()
+
+        error = None
+        if exc is not None:
+            error = str(exc) or exc_type.__name__
+
+        try:
+            self.journal.append(
+                {
+                    "time": round(end, 6),
+                    "start": round(self.start, 6),
+                    "duration": round(end - self.start, 6),
+                    "spec": self.spec,
+                    "device": self.device,
+                    "operation": self.operation,
+                    "initial": self.initial,
+                    "requested": self.requested,
+                    "observed": self.observed,
+                    "success": exc is None if self.success is None else self.success,
+                    "error": error,
+                }
+            )
+        except Exception as err:
+            warnings.warn(
+                f"Failed writing {self.operation} of {self.spec}.{self.device} "
+                f"to the command journal: {err}",
+                LvmIebUserWarning,
+            )
+
+        return False
+
+
+class CommandJournal:
+    """An append-only journal of the operations that change the hardware state.
+
+    Each entry is written as a line of JSON, so the journal can also be read
+    with standard tools. A binary index with the time and offset of each entry
+    is written alongside (with the ``.idx`` suffix) and kept in memory, so
+    that a time range is found with a binary search and read with a single
+    seek. If the index is missing or incomplete, it is rebuilt when the
+    journal is opened.
+
+    The journal is disabled until `.open` is called. The hardware classes
+    write to the global instance, ``journal``, using `.entry`.
+
+    Parameters
+    ----------
+    path
+        If set, the path to the journal, which is opened.
+
+    """
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        self.path: pathlib.Path | None = None
+
+        self._fd: BinaryIO | None = None
+        self._index_fd: BinaryIO | None = None
+        self._size = 0
+
+        self._times = array("d")
+        self._offsets = array("Q")
+
+        if path is not None:
+            self.open(path)
+
+    def __repr__(self):
+        path = str(self.path) if self.path else None
+        return f"<CommandJournal {path!r} (entries={len(self)})>"
+
+    def __len__(self):
+        return len(self._times)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the journal is open."""
+
+        return self._fd is not None
+
+    def open(self, path: str | os.PathLike):
+        """Opens a journal, creating it if it does not exist."""
+
+        self.close()
+
+        self.path = pathlib.Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._fd = open(self.path, "ab+")
+        self._size = self._fd.seek(0, os.SEEK_END)
+
+        index_path = self.path.with_name(self.path.name + ".idx")
+        self._index_fd = open(index_path, "ab+")
+
+        self._load_index()
+
+    def _load_index(self):
+        """Reads the index and indexes the entries that are missing from it."""
+
+        assert self._fd is not None and self._index_fd is not None
+
+        self._index_fd.seek(0)
+        index_data = self._index_fd.read()
+        n_index = len(index_data) // INDEX_DTYPE.itemsize
+
+        index = numpy.frombuffer(index_data, dtype=INDEX_DTYPE, count=n_index)
+
+        # The index is for a different or truncated journal.
+        if n_index > 0 and int(index["offset"][-1]) >= self._size:
+            n_index = 0
+            index = index[:0]
+
+        if n_index * INDEX_DTYPE.itemsize != len(index_data):
+            self._index_fd.truncate(n_index * INDEX_DTYPE.itemsize)
+
+        self._times = array("d", index["time"].tobytes())
+        self._offsets = array("Q", index["offset"].tobytes())
+
+        # Find the end of the last indexed entry and index the rest.
+        position = 0
+        if n_index > 0:
+            self._fd.seek(self._offsets[-1])
+            position = self._offsets[-1] + len(self._fd.readline())
+
+        self._fd.seek(position)
+        for line in self._fd:
+            if not line.endswith(b"\n"):
+                break
+
+            try:
+                timestamp = float(json.loads(line)["time"])
+            except (ValueError, KeyError, TypeError):
+                timestamp = self._times[-1] if len(self._times) > 0 else 0.0
+
+            self._add_to_index(timestamp, position)
+            position += len(line)
+
+        self._index_fd.flush()
+        self._fd.seek(0, os.SEEK_END)
+
+    def _add_to_index(self, timestamp: float, offset: int):
+        """Adds an entry to the index."""
+
+        assert self._index_fd is not None
+
+        # The index must be sorted even if the system clock goes back.
+        if len(self._times) > 0 and timestamp < self._times[-1]:
+            timestamp = self._times[-1]
+
+        self._times.append(timestamp)
+        self._offsets.append(offset)
+
+        record = numpy.array([(timestamp, offset)], dtype=INDEX_DTYPE)
+        self._index_fd.write(record.tobytes())
+
+    def close(self):
+        """Closes the journal."""
+
+        for fd in [self._fd, self._index_fd]:
+            if fd is not None:
+                fd.close()
+
+        self._fd = None
+        self._index_fd = None
+
+    def entry(
+        self,
+        spec: str,
+        device: str,
+        operation: str,
+        requested: Any = None,
+    ) -> _JournalEntry:
+        """Returns a context manager that journals an operation.
+
+        Parameters
+        ----------
+        spec
+            The spectrograph.
+        device
+            The device, for example ``shutter`` or a relay name.
+        operation
+            The operation, for example ``move``, ``init``, or ``set_relay``.
+        requested
+            The requested state. Can also be set in the context.
+
+        """
+
+        return _JournalEntry(self, spec, device, operation, requested=requested)
+
+    def append(self, entry: dict[str, Any]):
+        """Appends an entry, which must include its UNIX ``time``."""
+
+        if self._fd is None:
+            raise LvmIebError("The command journal is not open.")
+
+        line = (json.dumps(entry, separators=(",", ":")) + "\n").encode()
+
+        offset = self._size
+        self._fd.write(line)
+        self._fd.flush()
+        self._size += len(line)
+
+        self._add_to_index(entry["time"], offset)
+        self._index_fd.flush()  # type: ignore
+
+    def query(
+        self,
+        since: float | None = None,
+        until: float | None = None,
+        spec: str | None = None,
+        device: str | None = None,
+        operation: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Returns the entries in a time range, in chronological order.
+
+        Parameters
+        ----------
+        since
+            Only return entries completed at or after this UNIX time.
+        until
+            Only return entries completed at or before this UNIX time.
+        spec
+            Only return entries for this spectrograph.
+        device
+            Only return entries for this device.
+        operation
+            Only return entries for this operation.
+        limit
+            If set, only return the latest ``limit`` matching entries.
+
+        """
+
+        if self._fd is None:
+            raise LvmIebError("The command journal is not open.")
+
+        low = 0 if since is None else bisect.bisect_left(self._times, since)
+        high = len(self) if until is None else bisect.bisect_right(self._times, until)
+
+        if high <= low:
+            return []
+
+        start = self._offsets[low]
+        end = self._offsets[high] if high < len(self) else self._size
+
+        self._fd.seek(start)
+        data = self._fd.read(end - start)
+        self._fd.seek(0, os.SEEK_END)
+
+        entries = []
+        for line in data.splitlines():
+            entry = json.loads(line)
+            if spec is not None and entry.get("spec") != spec:
+                continue
+            if device is not None and entry.get("device") != device:
+                continue
+            if operation is not None and entry.get("operation") != operation:
+                continue
+            entries.append(entry)
+
+        if limit is not None:
+            entries = entries[-limit:] if limit > 0 else []
+
+        return entries
+
+
+#: The global command journal used by the device classes.
+journal = CommandJournal()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: metrics.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import time
+
+from lvmieb.controller.recorder import recorder
+
+
+__all__ = ["Histogram", "OperationMetrics", "Gauge", "MetricsRegistry", "registry"]
+
+
+# Upper bounds, in seconds, of the histogram buckets. Values larger than the
+# last bound go to an overflow bucket.
+BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    """A streaming histogram with fixed buckets.
+
+    Observing a value is O(log N) in the number of buckets and does not store
+    the values. Quantiles are estimated by linear interpolation within the
+    bucket that contains them.
+
+    Parameters
+    ----------
+    bounds
+        The sorted upper bounds of the buckets.
+
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, bounds: tuple[float, ...] = BUCKETS):
+        self.bounds = bounds
+        self.reset()
+
+    def reset(self):
+        """Clears all the observations."""
+
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def observe(self, value: float):
+        """Adds a value to the histogram."""
+
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        """Estimates the value at quantile ``q`` (between 0 and 1)."""
+
+        if self.count == 0:
+            return float("nan")
+
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count == 0 or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+
+            lower = self.bounds[index - 1] if index > 0 else 0.0
+            upper = self.bounds[index] if index < len(self.bounds) else self.max
+
+            lower = max(lower, self.min)
+            upper = min(upper, self.max)
+
+            fraction = (rank - cumulative) / bucket_count
+            return lower + (upper - lower) * fraction
+
+        return self.max
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Returns a summary of the histogram."""
+
+        if self.count == 0:
+            return {"count": 0}
+
+        return {
+            "count": self.count,
+            "mean": round(self.sum / self.count, 6),
+            "min": round(self.min, 6),
+            "max": round(self.max, 6),
+            "p50": round(self.quantile(0.5), 6),
+            "p95": round(self.quantile(0.95), 6),
+            "p99": round(self.quantile(0.99), 6),
+        }
+
+
+class OperationMetrics:
+    """Metrics for an operation on a device.
+
+    Attributes
+    ----------
+    connect
+        Histogram of the time needed to connect to the device.
+    request
+        Histogram of the time between sending the request and receiving the
+        full reply (or the end of the operation, if it does not connect).
+    bytes_sent
+        Total number of bytes sent to the device.
+    bytes_received
+        Total number of bytes received from the device.
+    timeouts
+        Number of operations that timed out.
+    errors
+        Number of operations that failed for reasons other than a timeout.
+
+    """
+
+    __slots__ = (
+        "connect",
+        "request",
+        "bytes_sent",
+        "bytes_received",
+        "timeouts",
+        "errors",
+    )
+
+    def __init__(self):
+        self.connect = Histogram()
+        self.request = Histogram()
+        self.reset()
+
+    def reset(self):
+        """Clears all the metrics."""
+
+        self.connect.reset()
+        self.request.reset()
+
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    def to_dict(self) -> dict:
+        """Returns a summary of the metrics."""
+
+        return {
+            "connect": self.connect.to_dict(),
+            "request": self.request.to_dict(),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+
+
+class _Tracker:
+    """Context manager returned by `.MetricsRegistry.track`."""
+
+    __slots__ = ("metrics", "device", "record", "start", "request_start", "connection")
+
+    def __init__(
+        self,
+        metrics: OperationMetrics,
+        device: str = "",
+        record: bool = True,
+    ):
+        self.metrics = metrics
+        self.device = device
+        self.record = record
+        self.start = 0.0
+        self.request_start: float | None = None
+        self.connection = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        now = time.perf_counter()
+
+        if self.request_start is not None:
+            self.metrics.request.observe(now - self.request_start)
+        elif exc is None:
+            # The operation did not mark a connection. Time the whole block.
+            self.metrics.request.observe(now - self.start)
+
+        if exc is not None and not isinstance(exc, asyncio.CancelledError):
+            if _is_timeout(exc):
+                self.metrics.timeouts += 1
+            else:
+                self.metrics.errors += 1
+
+        if self.connection > 0:
+            recorder.closed(self.device, self.connection)
+
+        return False
+
+    def connected(self):
+        """Marks that the connection has been established."""
+
+        self.request_start = time.perf_counter()
+        self.metrics.connect.observe(self.request_start - self.start)
+
+        if self.record and recorder.enabled:
+            self.connection = recorder.connect(self.device)
+
+    def sent(self, n_bytes: int, data: bytes | None = None):
+        """Records the number of bytes sent and, if recording, the data."""
+
+        self.metrics.bytes_sent += n_bytes
+
+        if self.connection > 0 and data is not None:
+            recorder.sent(self.device, self.connection, data)
+
+    def received(self, n_bytes: int, data: bytes | None = None):
+        """Records the number of bytes received and, if recording, the data."""
+
+        self.metrics.bytes_received += n_bytes
+
+        if self.connection > 0 and data is not None:
+            recorder.received(self.device, self.connection, data)
+
+
+def _is_timeout(exc: BaseException | None) -> bool:
+    """Determines whether an exception was caused by a timeout."""
+
+    while exc is not None:
+        if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+            return True
+        exc = exc.__cause__ or exc.__context__
+
+    return False
+
+
+class Gauge:
+    """The last known value of a quantity, for different sets of labels.
+
+    Parameters
+    ----------
+    name
+        The name of the gauge.
+    description
+        A short description of the gauge.
+
+    """
+
+    __slots__ = ("name", "description", "values")
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+
+        self.values: dict[tuple[tuple[str, str], ...], float] = {}
+
+    def set(self, value: float, **labels: str):
+        """Sets the value of the gauge for a set of labels."""
+
+        self.values[tuple(sorted(labels.items()))] = value
+
+    def get(self, **labels: str) -> float | None:
+        """Returns the value of the gauge for a set of labels."""
+
+        return self.values.get(tuple(sorted(labels.items())), None)
+
+    def remove(self, **labels: str):
+        """Removes the value of the gauge for a set of labels, if it exists."""
+
+        self.values.pop(tuple(sorted(labels.items())), None)
+
+
+class MetricsRegistry:
+    """Collects latency and error metrics per device and operation.
+
+    Devices are identified by a string, usually ``<spec>.<device>``. Usage ::
+
+        with registry.track("sp1.shutter", "status") as tracker:
+            r, w = await asyncio.open_connection(...)
+            tracker.connected()
+            ...
+
+    """
+
+    def __init__(self):
+        self.devices: dict[str, dict[str, OperationMetrics]] = {}
+        self.commands: dict[str, OperationMetrics] = {}
+        self.gauges: dict[str, Gauge] = {}
+
+    def get(self, device: str, operation: str) -> OperationMetrics:
+        """Returns (creating it if needed) the metrics for an operation."""
+
+        try:
+            return self.devices[device][operation]
+        except KeyError:
+            metrics = OperationMetrics()
+            self.devices.setdefault(device, {})[operation] = metrics
+            return metrics
+
+    def track(self, device: str, operation: str, record: bool = True) -> _Tracker:
+        """Returns a context manager that records the metrics of an operation.
+
+        The time until `~_Tracker.connected` is called is recorded as the
+        connect time and the rest as the request time. Exceptions raised in
+        the block are counted as timeouts or errors.
+
+        If ``record`` is `True` and the wire recorder is enabled, the connection
+        and the data passed to the tracker are recorded. Devices that record
+        their own traffic (for example the WAGO Modbus client) should set it
+        to `False`.
+
+        """
+
+        return _Tracker(self.get(device, operation), device, record=record)
+
+    def observe_command(self, name: str, elapsed: float, failed: bool = False):
+        """Records the duration of an actor command."""
+
+        if name not in self.commands:
+            self.commands[name] = OperationMetrics()
+
+        metrics = self.commands[name]
+        metrics.request.observe(elapsed)
+        if failed:
+            metrics.errors += 1
+
+    def gauge(self, name: str, description: str = "") -> Gauge:
+        """Returns (creating it if needed) a gauge."""
+
+        if name not in self.gauges:
+            self.gauges[name] = Gauge(name, description=description)
+
+        return self.gauges[name]
+
+    def reset(self):
+        """Clears all the device and command metrics. Gauges are kept."""
+
+        self.devices.clear()
+        self.commands.clear()
+
+    def to_dict(self, device: str | None = None) -> dict[str, dict[str, dict]]:
+        """Returns a summary of the metrics, optionally for a single device."""
+
+        return {
+            dev: {op: metrics.to_dict() for op, metrics in operations.items()}
+            for dev, operations in self.devices.items()
+            if device is None or dev == device
+        }
+
+
+#: The global metrics registry used by the device classes.
+registry = MetricsRegistry()
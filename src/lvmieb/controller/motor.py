@@ -5,12 +5,16 @@ from __future__ import annotations
 
 import asyncio
 import re
+import time
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
+from lvmieb.controller.journal import journal
 from lvmieb.controller.maskbits import MotorStatus
+from lvmieb.controller.metrics import registry
+from lvmieb.controller.tools import check_connection
 from lvmieb.exceptions import LvmIebUserWarning, MotorControllerError
 
 
@@ -27,6 +31,11 @@ DEVLIST = ["shutter", "hartmann_left", "hartmann_right"]
 # Shutter/HD commands
 COMMANDS = {"init": "QX1", "home": "QX2", "open": "QX3", "close": "QX4", "status": "IS"}
 
+# Reply to the status command. PARSE_IS_PATTERN captures the two bits that
+# determine the position of the motor.
+IS_PATTERN = re.compile(b"\x00\x07IS=([0-1]{8})\r$")
+PARSE_IS_PATTERN = re.compile(b"\x00\x07IS=([0-1])([0-1])[0-1]{6}\r$")
+
 
 @dataclass
 class MotorController:
@@ -47,6 +56,10 @@ class MotorController:
     wago
         Optionally, the `.IEBWAGO` instance associated with this device, used
         to check the power status of the motor controller.
+    callbacks
+        Functions called after the motor completes a move, with the motor
+        controller, the new position (``open`` or ``closed``), and the UNIX
+        time at which the move completed.
 
     """
 
@@ -55,6 +68,10 @@ class MotorController:
     host: str
     port: int
     wago: Optional[IEBWAGO] = None
+    callbacks: list[Callable[[MotorController, str, float], None]] = field(
+        default_factory=list,
+        repr=False,
+    )
 
     TIMEOUT: float = 5
 
@@ -62,6 +79,11 @@ class MotorController:
         if self.type not in DEVLIST:
             raise ValueError(f"Device type {self.type} is not valid.")
 
+    async def probe(self, timeout: float = 1) -> bool:
+        """Checks whether the motor controller accepts connections."""
+
+        return await check_connection(self.host, self.port, timeout=timeout)
+
     async def get_power_status(self):
         """Returns the power status of a motor controller."""
 
@@ -72,42 +94,66 @@ class MotorController:
         return (await device.read())[0] == "closed"
 
     async def send_command(self, command: str, timeout: float = 3) -> bytes:
-        """Sends a command to the device."""
+        """Sends a command to the device.
 
-        if command in COMMANDS:
-            command = COMMANDS[command]
+        The ``init`` and ``home`` commands are recorded in the command journal.
 
-        try:
-            conn = asyncio.open_connection(self.host, self.port)
-            r, w = await asyncio.wait_for(conn, self.TIMEOUT)
-        except OSError as err:
-            raise MotorControllerError(
-                f"{self.type} ({self.spec}): failed connecting to device: {err}"
-            )
-        except asyncio.TimeoutError:
-            raise MotorControllerError(
-                f"{self.type} ({self.spec}): timed out connecting to device."
-            )
+        """
 
-        w.write((f"\00\07{command}\r").encode())
-        await w.drain()
+        if command not in ("init", "home"):
+            return await self._send_command(command, timeout=timeout)
 
-        reply = b""
-        try:
-            while True:
-                reply += await asyncio.wait_for(r.readuntil(b"\r"), timeout)
-                if command == "IS":
-                    return reply
-                if b"ERR" in reply or b"DONE" in reply:
-                    return reply
-        except asyncio.TimeoutError:
-            raise MotorControllerError(
-                f"{self.type} ({self.spec}): timed out waiting for "
-                f"reply to {command!r}.",
-            )
-        finally:
-            w.close()
-            await w.wait_closed()
+        with journal.entry(self.spec, self.type, command, requested="done") as entry:
+            reply = await self._send_command(command, timeout=timeout)
+            entry.observed = "done" if b"DONE" in reply else "error"
+            entry.success = entry.observed == "done"
+
+        return reply
+
+    async def _send_command(self, command: str, timeout: float = 3) -> bytes:
+        """Sends a command to the device and returns the reply."""
+
+        operation = command
+        if command in COMMANDS:
+            command = COMMANDS[command]
+
+        with registry.track(f"{self.spec}.{self.type}", operation) as tracker:
+            try:
+                conn = asyncio.open_connection(self.host, self.port)
+                r, w = await asyncio.wait_for(conn, self.TIMEOUT)
+            except OSError as err:
+                raise MotorControllerError(
+                    f"{self.type} ({self.spec}): failed connecting to device: {err}"
+                )
+            except asyncio.TimeoutError:
+                raise MotorControllerError(
+                    f"{self.type} ({self.spec}): timed out connecting to device."
+                )
+
+            tracker.connected()
+
+            message = (f"\00\07{command}\r").encode()
+            w.write(message)
+            await w.drain()
+            tracker.sent(len(message), message)
+
+            reply = b""
+            try:
+                while True:
+                    reply += await asyncio.wait_for(r.readuntil(b"\r"), timeout)
+                    if command == "IS":
+                        return reply
+                    if b"ERR" in reply or b"DONE" in reply:
+                        return reply
+            except asyncio.TimeoutError:
+                raise MotorControllerError(
+                    f"{self.type} ({self.spec}): timed out waiting for "
+                    f"reply to {command!r}.",
+                )
+            finally:
+                tracker.received(len(reply), reply)
+                w.close()
+                await w.wait_closed()
 
     async def get_status(self) -> tuple[MotorStatus, str | None]:
         """Returns the status and position of the motor.
@@ -141,7 +187,7 @@ class MotorController:
             motor_status |= MotorStatus.POSITION_UNKNOWN
             return (motor_status, None)
 
-        match = re.search(b"\x00\x07IS=([0-1]{8})\r$", reply)
+        match = IS_PATTERN.search(reply)
         if match is None:
             warnings.warn(
                 f"Cannot match reply {reply} for {self.type} in {self.spec}",
@@ -181,44 +227,77 @@ class MotorController:
 
         """
 
-        status = (await self.get_status())[0]
+        requested = None
+        if open is not None:
+            requested = "open" if open else "closed"
 
-        if status & (MotorStatus.POSITION_UNKNOWN | MotorStatus.POSITION_INVALID):
-            raise MotorControllerError("Motor position is unknown or invalid.")
+        with journal.entry(self.spec, self.type, "move", requested) as entry:
+            status = (await self.get_status())[0]
 
-        if open is None:
             if status & MotorStatus.OPEN:
-                command = "close"
+                entry.initial = "open"
             elif status & MotorStatus.CLOSED:
-                command = "open"
+                entry.initial = "closed"
+
+            if status & (MotorStatus.POSITION_UNKNOWN | MotorStatus.POSITION_INVALID):
+                raise MotorControllerError("Motor position is unknown or invalid.")
+
+            if open is None:
+                if status & MotorStatus.OPEN:
+                    command = "close"
+                elif status & MotorStatus.CLOSED:
+                    command = "open"
+                else:
+                    raise ValueError("Invalid motor status.")
+                entry.requested = "open" if command == "open" else "closed"
+            elif open is True:
+                command = "open" if (status & MotorStatus.CLOSED or force) else None
+            elif open is False:
+                command = "close" if (status & MotorStatus.OPEN or force) else None
             else:
-                raise ValueError("Invalid motor status.")
-        elif open is True:
-            command = "open" if (status & MotorStatus.CLOSED or force) else None
-        elif open is False:
-            command = "close" if (status & MotorStatus.OPEN or force) else None
-        else:
-            raise ValueError(f"Invalid motor status {open!r}.")
+                raise ValueError(f"Invalid motor status {open!r}.")
 
-        if command is None:
-            return True
+            if command is None:
+                entry.observed = entry.initial
+                return True
 
-        reply = await self.send_command(command, timeout=3.0)
+            reply = await self.send_command(command, timeout=3.0)
 
-        if b"DONE" in reply:
-            return True
-        elif b"ERR" in reply:
-            return False
-        else:
-            raise MotorControllerError(
-                f"{self.type} ({self.spec}): invalid reply to command {command!r}."
-            )
+            if b"DONE" in reply:
+                entry.observed = entry.requested
+                self._run_callbacks(entry.requested, time.time())
+                return True
+            elif b"ERR" in reply:
+                entry.success = False
+                return False
+            else:
+                raise MotorControllerError(
+                    f"{self.type} ({self.spec}): invalid reply to command {command!r}."
+                )
+
+    def _run_callbacks(self, position: str | None, timestamp: float):
+        """Calls the callbacks after a move.
+
+        Errors in the callbacks are issued as warnings, since the move itself
+        succeeded.
+
+        """
+
+        for callback in self.callbacks:
+            try:
+                callback(self, position, timestamp)
+            except Exception as err:
+                warnings.warn(
+                    f"Callback {callback!r} for {self.type} in {self.spec} "
+                    f"failed: {err}",
+                    LvmIebUserWarning,
+                )
 
 
 def parse_IS(reply: bytes, device: str):
     """Parses the reply to the shutter IS command."""
 
-    match = re.search(b"\x00\x07IS=([0-1])([0-1])[0-1]{6}\r$", reply)
+    match = PARSE_IS_PATTERN.search(reply)
     if match is None:
         return None
 
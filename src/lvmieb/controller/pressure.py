@@ -7,12 +7,23 @@ import asyncio
 import re
 from dataclasses import dataclass
 
+from lvmieb.controller.metrics import registry
+from lvmieb.controller.tools import check_connection
 from lvmieb.exceptions import LvmIebError
 
 
 __all__ = ["PressureTransducer"]
 
 
+TRANSDUCER_GAUGE = registry.gauge(
+    "lvmieb_transducer",
+    "Last value read from a pressure transducer",
+)
+
+# Reply to a query, with the value.
+REPLY_PATTERN = re.compile(rb"@[0-9]{1,3}ACK([0-9.E+-]+)\\$")
+
+
 @dataclass
 class PressureTransducer:
     """Communicates with a SENS4 pressure transducer.
@@ -43,32 +54,58 @@ class PressureTransducer:
 
     TIMEOUT: float = 3
 
+    # Names of the operations, for the metrics registry.
+    OPERATIONS = {"P": "pressure", "T": "temperature"}
+
+    async def probe(self, timeout: float = 1) -> bool:
+        """Checks whether the transducer accepts connections."""
+
+        return await check_connection(self.host, self.port, timeout=timeout)
+
     async def _read(self, query_string: str = "P"):
         """Queries the transducer."""
 
-        try:
-            r, w = await asyncio.wait_for(
-                asyncio.open_connection(self.host, self.port),
-                self.TIMEOUT,
-            )
-        except Exception as err:
-            raise LvmIebError(
-                f"Transducer {self.camera}: failed connecting to device: {err}"
-            )
-
-        command = "@" + str(self.device_id) + query_string + "?\\"
-        w.write(command.encode())
-        await w.drain()
-
-        try:
-            reply = await asyncio.wait_for(r.readuntil(b"\\"), self.TIMEOUT)
-            match = re.search(r"@[0-9]{1,3}ACK([0-9.E+-]+)\\$".encode(), reply)
-            if not match:
-                raise ValueError("Cannot parse reply.")
-            return float(match.groups()[0])
-        finally:
-            w.close()
-            await w.wait_closed()
+        device = f"{self.spec}.{self.camera}"
+        operation = self.OPERATIONS.get(query_string, query_string)
+
+        with registry.track(device, operation) as tracker:
+            try:
+                r, w = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port),
+                    self.TIMEOUT,
+                )
+            except Exception as err:
+                raise LvmIebError(
+                    f"Transducer {self.camera}: failed connecting to device: {err}"
+                )
+
+            tracker.connected()
+
+            command = ("@" + str(self.device_id) + query_string + "?\\").encode()
+            w.write(command)
+            await w.drain()
+            tracker.sent(len(command), command)
+
+            try:
+                reply = await asyncio.wait_for(r.readuntil(b"\\"), self.TIMEOUT)
+                tracker.received(len(reply), reply)
+
+                match = REPLY_PATTERN.search(reply)
+                if not match:
+                    raise ValueError("Cannot parse reply.")
+
+                value = float(match.groups()[0])
+                TRANSDUCER_GAUGE.set(
+                    value,
+                    spec=self.spec,
+                    camera=self.camera,
+                    measurement=operation,
+                )
+
+                return value
+            finally:
+                w.close()
+                await w.wait_closed()
 
     async def read_pressure(self):
         """Reads the pressure from the transducer."""
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: recorder.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import itertools
+import os
+import pathlib
+import struct
+import time
+from dataclasses import dataclass
+
+from typing import BinaryIO, Iterator
+
+from lvmieb.exceptions import LvmIebError
+
+
+__all__ = ["WireRecorder", "WireEvent", "read_journal", "recorder"]
+
+
+MAGIC = b"LVMIEBWR"
+VERSION = 1
+
+# Session header: magic (8s), version (I), UNIX time (d) and monotonic time (d)
+# when the session started. A journal can contain several sessions.
+HEADER_FORMAT = "<8sIdd"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Record: monotonic time (d), event (B), device index (H), connection (I),
+# length of the payload (I). The payload follows. DEVICE records define the
+# name (payload) of a device index and are written the first time it is used.
+RECORD_FORMAT = "<dBHII"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+DEVICE, CONNECT, SEND, RECEIVE, CLOSE = range(5)
+EVENTS = {CONNECT: "connect", SEND: "send", RECEIVE: "receive", CLOSE: "close"}
+
+
+@dataclass
+class WireEvent:
+    """An event read from a wire journal.
+
+    Parameters
+    ----------
+    time
+        The monotonic time of the event, in seconds.
+    unix_time
+        The UNIX time of the event.
+    event
+        One of ``connect``, ``send``, ``receive``, or ``close``.
+    device
+        The device, as named in the metrics registry (for example,
+        ``sp1.shutter``, ``sp1.r1``, ``sp1.wago``, or ``depth``).
+    connection
+        An identifier of the connection, unique within the session.
+    data
+        The bytes sent or received.
+
+    """
+
+    time: float
+    unix_time: float
+    event: str
+    device: str
+    connection: int
+    data: bytes = b""
+
+
+class WireRecorder:
+    """Records the traffic with the devices to a binary journal.
+
+    The recorder is disabled until `.open` is called. The transports report
+    their connections and the bytes sent and received through the tracker of
+    the metrics registry (see `.MetricsRegistry.track`) and, for the WAGO, the
+    Modbus client. Each event is written with its monotonic time so that the
+    traffic can be replayed with the same timing (see `lvmieb.simulator.replay`).
+
+    """
+
+    def __init__(self):
+        self.path: pathlib.Path | None = None
+        self.n_events = 0
+
+        self._fd: BinaryIO | None = None
+        self._devices: dict[str, int] = {}
+        self._connection = itertools.count(1)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the recorder is writing to a journal."""
+
+        return self._fd is not None
+
+    def open(self, path: str | os.PathLike):
+        """Starts recording to a journal. If the file exists, it is appended."""
+
+        self.close()
+
+        self.path = pathlib.Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._fd = open(self.path, "ab", buffering=65536)
+        self._fd.write(
+            struct.pack(HEADER_FORMAT, MAGIC, VERSION, time.time(), time.monotonic())
+        )
+
+        self._devices = {}
+        self._connection = itertools.count(1)
+        self.n_events = 0
+
+    def close(self):
+        """Stops recording and closes the journal."""
+
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
+
+    def flush(self):
+        """Flushes the journal to disk."""
+
+        if self._fd is not None:
+            self._fd.flush()
+
+    def _write(self, event: int, device: str, connection: int, data: bytes = b""):
+        fd = self._fd
+        if fd is None:
+            return
+
+        index = self._devices.get(device, None)
+        if index is None:
+            index = self._devices[device] = len(self._devices)
+            name = device.encode()
+            fd.write(struct.pack(RECORD_FORMAT, 0.0, DEVICE, index, 0, len(name)))
+            fd.write(name)
+
+        fd.write(
+            struct.pack(
+                RECORD_FORMAT,
+                time.monotonic(),
+                event,
+                index,
+                connection,
+                len(data),
+            )
+        )
+        fd.write(data)
+
+        self.n_events += 1
+
+    def connect(self, device: str) -> int:
+        """Records a new connection. Returns its identifier, or 0 if disabled."""
+
+        if self._fd is None:
+            return 0
+
+        connection = next(self._connection)
+        self._write(CONNECT, device, connection)
+
+        return connection
+
+    def sent(self, device: str, connection: int, data: bytes):
+        """Records the bytes sent in a connection."""
+
+        self._write(SEND, device, connection, data)
+
+    def received(self, device: str, connection: int, data: bytes):
+        """Records the bytes received in a connection."""
+
+        self._write(RECEIVE, device, connection, data)
+
+    def closed(self, device: str, connection: int):
+        """Records that a connection was closed."""
+
+        self._write(CLOSE, device, connection)
+
+
+def read_journal(path: str | os.PathLike) -> Iterator[WireEvent]:
+    """Reads the events in a wire journal, in order.
+
+    Connection identifiers are only unique within a session. Events from
+    later sessions have their connection offset so that they remain unique.
+
+    """
+
+    path = pathlib.Path(path).expanduser()
+
+    with open(path, "rb") as fd:
+        devices: dict[int, str] = {}
+        offset = 0
+        max_connection = 0
+        wall_offset = 0.0
+
+        while True:
+            chunk = fd.read(RECORD_SIZE)
+            if len(chunk) == 0:
+                return
+
+            if chunk[:8] == MAGIC:
+                chunk += fd.read(HEADER_SIZE - len(chunk))
+                _, version, unix_time, monotonic_time = struct.unpack(
+                    HEADER_FORMAT,
+                    chunk,
+                )
+                if version != VERSION:
+                    raise LvmIebError(f"Unsupported wire journal version {version}.")
+
+                devices = {}
+                offset = max_connection
+                wall_offset = unix_time - monotonic_time
+                continue
+
+            if len(chunk) < RECORD_SIZE:
+                raise LvmIebError(f"{str(path)!r} is truncated.")
+
+            timestamp, event, index, connection, size = struct.unpack(
+                RECORD_FORMAT,
+                chunk,
+            )
+            data = fd.read(size)
+
+            if event == DEVICE:
+                devices[index] = data.decode()
+                continue
+
+            max_connection = max(max_connection, connection + offset)
+
+            yield WireEvent(
+                time=timestamp,
+                unix_time=timestamp + wall_offset,
+                event=EVENTS[event],
+                device=devices[index],
+                connection=connection + offset,
+                data=data,
+            )
+
+
+#: The global wire recorder used by the device classes.
+recorder = WireRecorder()
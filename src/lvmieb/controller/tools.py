@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: tools.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+
+__all__ = ["check_connection"]
+
+
+async def check_connection(host: str, port: int, timeout: float = 1) -> bool:
+    """Checks whether a TCP server is accepting connections.
+
+    Parameters
+    ----------
+    host
+        The host of the TCP server.
+    port
+        The port of the TCP server.
+    timeout
+        How long to wait for the connection to be established.
+
+    Returns
+    -------
+    result
+        `True` if the connection succeeded, `False` otherwise. This function
+        never raises on connection errors.
+
+    """
+
+    try:
+        conn = asyncio.open_connection(host, port)
+        _, w = await asyncio.wait_for(conn, timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    w.close()
+    try:
+        await w.wait_closed()
+    except OSError:
+        pass
+
+    return True
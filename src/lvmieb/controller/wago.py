@@ -3,12 +3,29 @@
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import nullcontext
+
 from drift import Drift, Relay
 
+from lvmieb.controller.journal import journal
+from lvmieb.controller.metrics import registry
+from lvmieb.controller.recorder import recorder
+
 
 __all__ = ["IEBWAGO"]
 
 
+SENSOR_GAUGE = registry.gauge(
+    "lvmieb_wago_sensor",
+    "Last value read from a WAGO temperature or humidity sensor",
+)
+RELAY_GAUGE = registry.gauge(
+    "lvmieb_wago_relay",
+    "Last known status of a WAGO power relay (1 for closed)",
+)
+
+
 class IEBWAGO(Drift):
     """Class controlling the WAGO PLC in each electronics box.
 
@@ -36,19 +53,92 @@ class IEBWAGO(Drift):
 
         self.name = name
 
+        # Record the Modbus traffic when the wire recorder is enabled. Older
+        # versions of pymodbus do not support tracing. pymodbus only traces a
+        # disconnection when the connection is lost, so closing the client is
+        # also recorded.
+        self._connection = 0
+        ctx = getattr(self.client, "ctx", None)
+        if ctx is not None and hasattr(ctx, "trace_packet"):
+            ctx.trace_packet = self._trace_packet
+            ctx.trace_connect = self._trace_connect
+
+            close = self.client.close
+
+            def close_client():
+                close()
+                self._trace_connect(False)
+
+            self.client.close = close_client
+
+    def _trace_connect(self, connected: bool):
+        """Records the Modbus connections."""
+
+        if connected:
+            self._connection = recorder.connect(f"{self.name}.wago")
+        elif self._connection > 0:
+            recorder.closed(f"{self.name}.wago", self._connection)
+            self._connection = 0
+
+    def _trace_packet(self, sending: bool, data: bytes) -> bytes:
+        """Records the Modbus packets."""
+
+        if self._connection > 0:
+            if sending:
+                recorder.sent(f"{self.name}.wago", self._connection, data)
+            else:
+                recorder.received(f"{self.name}.wago", self._connection, data)
+
+        return data
+
+    async def probe(self, timeout: float = 1) -> bool:
+        """Checks whether the WAGO Modbus server accepts connections.
+
+        Unlike the context manager, this method never raises and uses its own
+        (usually shorter) ``timeout``. The connection is closed afterwards.
+
+        """
+
+        async with self.lock or nullcontext():
+            try:
+                await asyncio.wait_for(self.client.connect(), timeout)
+                return self.client.connected is True
+            except Exception:
+                return False
+            finally:
+                self.client.close()
+
+    def get_sensor_names(self) -> list[str]:
+        """Returns the names of the sensors returned by `.read_sensors`."""
+
+        names = []
+        for category in ["temperature", "humidity"]:
+            for module in self.modules.values():
+                for device in module.devices.values():
+                    if device.category == category:
+                        names.append(device.name.lower())
+
+        return names
+
     async def read_sensors(
         self,
         units: bool = False,
     ) -> dict[str, float | tuple[float, str]]:
         """Read temperature and humidity sensors."""
 
-        async with self:
-            sensors = await self.read_category("temperature", connect=False)
-            rhs = await self.read_category("humidity", connect=False)
+        tracker = registry.track(f"{self.name}.wago", "read_sensors", record=False)
+        with tracker:
+            async with self:
+                tracker.connected()
+                sensors = await self.read_category("temperature", connect=False)
+                rhs = await self.read_category("humidity", connect=False)
 
         sensors.update(rhs)
         sensors = {k.split(".")[1].lower(): v for k, v in sensors.items()}
 
+        for name, value in sensors.items():
+            SENSOR_GAUGE.set(value[0], spec=self.name, sensor=name)
+
         if units:
             return sensors
 
@@ -69,14 +159,22 @@ class IEBWAGO(Drift):
 
         """
 
-        async with self:
-            relays = await self.read_category("relays", connect=False)
+        tracker = registry.track(f"{self.name}.wago", "read_relays", record=False)
+        with tracker:
+            async with self:
+                tracker.connected()
+                relays = await self.read_category("relays", connect=False)
 
-        return {
+        status = {
             k.split(".")[1].lower(): True if v[0] == "closed" else False
             for k, v in relays.items()
         }
 
+        for name, closed in status.items():
+            RELAY_GAUGE.set(int(closed), spec=self.name, relay=name)
+
+        return status
+
     async def set_relay(self, relay: str, closed: bool = True):
         """Sets the status of a power relay."""
 
@@ -87,15 +185,28 @@ class IEBWAGO(Drift):
 
         assert isinstance(device, Relay)
 
-        status = await device.read()
-        if status[0] == "closed" and closed is True:
-            return None
-        elif status[0] == "open" and closed is False:
-            return None
-
-        if closed:
-            await device.close()
-        else:
-            await device.open()
+        requested = "closed" if closed else "open"
+
+        with (
+            journal.entry(self.name, relay, "set_relay", requested) as entry,
+            registry.track(f"{self.name}.wago", "set_relay", record=False),
+        ):
+            status = await device.read()
+            entry.initial = entry.observed = status[0]
+
+            if status[0] == "closed" and closed is True:
+                return None
+            elif status[0] == "open" and closed is False:
+                return None
+
+            if closed:
+                await device.close()
+            else:
+                await device.open()
+
+            # Read the relay back to record its actual state.
+            status = await device.read()
+            entry.observed = status[0]
+            entry.success = entry.observed == requested
 
         return True
@@ -0,0 +1,19 @@
+# encoding: utf-8
+
+from .behaviour import Behaviour, Faults, Latency
+from .devices import DepthSimulator, MotorSimulator, PressureSimulator
+from .simulator import Simulator, expand_specs
+from .wago import WAGOSimulator
+
+
+__all__ = [
+    "Behaviour",
+    "DepthSimulator",
+    "Faults",
+    "Latency",
+    "MotorSimulator",
+    "PressureSimulator",
+    "Simulator",
+    "WAGOSimulator",
+    "expand_specs",
+]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: __main__.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+import click
+import yaml
+
+from lvmieb.simulator.simulator import Simulator
+
+
+async def run_simulator(simulator: Simulator, base_port: int | None, output: str):
+    """Starts the simulator, writes its configuration, and runs until cancelled."""
+
+    await simulator.start(base_port=base_port)
+
+    try:
+        with open(output, "w") as fd:
+            yaml.safe_dump(simulator.get_config(), fd, sort_keys=False)
+
+        click.echo(f"Simulating {', '.join(simulator.specs)}.")
+        click.echo(f"Run the actor with: lvmieb -c {output} actor start --debug")
+
+        await asyncio.Future()
+    finally:
+        await simulator.stop()
+
+
+@click.command()
+@click.option(
+    "-c",
+    "--config",
+    "config_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="The actor configuration. Defaults to the one included with lvmieb.",
+)
+@click.option(
+    "-b",
+    "--behaviour",
+    "behaviour_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="The behaviour of the devices. Defaults to etc/simulator.yml.",
+)
+@click.option(
+    "-n",
+    "--specs",
+    "n_specs",
+    type=click.IntRange(1),
+    help="Number of spectrographs. Defaults to the enabled_specs in the config.",
+)
+@click.option("--host", default="127.0.0.1", help="Host on which to listen.")
+@click.option(
+    "--port",
+    "base_port",
+    type=int,
+    help="Listen on consecutive ports starting at this one. Defaults to free ports.",
+)
+@click.option("--seed", type=int, help="Seed for the latencies and faults.")
+@click.option(
+    "-o",
+    "--output",
+    default="lvmieb_simulator.yml",
+    show_default=True,
+    type=click.Path(dir_okay=False, writable=True),
+    help="Where to write the actor configuration for the simulated devices.",
+)
+def main(
+    config_file: str | None,
+    behaviour_file: str | None,
+    n_specs: int | None,
+    host: str,
+    base_port: int | None,
+    seed: int | None,
+    output: str,
+):
+    """Runs a simulation of the electronics boxes."""
+
+    simulator = Simulator(
+        config=config_file,
+        n_specs=n_specs,
+        behaviour=behaviour_file,
+        host=host,
+        seed=seed,
+    )
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(run_simulator(simulator, base_port, output))
+
+
+if __name__ == "__main__":
+    main()
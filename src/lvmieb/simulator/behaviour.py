@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: behaviour.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import fnmatch
+import math
+import random
+from dataclasses import dataclass, field, fields
+
+from typing import Any, Literal, Mapping
+
+
+__all__ = ["Latency", "Faults", "Behaviour", "get_behaviour"]
+
+
+DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal", "exponential")
+
+Fault = Literal["drop", "hang", "error"]
+
+
+@dataclass
+class Latency:
+    """A distribution of reply latencies.
+
+    Parameters
+    ----------
+    distribution
+        One of ``constant``, ``uniform`` (between ``mean - jitter`` and
+        ``mean + jitter``), ``normal`` and ``lognormal`` (with standard deviation
+        ``jitter``), or ``exponential`` (the jitter is ignored).
+    mean
+        The mean latency, in seconds.
+    jitter
+        The spread of the distribution, in seconds.
+
+    """
+
+    distribution: str = "constant"
+    mean: float = 0.0
+    jitter: float = 0.0
+
+    def __post_init__(self):
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Invalid latency distribution {self.distribution!r}.")
+
+    def sample(self, rng: random.Random) -> float:
+        """Returns a random latency, in seconds. Never negative."""
+
+        mean = self.mean
+        jitter = self.jitter
+
+        if mean <= 0 and jitter <= 0:
+            return 0.0
+
+        if self.distribution == "constant":
+            value = mean
+        elif self.distribution == "uniform":
+            value = rng.uniform(mean - jitter, mean + jitter)
+        elif self.distribution == "normal":
+            value = rng.gauss(mean, jitter)
+        elif self.distribution == "lognormal":
+            if mean <= 0:
+                return 0.0
+            sigma2 = math.log(1 + (jitter / mean) ** 2)
+            value = rng.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        else:
+            value = rng.expovariate(1 / mean) if mean > 0 else 0.0
+
+        return max(value, 0.0)
+
+
+@dataclass
+class Faults:
+    """The probability of each kind of fault, per request.
+
+    Parameters
+    ----------
+    drop
+        The connection is closed without replying.
+    hang
+        The device never replies, until the client closes the connection.
+    error
+        The device replies with an error.
+
+    """
+
+    drop: float = 0.0
+    hang: float = 0.0
+    error: float = 0.0
+
+    def sample(self, rng: random.Random) -> Fault | None:
+        """Returns the fault for a request, or `None`."""
+
+        value = rng.random()
+        for name in ("drop", "hang", "error"):
+            probability = getattr(self, name)
+            if value < probability:
+                return name
+            value -= probability
+
+        return None
+
+
+@dataclass
+class Behaviour:
+    """How a simulated device behaves.
+
+    Parameters
+    ----------
+    latency
+        The distribution of the time between a request and its reply.
+    faults
+        The probability of each kind of fault.
+    motion_time
+        For motor controllers, the time to open or close the device. The reply
+        to the command is sent once the motion is complete.
+    single_client
+        Only serve one connection at a time. Other clients can connect but are
+        not served until the previous connection is closed, as with the terminal
+        servers of the motor controllers.
+
+    """
+
+    latency: Latency = field(default_factory=Latency)
+    faults: Faults = field(default_factory=Faults)
+    motion_time: float = 0.0
+    single_client: bool = False
+
+    def update(self, config: Mapping[str, Any]) -> Behaviour:
+        """Returns a copy of the behaviour updated with a configuration section."""
+
+        latency = {**vars(self.latency), **config.get("latency", {})}
+        faults = {**vars(self.faults), **config.get("faults", {})}
+
+        values = {f.name: getattr(self, f.name) for f in fields(self)}
+        values.update({k: v for k, v in config.items() if k in values})
+        values.update(latency=Latency(**latency), faults=Faults(**faults))
+
+        return Behaviour(**values)
+
+
+def get_behaviour(name: str, config: Mapping[str, Any] | None) -> Behaviour:
+    """Returns the behaviour of a device from the simulator configuration.
+
+    The ``default`` section is applied first, followed by all the entries in
+    ``devices`` whose key matches the device name (for example
+    ``sp1.shutter``, ``sp1.pressure.r1``, ``sp1.wago``, or ``depth``), in order.
+    Keys can contain wildcards, as in ``*.hartmann_*``.
+
+    """
+
+    config = config or {}
+
+    behaviour = Behaviour().update(config.get("default", {}))
+    for pattern, device_config in (config.get("devices", None) or {}).items():
+        if fnmatch.fnmatchcase(name, pattern):
+            behaviour = behaviour.update(device_config or {})
+
+    return behaviour
@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: devices.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import random
+import re
+
+from typing import Callable
+
+from lvmieb.simulator.behaviour import Behaviour
+
+
+__all__ = [
+    "DeviceSimulator",
+    "MotorSimulator",
+    "PressureSimulator",
+    "DepthSimulator",
+]
+
+
+class DeviceSimulator(abc.ABC):
+    """A TCP server that simulates a device.
+
+    Subclasses implement `.reply`, which returns the reply to a request, and
+    can override `.read_request` if the requests are not terminated by
+    `.terminator`. Each request is delayed and subject to the faults of the
+    device `.Behaviour`.
+
+    Parameters
+    ----------
+    name
+        The name of the device, for example ``sp1.shutter``.
+    behaviour
+        The latency, faults, and other behaviour of the device.
+    rng
+        The random number generator. Sharing a seeded generator between all the
+        devices makes a simulation reproducible.
+
+    """
+
+    terminator: bytes = b"\n"
+
+    def __init__(
+        self,
+        name: str,
+        behaviour: Behaviour | None = None,
+        rng: random.Random | None = None,
+    ):
+        self.name = name
+        self.behaviour = behaviour or Behaviour()
+        self.rng = rng or random.Random()
+
+        self.server: asyncio.Server | None = None
+        self.host: str | None = None
+        self.port: int | None = None
+
+        self.n_connections = 0
+        self.n_requests = 0
+        self.n_faults = 0
+
+        self._client_lock = asyncio.Lock()
+        self._handlers: set[asyncio.Task] = set()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name} ({self.host}:{self.port})>"
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        """Starts the server. With ``port=0`` a free port is used."""
+
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        await self.server.start_serving()
+
+        self.host, self.port = self.server.sockets[0].getsockname()[0:2]
+
+    async def stop(self):
+        """Stops the server and waits until the open connections are closed."""
+
+        if self.server is None:
+            return
+
+        server = self.server
+        self.server = None
+
+        server.close()
+
+        handlers = list(self._handlers)
+        for handler in handlers:
+            handler.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+
+        await server.wait_closed()
+
+    async def read_request(self, reader: asyncio.StreamReader) -> bytes:
+        """Reads a request."""
+
+        return await reader.readuntil(self.terminator)
+
+    @abc.abstractmethod
+    async def reply(self, request: bytes, error: bool = False) -> bytes | None:
+        """Returns the reply to a request. Returning `None` does not reply."""
+
+        pass
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        self.n_connections += 1
+
+        handler = asyncio.current_task()
+        if handler is not None:
+            self._handlers.add(handler)
+
+        try:
+            if self.behaviour.single_client:
+                async with self._client_lock:
+                    await self._serve(reader, writer)
+            else:
+                await self._serve(reader, writer)
+        finally:
+            writer.close()
+            self._handlers.discard(handler)  # type: ignore
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        behaviour = self.behaviour
+
+        while True:
+            try:
+                request = await self.read_request(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+
+            self.n_requests += 1
+
+            fault = behaviour.faults.sample(self.rng)
+            if fault is not None:
+                self.n_faults += 1
+
+            await asyncio.sleep(behaviour.latency.sample(self.rng))
+
+            if fault == "drop":
+                return
+            elif fault == "hang":
+                # Wait until the client gives up and closes the connection.
+                await reader.read()
+                return
+
+            reply = await self.reply(request, error=(fault == "error"))
+            if reply is None:
+                continue
+
+            try:
+                writer.write(reply)
+                await writer.drain()
+            except ConnectionError:
+                return
+
+
+class MotorSimulator(DeviceSimulator):
+    """Simulates the motor controller of a shutter or Hartmann door.
+
+    Parameters
+    ----------
+    name
+        The name of the device.
+    motor
+        The type of motor, one of ``shutter``, ``hartmann_left``, or
+        ``hartmann_right``.
+    status
+        The initial position, ``open`` or ``closed``.
+    powered
+        A callable that returns whether the controller is powered. If it is not,
+        the controller does not reply.
+    kwargs
+        Other arguments to pass to `.DeviceSimulator`.
+
+    """
+
+    terminator = b"\r"
+
+    def __init__(
+        self,
+        name: str,
+        motor: str = "shutter",
+        status: str = "closed",
+        powered: Callable[[], bool] | None = None,
+        **kwargs,
+    ):
+        super().__init__(name, **kwargs)
+
+        self.motor = motor
+        self.status = status
+        self.powered = powered
+
+    async def reply(self, request: bytes, error: bool = False) -> bytes | None:
+        if self.powered is not None and not self.powered():
+            return None
+
+        match = re.search(b"(QX[1-4]|IS)", request)
+        if match is None:
+            return None
+
+        command = match.group().decode()
+
+        if command == "IS":
+            return b"\x00\x07IS=" + self._get_bits(error) + b"111111\r"
+
+        if error:
+            return b"\x00\x07%ERR\r"
+
+        if command in ("QX2", "QX3", "QX4"):
+            target = "open" if command == "QX3" else "closed"
+            if target != self.status or command == "QX2":
+                self.status = "moving"
+                await asyncio.sleep(self.behaviour.motion_time)
+                self.status = target
+
+        return b"\x00\x07%DONE\r"
+
+    def _get_bits(self, error: bool = False) -> bytes:
+        """Returns the position bits of the status reply."""
+
+        if error:
+            return b"11"
+        elif self.status == "moving":
+            return b"00"
+
+        # The left Hartmann door is mounted reversed, so its bits are inverted.
+        is_open = self.status == "open"
+        if self.motor == "hartmann_left":
+            is_open = not is_open
+
+        return b"10" if is_open else b"01"
+
+
+class PressureSimulator(DeviceSimulator):
+    """Simulates a pressure transducer.
+
+    Parameters
+    ----------
+    name
+        The name of the device.
+    device_id
+        The device identifier, which must match that of the requests.
+    pressure
+        The pressure, in torr.
+    temperature
+        The temperature, in degrees C.
+    noise
+        The relative standard deviation of the values returned.
+    kwargs
+        Other arguments to pass to `.DeviceSimulator`.
+
+    """
+
+    terminator = b"\\"
+
+    def __init__(
+        self,
+        name: str,
+        device_id: int = 253,
+        pressure: float = 1e-6,
+        temperature: float = 20.0,
+        noise: float = 0.0,
+        **kwargs,
+    ):
+        super().__init__(name, **kwargs)
+
+        self.device_id = device_id
+        self.pressure = pressure
+        self.temperature = temperature
+        self.noise = noise
+
+    async def reply(self, request: bytes, error: bool = False) -> bytes | None:
+        match = re.search(rb"@([0-9]{1,3})([PT])", request)
+        if match is None or int(match.group(1)) != self.device_id:
+            return None
+
+        if error:
+            return f"@{self.device_id}NAK160\\".encode()
+
+        value = self.pressure if match.group(2) == b"P" else self.temperature
+        if self.noise > 0:
+            value *= 1 + self.rng.gauss(0, self.noise)
+
+        return f"@{self.device_id}ACK{value:.2E}\\".encode()
+
+
+class DepthSimulator(DeviceSimulator):
+    """Simulates the server for the depth gauges.
+
+    Parameters
+    ----------
+    name
+        The name of the device.
+    depths
+        The value of each channel, in mm.
+    kwargs
+        Other arguments to pass to `.DeviceSimulator`.
+
+    """
+
+    terminator = b"\n"
+
+    def __init__(
+        self,
+        name: str = "depth",
+        depths: dict[str, float] | None = None,
+        **kwargs,
+    ):
+        super().__init__(name, **kwargs)
+
+        self.depths = depths or {"A": 1.5, "B": 1.5, "C": 1.5}
+
+    async def reply(self, request: bytes, error: bool = False) -> bytes | None:
+        match = re.search(rb"SEND ([A-Z])", request)
+        if match is None:
+            return None
+
+        channel = match.group(1).decode()
+        if error or channel not in self.depths:
+            return b"ERROR\n"
+
+        return f"{channel} {self.depths[channel]:.4f} mm\n".encode()
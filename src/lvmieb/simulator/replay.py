@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: replay.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from dataclasses import dataclass, field
+
+from typing import Any, Iterable
+
+import click
+import numpy
+
+from lvmieb.controller.recorder import WireEvent, read_journal
+from lvmieb.simulator.devices import DeviceSimulator
+from lvmieb.simulator.simulator import Simulator
+
+
+__all__ = ["replay", "summarise_replay", "get_connections"]
+
+
+@dataclass
+class _Request:
+    """A request recorded in a connection and its reply."""
+
+    time: float
+    data: bytes
+    reply: bytes = b""
+    latency: float | None = None
+
+
+@dataclass
+class _Connection:
+    """A connection recorded in a wire journal."""
+
+    id: int
+    device: str
+    start: float
+    requests: list[_Request] = field(default_factory=list)
+
+
+def get_connections(events: Iterable[WireEvent]) -> list[_Connection]:
+    """Groups the events of a wire journal by connection."""
+
+    connections: dict[int, _Connection] = {}
+
+    for event in events:
+        if event.event == "connect":
+            connection = _Connection(event.connection, event.device, event.unix_time)
+            connections[event.connection] = connection
+            continue
+
+        connection = connections.get(event.connection, None)
+        if connection is None:
+            continue
+
+        if event.event == "send":
+            connection.requests.append(_Request(event.unix_time, event.data))
+        elif event.event == "receive" and len(connection.requests) > 0:
+            request = connection.requests[-1]
+            request.reply += event.data
+            request.latency = event.unix_time - request.time
+
+    return sorted(connections.values(), key=lambda connection: connection.start)
+
+
+def get_simulated_device(simulator: Simulator, device: str) -> DeviceSimulator | None:
+    """Returns the simulated device for a device name in a wire journal."""
+
+    if device in simulator.devices:
+        return simulator.devices[device]
+
+    # Pressure transducers are recorded as <spec>.<camera>.
+    spec, _, camera = device.partition(".")
+    return simulator.devices.get(f"{spec}.pressure.{camera}", None)
+
+
+async def replay(
+    events: Iterable[WireEvent],
+    simulator: Simulator,
+    speed: float = 1.0,
+    timeout: float = 5.0,
+) -> list[dict[str, Any]]:
+    """Replays the traffic in a wire journal against a running simulator.
+
+    Each recorded connection is opened, and each request sent, at the same
+    time relative to the first connection as when it was recorded (divided by
+    ``speed``). The replies are read and timed.
+
+    Parameters
+    ----------
+    events
+        The events, as returned by `.read_journal`.
+    simulator
+        The running simulator.
+    speed
+        How much faster than recorded to replay the traffic.
+    timeout
+        How long to wait for each reply, in seconds.
+
+    Returns
+    -------
+    results
+        A list with one dictionary per request, with the device, the time of
+        the request relative to the start of the journal, the ``recorded`` and
+        ``replayed`` latencies (`None` if there was no reply), and whether the
+        reply matched the recorded one.
+
+    """
+
+    connections = get_connections(events)
+    if len(connections) == 0:
+        return []
+
+    loop = asyncio.get_running_loop()
+
+    t0 = connections[0].start
+    start = loop.time()
+
+    results: list[dict[str, Any]] = []
+
+    async def sleep_until(recorded_time: float):
+        await asyncio.sleep(max(start + (recorded_time - t0) / speed - loop.time(), 0))
+
+    async def run(connection: _Connection):
+        device = get_simulated_device(simulator, connection.device)
+        if device is None or device.host is None:
+            return
+
+        await sleep_until(connection.start)
+
+        try:
+            conn = asyncio.open_connection(device.host, device.port)
+            reader, writer = await asyncio.wait_for(conn, timeout)
+        except (OSError, asyncio.TimeoutError):
+            reader = writer = None
+
+        try:
+            for request in connection.requests:
+                await sleep_until(request.time)
+
+                result = {
+                    "device": connection.device,
+                    "connection": connection.id,
+                    "time": request.time - t0,
+                    "recorded": request.latency,
+                    "replayed": None,
+                    "match": False,
+                }
+                results.append(result)
+
+                if reader is None or writer is None:
+                    continue
+
+                writer.write(request.data)
+                await writer.drain()
+                sent = loop.time()
+
+                if request.latency is None:
+                    continue
+
+                reply = b""
+                try:
+                    while len(reply) < len(request.reply):
+                        chunk = await asyncio.wait_for(reader.read(65536), timeout)
+                        if len(chunk) == 0:
+                            break
+                        reply += chunk
+                except asyncio.TimeoutError:
+                    pass
+
+                if len(reply) > 0:
+                    result["replayed"] = loop.time() - sent
+                    result["match"] = reply == request.reply
+        finally:
+            if writer is not None:
+                writer.close()
+
+    await asyncio.gather(*[run(connection) for connection in connections])
+
+    return sorted(results, key=lambda result: result["time"])
+
+
+def summarise_replay(results: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Summarises the recorded and replayed latencies per device, in ms."""
+
+    summary: dict[str, dict[str, Any]] = {}
+
+    for device in sorted(set(result["device"] for result in results)):
+        device_results = [result for result in results if result["device"] == device]
+
+        summary[device] = {
+            "n": len(device_results),
+            "missing": sum(1 for r in device_results if r["replayed"] is None),
+            "mismatched": sum(1 for r in device_results if not r["match"]),
+        }
+
+        for key in ["recorded", "replayed"]:
+            values = [r[key] for r in device_results if r[key] is not None]
+            if len(values) == 0:
+                continue
+
+            p50, p95 = numpy.percentile(numpy.array(values) * 1000.0, [50, 95])
+            summary[device][f"{key}_p50_ms"] = float(p50)
+            summary[device][f"{key}_p95_ms"] = float(p95)
+
+    return summary
+
+
+@click.command()
+@click.argument("JOURNAL", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-c",
+    "--config",
+    "config_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="The actor configuration. Defaults to the one included with lvmieb.",
+)
+@click.option(
+    "-b",
+    "--behaviour",
+    "behaviour_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="The behaviour of the devices. Defaults to etc/simulator.yml.",
+)
+@click.option(
+    "--speed",
+    type=click.FloatRange(0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help="How much faster than recorded to replay the traffic.",
+)
+@click.option("--seed", type=int, help="Seed for the latencies and faults.")
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the results of each request to this JSON file.",
+)
+def main(
+    journal: str,
+    config_file: str | None,
+    behaviour_file: str | None,
+    speed: float,
+    seed: int | None,
+    output: str | None,
+):
+    """Replays a wire JOURNAL against the hardware simulator."""
+
+    events = list(read_journal(journal))
+
+    specs = [re.match(r"sp([0-9]+)\.", event.device) for event in events]
+    n_specs = max([int(match.group(1)) for match in specs if match], default=1)
+
+    async def run():
+        async with Simulator(
+            config=config_file,
+            n_specs=n_specs,
+            behaviour=behaviour_file,
+            seed=seed,
+        ) as simulator:
+            return await replay(events, simulator, speed=speed)
+
+    results = asyncio.run(run())
+
+    for device, summary in summarise_replay(results).items():
+        line = f"{device:<20} n={summary['n']:<6} missing={summary['missing']:<4}"
+        for key in ["recorded", "replayed"]:
+            if f"{key}_p50_ms" in summary:
+                line += (
+                    f" {key} p50={summary[f'{key}_p50_ms']:8.2f} ms"
+                    f" p95={summary[f'{key}_p95_ms']:8.2f} ms"
+                )
+        click.echo(line)
+
+    if output:
+        with open(output, "w") as fd:
+            json.dump(results, fd, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: simulator.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import os
+import pathlib
+import random
+import re
+from copy import deepcopy
+from functools import partial
+
+from typing import Any
+
+from sdsstools import read_yaml_file
+
+from lvmieb.simulator.behaviour import get_behaviour
+from lvmieb.simulator.devices import (
+    DepthSimulator,
+    DeviceSimulator,
+    MotorSimulator,
+    PressureSimulator,
+)
+from lvmieb.simulator.wago import WAGOSimulator
+
+
+__all__ = ["Simulator", "expand_specs"]
+
+
+ETC_DIR = pathlib.Path(__file__).parent / "../etc"
+
+
+def _read_config(config: dict | str | os.PathLike | None, default: str) -> dict:
+    """Reads a configuration file, or returns a copy of a configuration dict."""
+
+    if config is None:
+        config = ETC_DIR / default
+
+    if isinstance(config, (str, os.PathLike)):
+        return dict(read_yaml_file(str(config)))
+
+    return deepcopy(dict(config))
+
+
+def expand_specs(config: dict, n_specs: int | None = None) -> dict:
+    """Returns a copy of the configuration with ``n_specs`` spectrographs.
+
+    Spectrographs ``sp1`` to ``spN`` are enabled. Spectrographs that are not in
+    the configuration are copied from the first one, renaming the cameras. If
+    ``n_specs`` is `None`, the ``enabled_specs`` are not modified.
+
+    """
+
+    config = deepcopy(config)
+    specs = config.setdefault("specs", {})
+
+    if n_specs is None:
+        config.setdefault("enabled_specs", list(specs))
+        return config
+
+    if len(specs) == 0:
+        raise ValueError("The configuration does not define any spectrograph.")
+
+    template = next(iter(specs.values()))
+
+    for ii in range(1, n_specs + 1):
+        spec = f"sp{ii}"
+        if spec in specs:
+            continue
+
+        spec_config = deepcopy(template)
+        spec_config["pressure"] = {
+            re.sub("[0-9]+$", str(ii), camera): camera_config
+            for camera, camera_config in spec_config.get("pressure", {}).items()
+        }
+        specs[spec] = spec_config
+
+    config["enabled_specs"] = [f"sp{ii}" for ii in range(1, n_specs + 1)]
+
+    return config
+
+
+class Simulator:
+    """Simulates the electronics boxes of several spectrographs.
+
+    For each enabled spectrograph the simulator runs a Modbus TCP server for the
+    WAGO PLC, a server for each motor controller and pressure transducer, and a
+    single server for the depth gauges. Each device is a separate TCP server on
+    its own port; `.get_config` returns the actor configuration pointing to them.
+
+    The motor controllers only reply while their WAGO power relay is closed.
+
+    Parameters
+    ----------
+    config
+        The actor configuration, as a dictionary or the path to a YAML file.
+        Defaults to the configuration included with ``lvmieb``.
+    n_specs
+        The number of spectrographs to simulate. See `.expand_specs`.
+    behaviour
+        The behaviour of the devices (latencies, faults, motion times). A
+        dictionary or the path to a YAML file with a ``default`` section and
+        ``devices`` overrides (see `.get_behaviour`). Defaults to
+        ``etc/simulator.yml``. Use an empty dictionary for devices that reply
+        immediately and never fail.
+    host
+        The host on which the servers listen.
+    seed
+        The seed for the random number generator, for reproducible latencies
+        and faults.
+
+    """
+
+    def __init__(
+        self,
+        config: dict | str | os.PathLike | None = None,
+        n_specs: int | None = None,
+        behaviour: dict | str | os.PathLike | None = None,
+        host: str = "127.0.0.1",
+        seed: int | None = None,
+    ):
+        self.config = expand_specs(_read_config(config, "lvmieb.yml"), n_specs)
+        self.behaviour = _read_config(behaviour, "simulator.yml")
+
+        self.host = host
+        self.rng = random.Random(seed)
+
+        self.specs: list[str] = list(self.config["enabled_specs"])
+        self.devices: dict[str, DeviceSimulator] = {}
+
+        self._create_devices()
+
+    def __repr__(self):
+        return f"<Simulator ({', '.join(self.specs)})>"
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    def _add_device(self, device_class: type[DeviceSimulator], name: str, **kwargs):
+        """Creates a device and adds it to `.devices`."""
+
+        behaviour = get_behaviour(name, self.behaviour)
+        device = device_class(name, behaviour=behaviour, rng=self.rng, **kwargs)
+
+        self.devices[name] = device
+
+        return device
+
+    def _create_devices(self):
+        """Creates the simulated devices."""
+
+        wago_modules = self.config.get("wago_modules", {})
+
+        for spec in self.specs:
+            spec_config = self.config["specs"][spec]
+
+            wago = self._add_device(WAGOSimulator, f"{spec}.wago", modules=wago_modules)
+            assert isinstance(wago, WAGOSimulator)
+
+            for motor in spec_config.get("motor_controllers", {}):
+                powered = None
+                if motor.lower() in wago.devices:
+                    powered = partial(wago.get_relay, motor)
+
+                self._add_device(
+                    MotorSimulator,
+                    f"{spec}.{motor}",
+                    motor=motor,
+                    powered=powered,
+                )
+
+            for camera, camera_config in spec_config.get("pressure", {}).items():
+                self._add_device(
+                    PressureSimulator,
+                    f"{spec}.pressure.{camera}",
+                    device_id=camera_config.get("device_id", 254),
+                )
+
+        if "depth_gauges" in self.config:
+            self._add_device(DepthSimulator, "depth")
+
+    async def start(self, base_port: int | None = None):
+        """Starts the servers.
+
+        Parameters
+        ----------
+        base_port
+            If set, the servers listen on consecutive ports starting at this
+            one, in the order of `.devices`. Otherwise free ports are used.
+
+        """
+
+        for ii, device in enumerate(self.devices.values()):
+            port = 0 if base_port is None else base_port + ii
+            await device.start(self.host, port)
+
+    async def stop(self):
+        """Stops the servers."""
+
+        for device in self.devices.values():
+            await device.stop()
+
+    def get_config(self) -> dict[str, Any]:
+        """Returns the actor configuration for the simulated devices.
+
+        The servers must be running.
+
+        """
+
+        config = deepcopy(self.config)
+
+        for spec in self.specs:
+            spec_config = config["specs"][spec]
+
+            wago = self.devices[f"{spec}.wago"]
+            spec_config["wago"].update(address=wago.host, port=wago.port)
+
+            for motor, motor_config in spec_config.get("motor_controllers", {}).items():
+                device = self.devices[f"{spec}.{motor}"]
+                motor_config.update(host=device.host, port=device.port)
+
+            for camera, camera_config in spec_config.get("pressure", {}).items():
+                device = self.devices[f"{spec}.pressure.{camera}"]
+                camera_config.update(host=device.host, port=device.port)
+
+        if "depth" in self.devices:
+            depth = self.devices["depth"]
+            config["depth_gauges"].update(host=depth.host, port=depth.port)
+
+        return config
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: wago.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import struct
+
+from typing import Any, Callable, Mapping
+
+from lvmieb.simulator.devices import DeviceSimulator
+
+
+__all__ = ["WAGOSimulator"]
+
+
+# Inverses of the drift adaptors, from physical value to raw register value.
+INVERSE_ADAPTORS: dict[str, Callable[[float], int]] = {
+    "rh_dwyer": lambda value: round(value / (100.0 / (2**15 - 1))),
+    "t_dwyer": lambda value: round((value + 30.0) / (100.0 / (2**15 - 1))),
+    "rtd": lambda value: round(value / 0.1) % 2**16,
+    "rtd10": lambda value: round(value * 10.0) % 2**16,
+}
+
+# Modbus exception codes.
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_ADDRESS = 0x02
+DEVICE_FAILURE = 0x04
+
+
+class WAGOSimulator(DeviceSimulator):
+    """Simulates the WAGO PLC as a Modbus TCP server.
+
+    The coils and input registers are created from the same ``wago_modules``
+    configuration used by `.IEBWAGO`. Relays start closed (powered) and the
+    sensors start at ``temperature`` and ``humidity``.
+
+    Parameters
+    ----------
+    name
+        The name of the device.
+    modules
+        The ``wago_modules`` section of the configuration.
+    temperature
+        The initial value of the temperature sensors, in degrees C.
+    humidity
+        The initial value of the humidity sensors, in percent.
+    kwargs
+        Other arguments to pass to `.DeviceSimulator`.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        modules: Mapping[str, Any],
+        temperature: float = 10.0,
+        humidity: float = 30.0,
+        **kwargs,
+    ):
+        super().__init__(name, **kwargs)
+
+        self.coils: dict[int, bool] = {}
+        self.registers: dict[int, int] = {}
+
+        # Device name (lowercase) to its configuration.
+        self.devices: dict[str, dict[str, Any]] = {}
+
+        for module in modules.values():
+            for device_name, device in (module.get("devices", None) or {}).items():
+                device = {"mode": module.get("mode", None), **device}
+                self.devices[device_name.lower()] = device
+
+                if device["mode"] == "coil":
+                    self.coils[device["address"]] = False
+                    self.set_relay(device_name, True)
+                elif device.get("category", None) == "temperature":
+                    self.set_sensor(device_name, temperature)
+                elif device.get("category", None) == "humidity":
+                    self.set_sensor(device_name, humidity)
+                else:
+                    self.registers[device["address"]] = 0
+
+    def set_sensor(self, name: str, value: float):
+        """Sets the value of a sensor, in physical units."""
+
+        device = self.devices[name.lower()]
+
+        inverse = INVERSE_ADAPTORS.get(device.get("adaptor", None), None)
+        raw = inverse(value) if inverse else round(value)
+
+        self.registers[device["address"]] = raw
+
+    def set_relay(self, name: str, closed: bool):
+        """Closes (powers) or opens a relay."""
+
+        device = self.devices[name.lower()]
+        normally_closed = device.get("relay_type", "NC") == "NC"
+
+        self.coils[device["address"]] = closed != normally_closed
+
+    def get_relay(self, name: str) -> bool:
+        """Returns `True` if a relay is closed (powered)."""
+
+        device = self.devices[name.lower()]
+        normally_closed = device.get("relay_type", "NC") == "NC"
+
+        return self.coils[device["address"]] != normally_closed
+
+    async def read_request(self, reader: asyncio.StreamReader) -> bytes:
+        header = await reader.readexactly(7)
+        length = struct.unpack(">H", header[4:6])[0]
+
+        return header + await reader.readexactly(length - 1)
+
+    async def reply(self, request: bytes, error: bool = False) -> bytes | None:
+        transaction, _, _, unit = struct.unpack(">HHHB", request[:7])
+        pdu = request[7:]
+
+        function = pdu[0]
+
+        if error:
+            response = bytes([function | 0x80, DEVICE_FAILURE])
+        else:
+            try:
+                response = self._process(function, pdu[1:])
+            except KeyError:
+                response = bytes([function | 0x80, ILLEGAL_ADDRESS])
+
+        return struct.pack(">HHHB", transaction, 0, len(response) + 1, unit) + response
+
+    def _process(self, function: int, data: bytes) -> bytes:
+        """Processes a request PDU and returns the response PDU."""
+
+        if function in (0x01, 0x02):  # Read coils or discrete inputs.
+            address, count = struct.unpack(">HH", data[:4])
+
+            packed = bytearray((count + 7) // 8)
+            for ii in range(count):
+                if self.coils[address + ii]:
+                    packed[ii // 8] |= 1 << (ii % 8)
+
+            return bytes([function, len(packed)]) + bytes(packed)
+
+        elif function in (0x03, 0x04):  # Read holding or input registers.
+            address, count = struct.unpack(">HH", data[:4])
+
+            values = [self.registers[address + ii] for ii in range(count)]
+            payload = struct.pack(f">{count}H", *values)
+
+            return bytes([function, len(payload)]) + payload
+
+        elif function == 0x05:  # Write single coil.
+            address, value = struct.unpack(">HH", data[:4])
+            if address not in self.coils:
+                raise KeyError(address)
+
+            self.coils[address] = value == 0xFF00
+
+            return bytes([function]) + data[:4]
+
+        return bytes([function | 0x80, ILLEGAL_FUNCTION])
@@ -0,0 +1,26 @@
+# encoding: utf-8
+
+from .adaptive import AdaptiveInterval, RateEstimator
+from .alarms import AlarmEngine, AlarmRule
+from .anomaly import AnomalyDetector
+from .deadband import Deadband, DeadbandFilter
+from .leak import LeakRateEstimator, LeakRateMonitor
+from .query import aggregate, parse_duration, parse_time
+from .store import TelemetryStore
+
+
+__all__ = [
+    "AdaptiveInterval",
+    "AlarmEngine",
+    "AlarmRule",
+    "AnomalyDetector",
+    "Deadband",
+    "DeadbandFilter",
+    "LeakRateEstimator",
+    "LeakRateMonitor",
+    "RateEstimator",
+    "TelemetryStore",
+    "aggregate",
+    "parse_duration",
+    "parse_time",
+]
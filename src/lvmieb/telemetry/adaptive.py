@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: adaptive.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import math
+
+from typing import Any, Callable, Mapping
+
+
+__all__ = ["RateEstimator", "AdaptiveInterval"]
+
+
+class RateEstimator:
+    """Incrementally estimates the rate of change and the noise of a value.
+
+    The rate is an exponentially weighted moving average of the derivative
+    between consecutive samples. The noise is the moving average of the
+    absolute difference between each sample and the value predicted from the
+    previous sample and the rate. Each update is O(1).
+
+    A change larger than the noise (and the resolution) is also reported in
+    ``change_rate``, so that a sudden change is followed without waiting for
+    the moving average. Such changes are clipped in the noise estimate, so
+    that a change in trend is not mistaken for noise.
+
+    Parameters
+    ----------
+    alpha
+        The weight of the new sample in the moving averages.
+
+    """
+
+    __slots__ = ("alpha", "value", "time", "rate", "noise", "change_rate", "n_samples")
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+
+        self.value: float | None = None
+        self.time = 0.0
+        self.rate = 0.0
+        self.noise = 0.0
+        self.change_rate = 0.0
+        self.n_samples = 0
+
+    def update(self, value: float, time: float, resolution: float = 0.0):
+        """Adds a sample.
+
+        Parameters
+        ----------
+        value
+            The value.
+        time
+            The time of the sample, in seconds.
+        resolution
+            The smallest change of interest.
+
+        """
+
+        if self.value is None:
+            self.value = value
+            self.time = time
+            self.n_samples = 1
+            return
+
+        dt = time - self.time
+        if dt <= 0:
+            return
+
+        change = value - self.value
+        derivative = change / dt
+        residual = abs(value - (self.value + self.rate * dt))
+
+        threshold = max(3 * self.noise, resolution)
+        self.change_rate = abs(derivative) if abs(change) > threshold else 0.0
+
+        if self.n_samples == 1:
+            self.rate = derivative
+        else:
+            self.rate += self.alpha * (derivative - self.rate)
+            if self.n_samples > 3:
+                residual = min(residual, threshold)
+            self.noise += self.alpha * (residual - self.noise)
+
+        self.value = value
+        self.time = time
+        self.n_samples += 1
+
+
+class AdaptiveInterval:
+    """Chooses the polling interval of a source from how fast its values change.
+
+    Each value (for example, each sensor of a WAGO) has a `.RateEstimator`.
+    The interval for a value is the time it takes to change by its
+    resolution (or three times its noise, if larger), and the interval of the
+    source is the shortest of those, within ``min_interval`` and
+    ``max_interval``. The interval becomes shorter immediately when a value
+    starts changing, but grows at most by ``max_growth`` per update.
+
+    Parameters
+    ----------
+    min_interval
+        The shortest polling interval, in seconds.
+    max_interval
+        The longest polling interval, in seconds.
+    alpha
+        The weight of the new sample in the rate and noise estimates.
+    max_growth
+        The maximum factor by which the interval grows in each update.
+
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        alpha: float = 0.3,
+        max_growth: float = 1.5,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Invalid polling interval bounds.")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.alpha = alpha
+        self.max_growth = max_growth
+
+        # Poll at the shortest interval until the rates are known.
+        self.interval = min_interval
+
+        self.estimators: dict[str, RateEstimator] = {}
+
+    def get_interval(self, name: str, resolution: float) -> float:
+        """Returns the interval needed to follow a value."""
+
+        estimator = self.estimators[name]
+
+        if estimator.n_samples < 3:
+            return self.min_interval
+
+        speed = max(abs(estimator.rate), estimator.change_rate)
+        step = max(resolution, 3 * estimator.noise)
+
+        if speed == 0:
+            return self.max_interval
+        elif step == 0:
+            return self.min_interval
+
+        return step / speed
+
+    def update(
+        self,
+        values: Mapping[str, Any],
+        time: float,
+        resolution: Callable[[str, float], float] | None = None,
+    ) -> float:
+        """Updates the estimates with new values and returns the next interval.
+
+        Parameters
+        ----------
+        values
+            A mapping of name to value. Values that are not finite numbers are
+            ignored.
+        time
+            The time of the values, in seconds.
+        resolution
+            A function that receives the name and value and returns the
+            smallest change of interest. Defaults to zero (any change).
+
+        """
+
+        interval = self.max_interval
+
+        for name, value in values.items():
+            if (
+                not isinstance(value, (int, float))
+                or isinstance(value, bool)
+                or not math.isfinite(value)
+            ):
+                continue
+
+            value_resolution = 0.0 if resolution is None else resolution(name, value)
+
+            estimator = self.estimators.get(name, None)
+            if estimator is None:
+                estimator = self.estimators[name] = RateEstimator(self.alpha)
+            estimator.update(value, time, value_resolution)
+
+            interval = min(interval, self.get_interval(name, value_resolution))
+
+        interval = min(interval, self.interval * self.max_growth)
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+
+        return self.interval
@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: alarms.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import fnmatch
+import math
+import time
+from dataclasses import dataclass
+
+from typing import Any
+
+import numpy
+
+
+__all__ = ["AlarmRule", "AlarmEngine"]
+
+
+# Reasons for an alarm, in order of precedence.
+REASONS = ["state", "max", "min", "rate"]
+
+
+@dataclass
+class AlarmRule:
+    """A rule that raises an alarm when a value is out of its limits.
+
+    Parameters
+    ----------
+    name
+        The name of the rule.
+    channels
+        One or more `fnmatch` patterns for the ``<keyword>.<field>`` values to
+        which the rule applies, for example ``sp*_sensors.rtd1``.
+    min
+        The alarm is raised if the value is below this limit.
+    max
+        The alarm is raised if the value is above this limit.
+    max_rate
+        The alarm is raised if the value changes faster than this, per second.
+        The rate is measured over the ``rate_interval`` of the `.AlarmEngine`.
+    hysteresis
+        Once raised, a ``min`` or ``max`` alarm is only cleared when the value
+        is within the limits by more than this amount.
+    rate_hysteresis
+        Once raised, a ``max_rate`` alarm is only cleared when the rate is
+        below ``max_rate`` by more than this amount, per second.
+    expected
+        The alarm is raised if the value is not this. Used for boolean states,
+        for example that a relay is closed.
+    severity
+        The severity of the alarm, ``warning`` or ``error``.
+
+    """
+
+    name: str
+    channels: str | list[str]
+    min: float | None = None
+    max: float | None = None
+    max_rate: float | None = None
+    hysteresis: float = 0.0
+    rate_hysteresis: float = 0.0
+    expected: bool | float | None = None
+    severity: str = "warning"
+
+    def __post_init__(self):
+        if isinstance(self.channels, str):
+            self.channels = [self.channels]
+
+        if self.severity not in ["warning", "error"]:
+            raise ValueError(f"Invalid severity {self.severity!r} in {self.name!r}.")
+
+    def matches(self, name: str) -> bool:
+        """Whether the rule applies to a ``<keyword>.<field>``."""
+
+        return any(fnmatch.fnmatchcase(name, pattern) for pattern in self.channels)
+
+
+class AlarmEngine:
+    """Evaluates the alarm rules on the values of the status keywords.
+
+    Each pair of rule and channel (a ``<keyword>.<field>`` to which the rule
+    applies) is a row in a set of arrays with the limits and the state of the
+    alarm. Pairs are added the first time a channel is seen, so the rules
+    apply to any number of spectrographs. `.evaluate` then checks all the
+    pairs for the values in a message at once, with NumPy, so the cost of a
+    poll cycle grows little with the number of rules and channels.
+
+    Booleans are compared as 0 and 1. Values that are not numbers or are NaN
+    (for example a failed read) do not change the state of the alarms.
+
+    Values arrive at irregular intervals (from the status commands and the
+    telemetry publisher), so the rate of change of a channel is not measured
+    between consecutive values, which would amplify the quantisation noise.
+    Instead, it is measured from a reference value at least ``rate_interval``
+    seconds old, which then becomes the new reference. The rate is kept until
+    the next measurement.
+
+    Parameters
+    ----------
+    rules
+        The list of `.AlarmRule` to evaluate.
+    rate_interval
+        The minimum time, in seconds, over which rates are measured.
+
+    """
+
+    def __init__(self, rules: list[AlarmRule] = [], rate_interval: float = 60.0):
+        self.rules = list(rules)
+        self.rate_interval = rate_interval
+
+        # Index of each channel, the reference value and time used to measure
+        # its rate of change, and the last rate measured.
+        self.channels: dict[str, int] = {}
+        self._unmatched: set[str] = set()
+        self._ref_value = numpy.zeros(0, dtype=numpy.float64)
+        self._ref_time = numpy.zeros(0, dtype=numpy.float64)
+        self._rate = numpy.zeros(0, dtype=numpy.float64)
+
+        # One element per pair of rule and channel.
+        self._channel = numpy.zeros(0, dtype=numpy.intp)
+        self._rule = numpy.zeros(0, dtype=numpy.intp)
+        self._lower = numpy.zeros(0, dtype=numpy.float64)
+        self._upper = numpy.zeros(0, dtype=numpy.float64)
+        self._max_rate = numpy.zeros(0, dtype=numpy.float64)
+        self._hysteresis = numpy.zeros(0, dtype=numpy.float64)
+        self._rate_hysteresis = numpy.zeros(0, dtype=numpy.float64)
+        self._expected = numpy.zeros(0, dtype=numpy.float64)
+        self._active = numpy.zeros(0, dtype=bool)
+        self._reason = numpy.zeros(0, dtype=numpy.int8)
+        self._value = numpy.zeros(0, dtype=numpy.float64)
+        self._since = numpy.zeros(0, dtype=numpy.float64)
+
+        self._names: list[str] = []
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]):
+        """Creates an engine from a configuration dictionary.
+
+        The dictionary can contain an ``enabled`` flag (default `True`), the
+        ``rate_interval``, and a ``rules`` mapping of rule name to the
+        parameters of `.AlarmRule`.
+
+        """
+
+        if not config.get("enabled", True):
+            return cls()
+
+        return cls(
+            [
+                AlarmRule(name=name, **(params or {}))
+                for name, params in config.get("rules", {}).items()
+            ],
+            rate_interval=config.get("rate_interval", 60.0),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether there are rules to evaluate."""
+
+        return len(self.rules) > 0
+
+    def add_channel(self, name: str) -> int | None:
+        """Adds a channel and its rules. Returns `None` if no rule applies."""
+
+        rules = [ii for ii, rule in enumerate(self.rules) if rule.matches(name)]
+        if len(rules) == 0:
+            self._unmatched.add(name)
+            return None
+
+        index = len(self.channels)
+        self.channels[name] = index
+        self._names.append(name)
+        self._ref_value = numpy.append(self._ref_value, numpy.nan)
+        self._ref_time = numpy.append(self._ref_time, numpy.nan)
+        self._rate = numpy.append(self._rate, numpy.nan)
+
+        def _limit(value: Any, default: float) -> float:
+            return default if value is None else float(value)
+
+        n_pairs = len(rules)
+        selected = [self.rules[ii] for ii in rules]
+
+        arrays = {
+            "_channel": numpy.full(n_pairs, index),
+            "_rule": numpy.array(rules),
+            "_lower": [_limit(rule.min, -numpy.inf) for rule in selected],
+            "_upper": [_limit(rule.max, numpy.inf) for rule in selected],
+            "_max_rate": [_limit(rule.max_rate, numpy.inf) for rule in selected],
+            "_hysteresis": [rule.hysteresis for rule in selected],
+            "_rate_hysteresis": [rule.rate_hysteresis for rule in selected],
+            "_expected": [_limit(rule.expected, numpy.nan) for rule in selected],
+            "_active": numpy.zeros(n_pairs, dtype=bool),
+            "_reason": numpy.zeros(n_pairs, dtype=numpy.int8),
+            "_value": numpy.full(n_pairs, numpy.nan),
+            "_since": numpy.full(n_pairs, numpy.nan),
+        }
+
+        for attribute, values in arrays.items():
+            current = getattr(self, attribute)
+            new = numpy.asarray(values, dtype=current.dtype)
+            setattr(self, attribute, numpy.concatenate([current, new]))
+
+        return index
+
+    def _get_alarm(self, pair: int) -> dict[str, Any]:
+        """Returns the description of the alarm for a pair."""
+
+        rule = self.rules[self._rule[pair]]
+
+        value = float(self._value[pair])
+        if rule.expected is not None and isinstance(rule.expected, bool):
+            value = bool(value)
+
+        return {
+            "rule": rule.name,
+            "channel": self._names[self._channel[pair]],
+            "severity": rule.severity,
+            "active": bool(self._active[pair]),
+            "reason": REASONS[self._reason[pair]],
+            "value": value,
+            "since": float(self._since[pair]),
+        }
+
+    def evaluate(
+        self,
+        message: dict[str, Any],
+        now: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Evaluates the rules for the values in a message.
+
+        Parameters
+        ----------
+        message
+            A mapping of keyword to a mapping of field to value, as returned by
+            the status commands.
+        now
+            The time of the values. Defaults to `time.time`.
+
+        Returns
+        -------
+        alarms
+            The alarms that have been raised or cleared. Each alarm is a
+            dictionary with the ``rule``, ``channel``, ``severity``, whether it
+            is ``active``, the ``reason`` (``state``, ``max``, ``min``, or
+            ``rate``), the ``value``, and the time ``since`` it was raised.
+
+        """
+
+        if not self.enabled:
+            return []
+
+        now = time.time() if now is None else now
+
+        indices: list[int] = []
+        values: list[float] = []
+
+        for keyword, fields in message.items():
+            if not isinstance(fields, dict):
+                continue
+
+            for field, value in fields.items():
+                if not isinstance(value, (int, float)):
+                    continue
+
+                name = f"{keyword}.{field}"
+                index = self.channels.get(name, None)
+                if index is None:
+                    if name in self._unmatched:
+                        continue
+                    index = self.add_channel(name)
+                    if index is None:
+                        continue
+
+                value = float(value)
+                if not math.isnan(value):
+                    indices.append(index)
+                    values.append(value)
+
+        if len(indices) == 0:
+            return []
+
+        # Values and rates of change of the channels in the message.
+        index_array = numpy.array(indices, dtype=numpy.intp)
+        value_array = numpy.array(values, dtype=numpy.float64)
+
+        current = numpy.full(len(self.channels), numpy.nan)
+        current[index_array] = value_array
+
+        # Measure the rates of the channels whose reference is old enough.
+        elapsed = now - self._ref_time[index_array]
+        measured = elapsed >= self.rate_interval
+        new_reference = measured | ~(elapsed >= 0)
+
+        self._rate[index_array[measured]] = (
+            value_array[measured] - self._ref_value[index_array[measured]]
+        ) / elapsed[measured]
+        self._ref_value[index_array[new_reference]] = value_array[new_reference]
+        self._ref_time[index_array[new_reference]] = now
+
+        # Evaluate all the rule and channel pairs.
+        value = current[self._channel]
+        present = ~numpy.isnan(value)
+        rate = self._rate[self._channel]
+
+        active = self._active
+        hysteresis = numpy.where(active, self._hysteresis, 0.0)
+        rate_hysteresis = numpy.where(active, self._rate_hysteresis, 0.0)
+
+        expected = ~numpy.isnan(self._expected)
+        violations = numpy.stack(
+            [
+                expected & (value != self._expected),
+                value > self._upper - hysteresis,
+                value < self._lower + hysteresis,
+                numpy.abs(rate) > self._max_rate - rate_hysteresis,
+            ]
+        )
+
+        violated = violations.any(axis=0)
+        new_active = numpy.where(present, violated, active)
+        changed = numpy.flatnonzero(new_active != active)
+
+        self._value[present] = value[present]
+
+        if len(changed) == 0:
+            return []
+
+        raised = changed[new_active[changed]]
+        self._reason[raised] = violations[:, raised].argmax(axis=0)
+        self._since[raised] = now
+
+        self._active = new_active
+
+        return [self._get_alarm(pair) for pair in changed]
+
+    def get_active(self) -> list[dict[str, Any]]:
+        """Returns the active alarms."""
+
+        return [self._get_alarm(pair) for pair in numpy.flatnonzero(self._active)]
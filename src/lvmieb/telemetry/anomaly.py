@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: anomaly.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import math
+import time
+
+from typing import Any, Mapping
+
+import numpy
+
+
+__all__ = ["AnomalyDetector"]
+
+
+# Factor that converts the median absolute deviation to a standard deviation
+# for normally distributed values.
+MAD_SCALE = 1.4826
+
+
+class AnomalyDetector:
+    """Flags outliers in a set of channels using a rolling robust z-score.
+
+    The last ``window`` values of each channel are kept in a fixed-size NumPy
+    ring buffer. Each new value is compared with the median of the values in
+    the window, in units of their median absolute deviation (scaled to a
+    standard deviation), and is anomalous if the absolute z-score exceeds
+    ``threshold``. The cost of an update is proportional to ``window`` and the
+    number of values in it, so it is constant for each sample regardless of
+    how long the detector has been running.
+
+    The median and the deviation are barely affected by isolated outliers,
+    so noise spikes (for example from a failing humidity probe or RTD) stand
+    out even before they change the average value. A change of level is
+    absorbed once it fills half of the window.
+
+    As with the `.AlarmEngine`, the anomaly of each channel is latched: it is
+    reported when it is raised, and again when it is cleared because the
+    absolute z-score has dropped to ``threshold - hysteresis`` or below, but
+    not for every anomalous value in between.
+
+    The sensors are read by several commands and pollers, so the values of a
+    channel are only added to the window if at least ``sample_interval``
+    seconds have passed since the last one. The window then spans at least
+    ``window * sample_interval`` seconds, regardless of how often the sensors
+    are read.
+
+    Parameters
+    ----------
+    window
+        The number of samples of each channel in the window.
+    threshold
+        The absolute z-score above which a value is anomalous.
+    min_samples
+        The minimum number of samples in the window to evaluate a value.
+    min_scale
+        The minimum scale (deviation) of a channel, in the units of the
+        channel. Avoids flagging single quantisation steps when a channel has
+        been constant.
+    hysteresis
+        Once raised, an anomaly is only cleared when the absolute z-score is
+        below ``threshold`` by at least this amount.
+    sample_interval
+        The minimum time, in seconds, between the samples of a channel. Values
+        received sooner are ignored.
+
+    """
+
+    def __init__(
+        self,
+        window: int = 60,
+        threshold: float = 5.0,
+        min_samples: int = 20,
+        min_scale: float = 0.01,
+        hysteresis: float = 1.0,
+        sample_interval: float = 0.0,
+    ):
+        if window < 3 or not 1 <= min_samples <= window:
+            raise ValueError("Invalid window or min_samples.")
+        if min_scale <= 0:
+            raise ValueError("min_scale must be positive.")
+        if not 0 <= hysteresis < threshold:
+            raise ValueError("hysteresis must be between 0 and threshold.")
+
+        self.window = window
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.min_scale = min_scale
+        self.hysteresis = hysteresis
+        self.sample_interval = sample_interval
+
+        self.channels: dict[str, int] = {}
+
+        # One row per channel.
+        self._values = numpy.full((0, window), numpy.nan)
+        self._flags = numpy.zeros((0, window), dtype=bool)
+        self._position = numpy.zeros(0, dtype=numpy.intp)
+        self._count = numpy.zeros(0, dtype=numpy.intp)
+        self._last_sample = numpy.zeros(0)
+        self._active = numpy.zeros(0, dtype=bool)
+
+        # Statistics of the last value of each channel.
+        self._zscore = numpy.zeros(0)
+        self._median = numpy.zeros(0)
+        self._scale = numpy.zeros(0)
+        self._last_anomaly = numpy.zeros(0)
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> AnomalyDetector | None:
+        """Creates a detector from a configuration dictionary.
+
+        Returns `None` if the configuration is not ``enabled``. Other keys are
+        passed to the constructor.
+
+        """
+
+        config = config.copy()
+        if not config.pop("enabled", False):
+            return None
+
+        return cls(**config)
+
+    def _add_channels(self, names: list[str]):
+        """Adds channels."""
+
+        n_new = len(names)
+        for name in names:
+            self.channels[name] = len(self.channels)
+
+        self._values = numpy.vstack(
+            [self._values, numpy.full((n_new, self.window), numpy.nan)]
+        )
+        self._flags = numpy.vstack(
+            [self._flags, numpy.zeros((n_new, self.window), dtype=bool)]
+        )
+
+        for attribute, fill in [
+            ("_position", 0),
+            ("_count", 0),
+            ("_last_sample", numpy.nan),
+            ("_active", False),
+            ("_zscore", numpy.nan),
+            ("_median", numpy.nan),
+            ("_scale", numpy.nan),
+            ("_last_anomaly", numpy.nan),
+        ]:
+            current = getattr(self, attribute)
+            new = numpy.full(n_new, fill, dtype=current.dtype)
+            setattr(self, attribute, numpy.concatenate([current, new]))
+
+    def update(
+        self,
+        values: Mapping[str, Any],
+        now: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """Evaluates and adds a sample of some or all of the channels.
+
+        Parameters
+        ----------
+        values
+            A mapping of channel name to value. Values that are not finite
+            numbers (for example a failed read) are ignored.
+        now
+            The time of the sample. Defaults to `time.time`.
+
+        Returns
+        -------
+        anomalies
+            The anomalies that have been raised or cleared. Each one is a
+            dictionary with the ``channel``, whether the anomaly is ``active``,
+            the ``value``, the ``median`` and ``scale`` of the window, the
+            ``zscore``, and the number of ``anomalies`` in the window.
+
+        """
+
+        now = time.time() if now is None else now
+
+        names = [
+            name
+            for name, value in values.items()
+            if isinstance(value, (int, float))
+            and not isinstance(value, bool)
+            and math.isfinite(value)
+        ]
+        if len(names) == 0:
+            return []
+
+        new_names = [name for name in names if name not in self.channels]
+        if len(new_names) > 0:
+            self._add_channels(new_names)
+
+        index = numpy.array([self.channels[name] for name in names])
+        value = numpy.array([values[name] for name in names], dtype=numpy.float64)
+
+        # Ignore the channels sampled less than sample_interval ago. If the clock
+        # has gone back, accept the sample.
+        elapsed = now - self._last_sample[index]
+        sampled = ~((elapsed >= 0) & (elapsed < self.sample_interval))
+        if not sampled.all():
+            names = [name for name, keep in zip(names, sampled) if keep]
+            index = index[sampled]
+            value = value[sampled]
+            if len(names) == 0:
+                return []
+
+        # Compare the values with the windows before adding them.
+        ready = self._count[index] >= self.min_samples
+        zscore = numpy.full(len(index), numpy.nan)
+        median = numpy.full(len(index), numpy.nan)
+        scale = numpy.full(len(index), numpy.nan)
+
+        if ready.any():
+            window = self._values[index[ready]]
+            median[ready] = numpy.nanmedian(window, axis=1)
+            deviation = numpy.abs(window - median[ready, None])
+            scale[ready] = numpy.maximum(
+                MAD_SCALE * numpy.nanmedian(deviation, axis=1),
+                self.min_scale,
+            )
+            zscore[ready] = (value[ready] - median[ready]) / scale[ready]
+
+        anomalous = ready & (numpy.abs(zscore) > self.threshold)
+
+        active = self._active[index]
+        raised = anomalous & ~active
+        cleared = active & (numpy.abs(zscore) <= self.threshold - self.hysteresis)
+        self._active[index[raised]] = True
+        self._active[index[cleared]] = False
+
+        position = self._position[index]
+        self._values[index, position] = value
+        self._flags[index, position] = anomalous
+        self._position[index] = (position + 1) % self.window
+        self._count[index] = numpy.minimum(self._count[index] + 1, self.window)
+        self._last_sample[index] = now
+
+        self._zscore[index] = zscore
+        self._median[index] = median
+        self._scale[index] = scale
+        self._last_anomaly[index[anomalous]] = now
+
+        n_anomalies = self._flags[index].sum(axis=1)
+
+        return [
+            {
+                "channel": names[ii],
+                "active": bool(raised[ii]),
+                "value": float(value[ii]),
+                "median": float(median[ii]),
+                "scale": float(scale[ii]),
+                "zscore": float(zscore[ii]),
+                "anomalies": int(n_anomalies[ii]),
+            }
+            for ii in numpy.flatnonzero(raised | cleared)
+        ]
+
+    def get_status(self, channels: list[str] | None = None) -> dict[str, Any]:
+        """Returns the statistics of each channel.
+
+        For each channel, returns the ``zscore``, ``median``, and ``scale`` of
+        the last value (`None` if there were not enough samples), the number
+        of samples in the window, the number of ``anomalies`` in the window,
+        whether an anomaly is ``active``, and the time of the
+        ``last_anomaly``.
+
+        """
+
+        def _float(value: float) -> float | None:
+            return None if math.isnan(value) else float(value)
+
+        names = list(self.channels) if channels is None else channels
+
+        status: dict[str, Any] = {}
+        for name in names:
+            if name not in self.channels:
+                continue
+
+            ii = self.channels[name]
+            status[name] = {
+                "zscore": _float(self._zscore[ii]),
+                "median": _float(self._median[ii]),
+                "scale": _float(self._scale[ii]),
+                "n_samples": int(self._count[ii]),
+                "anomalies": int(self._flags[ii].sum()),
+                "active": bool(self._active[ii]),
+                "last_anomaly": _float(self._last_anomaly[ii]),
+            }
+
+        return status
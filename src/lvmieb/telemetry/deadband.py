@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: deadband.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import fnmatch
+import math
+import time
+from dataclasses import dataclass
+
+from typing import Any
+
+
+__all__ = ["Deadband", "DeadbandFilter"]
+
+
+@dataclass
+class Deadband:
+    """The minimum change for a value to be considered significant.
+
+    A numeric value is significant if it differs from the last published value
+    by more than both ``absolute`` and ``relative`` times the last published
+    value. Other values are significant whenever they change.
+
+    Parameters
+    ----------
+    absolute
+        The absolute deadband.
+    relative
+        The deadband as a fraction of the last published value.
+    max_silence
+        If set, the value is republished after this many seconds even if it
+        has not changed.
+
+    """
+
+    absolute: float = 0.0
+    relative: float = 0.0
+    max_silence: float | None = None
+
+    def is_significant(self, value: Any, last: Any) -> bool:
+        """Determines whether the change from ``last`` to ``value`` is significant."""
+
+        numeric = (int, float)
+        if (
+            not isinstance(value, numeric)
+            or not isinstance(last, numeric)
+            or isinstance(value, bool)
+            or isinstance(last, bool)
+        ):
+            return value != last
+
+        if math.isnan(value) or math.isnan(last):
+            return not (math.isnan(value) and math.isnan(last))
+
+        threshold = max(self.absolute, self.relative * abs(last))
+
+        return abs(value - last) > threshold
+
+
+class DeadbandFilter:
+    """Decides which keywords have changed enough to be published.
+
+    Each keyword is a mapping of fields to values (for example the
+    ``sp1_sensors`` keyword). Each field has a deadband that is determined by
+    matching ``<keyword>.<field>`` against the patterns in ``deadbands``; the
+    first matching pattern is used. A keyword is published, with all its
+    fields, if any of its fields has changed by more than its deadband.
+
+    Parameters
+    ----------
+    deadbands
+        A mapping of `fnmatch` patterns to `.Deadband` instances.
+    default
+        The deadband used for fields that do not match any pattern. Defaults
+        to publishing any change.
+
+    """
+
+    def __init__(
+        self,
+        deadbands: dict[str, Deadband] = {},
+        default: Deadband | None = None,
+    ):
+        self.deadbands = deadbands.copy()
+        self.default = default or Deadband()
+
+        # Last published value and time for each <keyword>.<field>.
+        self.published: dict[str, tuple[Any, float]] = {}
+
+        self._cache: dict[str, Deadband] = {}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]):
+        """Creates a filter from a configuration dictionary.
+
+        The dictionary can contain a ``default`` deadband, a global
+        ``max_silence``, and a ``deadbands`` mapping of patterns to deadbands.
+        Deadbands are mappings with ``absolute``, ``relative``, and
+        ``max_silence`` keys.
+
+        """
+
+        max_silence = config.get("max_silence", None)
+
+        def _deadband(values: dict[str, Any]) -> Deadband:
+            return Deadband(**{"max_silence": max_silence, **(values or {})})
+
+        return cls(
+            deadbands={
+                pattern: _deadband(values)
+                for pattern, values in config.get("deadbands", {}).items()
+            },
+            default=_deadband(config.get("default", {})),
+        )
+
+    def get_deadband(self, name: str) -> Deadband:
+        """Returns the deadband for a ``<keyword>.<field>`` name."""
+
+        if name not in self._cache:
+            for pattern, deadband in self.deadbands.items():
+                if fnmatch.fnmatchcase(name, pattern):
+                    self._cache[name] = deadband
+                    break
+            else:
+                self._cache[name] = self.default
+
+        return self._cache[name]
+
+    def filter(
+        self,
+        message: dict[str, dict[str, Any]],
+        now: float | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Returns the keywords in a message that must be published.
+
+        A keyword is returned complete if any of its fields is significant, so
+        that the published keywords have the same fields as those output by
+        the status commands. The fields of the keywords returned are considered
+        published and become the reference for future calls.
+
+        Parameters
+        ----------
+        message
+            A mapping of keyword to a mapping of field to value.
+        now
+            The current time. Defaults to `time.time`.
+
+        """
+
+        now = time.time() if now is None else now
+
+        output: dict[str, dict[str, Any]] = {}
+
+        for keyword, fields in message.items():
+            for field, value in fields.items():
+                if self.is_significant(f"{keyword}.{field}", value, now):
+                    break
+            else:
+                continue
+
+            for field, value in fields.items():
+                self.published[f"{keyword}.{field}"] = (value, now)
+            output[keyword] = fields
+
+        return output
+
+    def is_significant(self, name: str, value: Any, now: float) -> bool:
+        """Whether a ``<keyword>.<field>`` value must be published."""
+
+        if name not in self.published:
+            return True
+
+        last, last_time = self.published[name]
+        deadband = self.get_deadband(name)
+        silence = deadband.max_silence
+
+        if deadband.is_significant(value, last):
+            return True
+
+        return silence is not None and now - last_time >= silence
+
+    def reset(self):
+        """Forgets the published values. The next call publishes everything."""
+
+        self.published.clear()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: leak.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+from typing import Any, Mapping
+
+
+__all__ = ["LeakRateEstimator", "LeakRateMonitor"]
+
+
+class LeakRateEstimator:
+    """A rolling linear fit of the logarithm of the pressure against time.
+
+    The fit uses the samples from the last ``window`` seconds. The sums of the
+    least-squares fit are updated as samples are added and removed, so each
+    update is O(1) (amortised) regardless of the number of samples in the
+    window. Times are relative to a reference that is moved forward when the
+    sums are periodically recomputed, to avoid loss of precision.
+
+    Parameters
+    ----------
+    window
+        The length of the fitting window, in seconds.
+    min_samples
+        The minimum number of samples in the window to report a rate.
+
+    """
+
+    # Number of updates after which the sums are recomputed from the samples.
+    RECOMPUTE = 10000
+
+    def __init__(self, window: float = 1800.0, min_samples: int = 5):
+        self.window = window
+        self.min_samples = min_samples
+
+        self.samples: deque[tuple[float, float]] = deque()
+        self.reference: float | None = None
+
+        self._n_updates = 0
+        self._reset_sums()
+
+    def _reset_sums(self):
+        self._st = 0.0
+        self._sy = 0.0
+        self._stt = 0.0
+        self._sty = 0.0
+
+    def _recompute(self):
+        """Recomputes the sums from the samples, moving the reference time."""
+
+        self._reset_sums()
+        self.reference = self.samples[0][0] if len(self.samples) > 0 else None
+
+        for time, log_pressure in self.samples:
+            self._add(time, log_pressure, 1)
+
+        self._n_updates = 0
+
+    def _add(self, time: float, log_pressure: float, sign: int):
+        assert self.reference is not None
+
+        t = time - self.reference
+        self._st += sign * t
+        self._sy += sign * log_pressure
+        self._stt += sign * t * t
+        self._sty += sign * t * log_pressure
+
+    def update(self, pressure: float, time: float):
+        """Adds a sample. Pressures that are not positive are ignored."""
+
+        if not math.isfinite(pressure) or pressure <= 0:
+            return
+
+        if len(self.samples) > 0 and time <= self.samples[-1][0]:
+            return
+
+        if self.reference is None:
+            self.reference = time
+
+        log_pressure = math.log(pressure)
+        self.samples.append((time, log_pressure))
+        self._add(time, log_pressure, 1)
+
+        while self.samples[0][0] < time - self.window:
+            self._add(*self.samples.popleft(), -1)
+
+        self._n_updates += 1
+        if self._n_updates >= self.RECOMPUTE:
+            self._recompute()
+
+    def fit(self) -> tuple[float, float] | None:
+        """Returns the slope and intercept of the fit of log-pressure vs time.
+
+        The intercept is at the reference time. Returns `None` if there are
+        not enough samples.
+
+        """
+
+        n = len(self.samples)
+        if n < max(self.min_samples, 2):
+            return None
+
+        denominator = n * self._stt - self._st**2
+        if denominator <= 0:
+            return None
+
+        slope = (n * self._sty - self._st * self._sy) / denominator
+        intercept = (self._sy - slope * self._st) / n
+
+        return slope, intercept
+
+    def get_status(
+        self,
+        time: float | None = None,
+        max_pressure: float | None = None,
+        target_pressure: float | None = None,
+    ) -> dict[str, Any] | None:
+        """Returns the current leak or pump rate.
+
+        Parameters
+        ----------
+        time
+            The time at which to evaluate the fit. Defaults to the time of the
+            last sample.
+        max_pressure
+            The pressure for which to project the time if the pressure is
+            rising.
+        target_pressure
+            The pressure for which to project the time if the pressure is
+            falling.
+
+        Returns
+        -------
+        status
+            A dictionary with the fitted ``pressure``, the ``rate`` of change of
+            the pressure per second (positive for a leak, negative while
+            pumping), the ``log_rate`` (the fractional change per second), the
+            ``threshold`` towards which the pressure is moving and the
+            ``time_to_threshold`` in seconds (0 if it has been reached, `None`
+            if unknown), and the number of samples and time span of the fit.
+            `None` if there are not enough samples.
+
+        """
+
+        result = self.fit()
+        if result is None:
+            return None
+
+        assert self.reference is not None
+
+        slope, intercept = result
+        time = self.samples[-1][0] if time is None else time
+
+        log_pressure = intercept + slope * (time - self.reference)
+        pressure = math.exp(log_pressure)
+
+        threshold = None
+        if slope > 0:
+            threshold = max_pressure
+        elif slope < 0:
+            threshold = target_pressure
+
+        time_to_threshold = None
+        if threshold is not None and threshold > 0:
+            time_to_threshold = max((math.log(threshold) - log_pressure) / slope, 0.0)
+
+        return {
+            "pressure": pressure,
+            "rate": pressure * slope,
+            "log_rate": slope,
+            "threshold": threshold,
+            "time_to_threshold": time_to_threshold,
+            "n_samples": len(self.samples),
+            "span": self.samples[-1][0] - self.samples[0][0],
+        }
+
+
+class LeakRateMonitor:
+    """Tracks the leak or pump rate of each pressure transducer.
+
+    Parameters
+    ----------
+    window
+        The length of the fitting window, in seconds.
+    min_samples
+        The minimum number of samples in the window to report a rate.
+    max_pressure
+        The pressure for which to project the time while the pressure rises.
+    target_pressure
+        The pressure for which to project the time while the pressure falls.
+
+    """
+
+    def __init__(
+        self,
+        window: float = 1800.0,
+        min_samples: int = 5,
+        max_pressure: float | None = None,
+        target_pressure: float | None = None,
+    ):
+        self.window = window
+        self.min_samples = min_samples
+        self.max_pressure = max_pressure
+        self.target_pressure = target_pressure
+
+        self.estimators: dict[str, LeakRateEstimator] = {}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> LeakRateMonitor:
+        """Creates a monitor from a configuration dictionary.
+
+        The keys are passed to the constructor.
+
+        """
+
+        return cls(**config)
+
+    def update(self, values: Mapping[str, float], time: float):
+        """Adds the ``<camera>_pressure`` values, as in the ``transducer`` keyword.
+
+        Other values are ignored.
+
+        """
+
+        for name, value in values.items():
+            camera, _, measurement = name.partition("_")
+            if measurement != "pressure":
+                continue
+
+            estimator = self.estimators.get(camera, None)
+            if estimator is None:
+                estimator = LeakRateEstimator(self.window, self.min_samples)
+                self.estimators[camera] = estimator
+
+            estimator.update(value, time)
+
+    def get_status(
+        self,
+        cameras: list[str] | None = None,
+    ) -> dict[str, dict[str, Any] | None]:
+        """Returns the status of each camera. See `.LeakRateEstimator.get_status`."""
+
+        cameras = list(self.estimators) if cameras is None else cameras
+
+        return {
+            camera: self.estimators[camera].get_status(
+                max_pressure=self.max_pressure,
+                target_pressure=self.target_pressure,
+            )
+            if camera in self.estimators
+            else None
+            for camera in cameras
+        }
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: query.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import datetime
+import re
+import time
+
+import numpy
+
+from lvmieb.exceptions import LvmIebError
+
+
+__all__ = ["aggregate", "parse_duration", "parse_time"]
+
+
+DURATION_RE = re.compile(r"^\s*([0-9]*\.?[0-9]+)\s*([smhd]?)\s*$")
+DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_duration(value: str | float) -> float:
+    """Parses a duration such as ``90``, ``60s``, ``5m``, ``2h``, or ``1d``.
+
+    Returns the duration in seconds.
+
+    """
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    match = DURATION_RE.match(value)
+    if match is None:
+        raise LvmIebError(f"Invalid duration {value!r}.")
+
+    return float(match.group(1)) * DURATION_UNITS[match.group(2)]
+
+
+def parse_time(value: str | float, now: float | None = None) -> float:
+    """Parses a time and returns the corresponding UNIX time.
+
+    Parameters
+    ----------
+    value
+        Either a UNIX time, an ISO 8601 date (UTC if the time zone is not
+        specified), or a duration (see `.parse_duration`) which is interpreted
+        as a time in the past relative to ``now``.
+    now
+        The current UNIX time. Defaults to `time.time`.
+
+    """
+
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    now = time.time() if now is None else now
+
+    # A bare number larger than a year in seconds is a UNIX time.
+    try:
+        number = float(value)
+        return number if number > 365 * 86400 else now - number
+    except ValueError:
+        pass
+
+    if DURATION_RE.match(value):
+        return now - parse_duration(value)
+
+    try:
+        date = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise LvmIebError(f"Invalid time {value!r}.")
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+
+    return date.timestamp()
+
+
+def aggregate(
+    timestamps: numpy.ndarray,
+    values: numpy.ndarray,
+    bin_size: float,
+) -> dict[str, numpy.ndarray]:
+    """Downsamples a time series into bins of fixed size.
+
+    NaN values are ignored. Bins are aligned to multiples of ``bin_size`` (in
+    UNIX time) and bins without samples are not returned. The samples must be
+    sorted by time.
+
+    Parameters
+    ----------
+    timestamps
+        The UNIX time of each sample.
+    values
+        The values of the samples.
+    bin_size
+        The size of the bins, in seconds.
+
+    Returns
+    -------
+    bins
+        A dictionary with the start time of each bin (``time``), the number of
+        samples in the bin (``count``), and the ``min``, ``mean``, ``max``, and
+        ``last`` value.
+
+    """
+
+    if bin_size <= 0:
+        raise LvmIebError("The bin size must be positive.")
+
+    valid = ~numpy.isnan(values)
+    timestamps = timestamps[valid]
+    values = values[valid]
+
+    if len(values) == 0:
+        empty = numpy.array([], dtype=numpy.float64)
+        return {
+            "time": empty,
+            "count": numpy.array([], dtype=numpy.int64),
+            "min": empty,
+            "mean": empty,
+            "max": empty,
+            "last": empty,
+        }
+
+    index = numpy.floor(timestamps / bin_size).astype(numpy.int64)
+    bins, starts = numpy.unique(index, return_index=True)
+    counts = numpy.diff(numpy.append(starts, len(values)))
+
+    return {
+        "time": bins * bin_size,
+        "count": counts,
+        "min": numpy.minimum.reduceat(values, starts),
+        "mean": numpy.add.reduceat(values, starts) / counts,
+        "max": numpy.maximum.reduceat(values, starts),
+        "last": values[starts + counts - 1],
+    }
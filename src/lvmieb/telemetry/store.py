@@ -0,0 +1,427 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: store.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import struct
+import time
+
+from typing import Mapping, Sequence
+
+import numpy
+
+from lvmieb.exceptions import LvmIebError
+from lvmieb.telemetry.query import aggregate
+
+
+__all__ = ["TelemetryStore"]
+
+
+MAGIC = b"LVMIEBTS"
+VERSION = 1
+
+# Header layout: magic (8s), version (I), number of columns (I), capacity (Q),
+# number of rows written (Q), length of the JSON column list (I). The column
+# list follows and the header is padded to a multiple of the page size.
+HEADER_FORMAT = "<8sIIQQI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+COUNT_OFFSET = struct.calcsize("<8sIIQ")
+PAGE_SIZE = 4096
+
+
+class TelemetryStore:
+    """A fixed-size, memory-mapped ring buffer of telemetry samples.
+
+    Each row contains a UNIX timestamp followed by one float64 column per
+    sensor. Columns that were not measured in a sample are NaN. Once the
+    buffer is full the oldest rows are overwritten, so the file never grows.
+
+    The writer appends rows in place, without allocating new arrays. Any
+    number of readers, in this or other processes, can open the same file
+    with ``readonly=True``.
+
+    Parameters
+    ----------
+    path
+        The path to the file. If it does not exist it is created.
+    columns
+        The names of the sensor columns. Required when creating the file. If
+        the file exists the columns must match.
+    capacity
+        The number of rows in the buffer. Only used when creating the file.
+    readonly
+        Open the file in read-only mode.
+
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        columns: Sequence[str] | None = None,
+        capacity: int = 1_000_000,
+        readonly: bool = False,
+    ):
+        self.path = pathlib.Path(path).expanduser()
+        self.readonly = readonly
+
+        if not self.path.exists():
+            if readonly or columns is None:
+                raise LvmIebError(f"Telemetry store {str(self.path)!r} not found.")
+            self._create(list(columns), capacity)
+
+        self.columns, self.capacity, header_size = self._read_header()
+
+        if columns is not None and list(columns) != self.columns:
+            raise LvmIebError(
+                f"The columns in {str(self.path)!r} do not match the configuration."
+            )
+
+        mode = "r" if readonly else "r+"
+        self._count = numpy.memmap(
+            self.path,
+            dtype="<u8",
+            mode=mode,
+            offset=COUNT_OFFSET,
+            shape=(1,),
+        )
+        self._data = numpy.memmap(
+            self.path,
+            dtype="<f8",
+            mode=mode,
+            offset=header_size,
+            shape=(self.capacity, len(self.columns) + 1),
+        )
+
+        self._index = {name: ii + 1 for ii, name in enumerate(self.columns)}
+
+    def __repr__(self):
+        return (
+            f"<TelemetryStore {str(self.path)!r} "
+            f"(columns={len(self.columns)}, rows={len(self)})>"
+        )
+
+    def __len__(self):
+        return min(int(self._count[0]), self.capacity)
+
+    @property
+    def count(self) -> int:
+        """Total number of rows written, including those overwritten."""
+
+        return int(self._count[0])
+
+    def _create(self, columns: list[str], capacity: int):
+        """Creates a new store file."""
+
+        columns_json = json.dumps(columns).encode()
+        header = struct.pack(
+            HEADER_FORMAT,
+            MAGIC,
+            VERSION,
+            len(columns),
+            capacity,
+            0,
+            len(columns_json),
+        )
+        header += columns_json
+
+        header_size = -(-len(header) // PAGE_SIZE) * PAGE_SIZE
+        data_size = capacity * (len(columns) + 1) * 8
+
+        # The file is created sparse. Rows beyond the write count are never read
+        # so they do not need to be initialised.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "wb") as fd:
+            fd.write(header.ljust(header_size, b"\0"))
+            fd.truncate(header_size + data_size)
+
+    def _read_header(self) -> tuple[list[str], int, int]:
+        """Reads the header. Returns the columns, capacity, and header size."""
+
+        with open(self.path, "rb") as fd:
+            header = fd.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                raise LvmIebError(f"{str(self.path)!r} is not a telemetry store.")
+
+            magic, version, n_columns, capacity, _, json_size = struct.unpack(
+                HEADER_FORMAT,
+                header,
+            )
+            if magic != MAGIC or version != VERSION:
+                raise LvmIebError(f"{str(self.path)!r} is not a telemetry store.")
+
+            columns = json.loads(fd.read(json_size).decode())
+
+        assert len(columns) == n_columns, "Invalid number of columns."
+
+        header_size = -(-(HEADER_SIZE + json_size) // PAGE_SIZE) * PAGE_SIZE
+
+        return columns, capacity, header_size
+
+    def append(self, values: Mapping[str, float], timestamp: float | None = None):
+        """Appends a sample.
+
+        Parameters
+        ----------
+        values
+            A mapping of column name to value. Columns not included are set to
+            NaN. Values for unknown columns are ignored.
+        timestamp
+            The UNIX time of the sample. Defaults to the current time. If it is
+            earlier than the last sample (for example if the system clock goes
+            back), the time of the last sample is used so that the timestamps
+            remain sorted.
+
+        """
+
+        if self.readonly:
+            raise LvmIebError("The telemetry store is read-only.")
+
+        count = int(self._count[0])
+        row = count % self.capacity
+
+        data = self._data
+
+        timestamp = time.time() if timestamp is None else timestamp
+        if count > 0:
+            timestamp = max(timestamp, float(data[(count - 1) % self.capacity, 0]))
+
+        data[row, 1:] = numpy.nan
+        data[row, 0] = timestamp
+
+        index = self._index
+        for name, value in values.items():
+            column = index.get(name, None)
+            if column is not None and value is not None:
+                data[row, column] = value
+
+        # Update the counter last so that a new row is not visible until it is
+        # complete. Once the buffer is full the row being overwritten is the
+        # oldest, which is still counted until now, so a concurrent reader can
+        # see it partially overwritten.
+        self._count[0] = count + 1
+
+    def flush(self):
+        """Flushes the changes to disk."""
+
+        if not self.readonly:
+            self._data.flush()
+            self._count.flush()
+
+    def read(
+        self,
+        since: float | None = None,
+        until: float | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Returns the samples in chronological order.
+
+        The time range is found with a binary search and only the requested
+        rows and columns are copied from the buffer.
+
+        Parameters
+        ----------
+        since
+            Only return samples with timestamp equal or greater than this.
+        until
+            Only return samples with timestamp equal or lower than this.
+        columns
+            The columns to return. Defaults to all the columns.
+
+        Returns
+        -------
+        samples
+            A tuple with the array of timestamps and a 2D array, one row per
+            sample and one column per requested column. The arrays are copies.
+
+        """
+
+        if columns is None:
+            column_index: slice | list[int] = slice(1, None)
+        else:
+            try:
+                column_index = [self._index[name] for name in columns]
+            except KeyError as err:
+                raise LvmIebError(f"Unknown telemetry column {err}.")
+
+        low, high, to_rows = self._rows(
+            numpy.array([-numpy.inf if since is None else since]),
+            numpy.array([numpy.inf if until is None else until]),
+        )
+
+        # The range is contiguous in the buffer unless it wraps around.
+        first = int(to_rows(low)[0])
+        n_rows = max(int(high[0] - low[0]), 0)
+        ranges = [(first, min(first + n_rows, self.capacity))]
+        if first + n_rows > self.capacity:
+            ranges.append((0, first + n_rows - self.capacity))
+
+        timestamps = numpy.concatenate([self._data[a:b, 0] for a, b in ranges])
+        values = numpy.concatenate(
+            [self._data[a:b][:, column_index] for a, b in ranges]
+        )
+
+        return timestamps, values
+
+    def _rows(self, since: numpy.ndarray, until: numpy.ndarray):
+        """Returns the ranges of rows with timestamps in ``[since, until]``.
+
+        The two halves of the ring buffer are each sorted, so the ranges are
+        found with a binary search without copying the timestamps. Returns
+        the first row and the number of rows in each range (as logical
+        positions, oldest first) and the function that maps them to rows.
+
+        """
+
+        count = int(self._count[0])
+        n_rows = min(count, self.capacity)
+        start = count % self.capacity if count > self.capacity else 0
+
+        older = self._data[start:n_rows, 0]
+        newer = self._data[0:start, 0]
+
+        def position(values: numpy.ndarray, side: str) -> numpy.ndarray:
+            older_pos = numpy.searchsorted(older, values, side)  # type: ignore
+            newer_pos = numpy.searchsorted(newer, values, side)  # type: ignore
+            return older_pos + newer_pos
+
+        low = position(since, "left")
+        high = position(until, "right")
+
+        def to_rows(positions: numpy.ndarray) -> numpy.ndarray:
+            return (positions + start) % self.capacity
+
+        return low, high, to_rows
+
+    def lookup(
+        self,
+        times: Sequence[float],
+        columns: Sequence[str] | None = None,
+        method: str = "linear",
+        max_gap: float = 600.0,
+    ) -> dict[str, list[float | None]]:
+        """Returns the values of the sensors at arbitrary times.
+
+        Only the samples within ``max_gap`` seconds of each time are read,
+        found with a binary search over the timestamps, so the cost does not
+        depend on the size of the store.
+
+        Parameters
+        ----------
+        times
+            The UNIX times at which to return the values.
+        columns
+            The columns to return. Defaults to all the columns.
+        method
+            ``linear`` interpolates between the closest valid samples before
+            and after each time (or uses the closest one if there are samples
+            only on one side). ``nearest`` returns the closest valid sample.
+        max_gap
+            Maximum time, in seconds, between each time and the samples used.
+
+        Returns
+        -------
+        values
+            A mapping of column to the list of values at each time. Values are
+            `None` if there are no valid samples within ``max_gap``.
+
+        """
+
+        if method not in ("linear", "nearest"):
+            raise LvmIebError(f"Invalid lookup method {method!r}.")
+
+        columns = list(self.columns if columns is None else columns)
+
+        try:
+            column_index = [self._index[name] for name in columns]
+        except KeyError as err:
+            raise LvmIebError(f"Unknown telemetry column {err}.")
+
+        times_array = numpy.asarray(times, dtype=numpy.float64)
+        low, high, to_rows = self._rows(times_array - max_gap, times_array + max_gap)
+
+        result: dict[str, list[float | None]] = {name: [] for name in columns}
+
+        for ii, time_ in enumerate(times_array):
+            rows = to_rows(numpy.arange(low[ii], high[ii]))
+            timestamps = self._data[rows, 0]
+            values = self._data[rows][:, column_index]
+
+            for jj, name in enumerate(columns):
+                column = values[:, jj]
+                valid = ~numpy.isnan(column)
+
+                before = numpy.flatnonzero(valid & (timestamps <= time_))
+                after = numpy.flatnonzero(valid & (timestamps >= time_))
+
+                candidates = []
+                if len(before) > 0:
+                    candidates.append(before[-1])
+                if len(after) > 0:
+                    candidates.append(after[0])
+
+                if len(candidates) == 0:
+                    result[name].append(None)
+                elif method == "nearest" or len(candidates) == 1:
+                    nearest = min(
+                        candidates, key=lambda kk: abs(timestamps[kk] - time_)
+                    )
+                    result[name].append(float(column[nearest]))
+                else:
+                    t0, t1 = timestamps[candidates]
+                    v0, v1 = column[candidates]
+                    if t1 == t0:
+                        result[name].append(float(v0))
+                    else:
+                        value = v0 + (v1 - v0) * (time_ - t0) / (t1 - t0)
+                        result[name].append(float(value))
+
+        return result
+
+    def history(
+        self,
+        columns: Sequence[str],
+        since: float | None = None,
+        until: float | None = None,
+        bin_size: float = 60.0,
+    ) -> dict[str, dict[str, numpy.ndarray]]:
+        """Returns the downsampled history of one or more columns.
+
+        Parameters
+        ----------
+        columns
+            The columns for which to return the history.
+        since
+            The UNIX time from which to return the history.
+        until
+            The UNIX time until which to return the history.
+        bin_size
+            The size of the time bins, in seconds.
+
+        Returns
+        -------
+        history
+            A mapping of column to the aggregated bins, as returned by
+            `.aggregate`.
+
+        """
+
+        timestamps, values = self.read(since=since, until=until, columns=columns)
+
+        return {
+            name: aggregate(timestamps, values[:, ii], bin_size)
+            for ii, name in enumerate(columns)
+        }
+
+    def close(self):
+        """Flushes and closes the store."""
+
+        self.flush()
+        del self._data
+        del self._count
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: clock.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+
+class VirtualClock:
+    """Runs an event loop in virtual time.
+
+    While installed, ``loop.time()`` returns the virtual time and, when the loop
+    would wait for its next timer with nothing else to do, the virtual time
+    jumps to that timer instead. Sleeps, timeouts, and polling intervals take
+    no real time, so a test can wait for hours in a few milliseconds.
+
+    I/O is still real. Before advancing the clock, the loop waits up to
+    ``grace`` real seconds for socket events, so that the replies of the mock
+    servers arrive before a timeout fires. The clock does not advance while a
+    function is running in an executor (for example, resolving a host name).
+
+    Code that measures time must use ``loop.time()``; `time.monotonic` and
+    `time.time` are not affected.
+
+    Parameters
+    ----------
+    grace
+        The real time, in seconds, to wait for I/O before advancing the clock.
+
+    """
+
+    def __init__(self, grace: float = 0.001):
+        self.grace = grace
+
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.start = 0.0
+        self.now = 0.0
+
+        self._pending = 0
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *args):
+        self.uninstall()
+
+    @property
+    def elapsed(self) -> float:
+        """The virtual time elapsed since the clock was installed."""
+
+        return self.now - self.start
+
+    def time(self) -> float:
+        """Returns the virtual time."""
+
+        return self.now
+
+    def install(self, loop: asyncio.AbstractEventLoop | None = None):
+        """Installs the clock in a loop. Defaults to the running loop."""
+
+        loop = loop or asyncio.get_running_loop()
+
+        selector = getattr(loop, "_selector", None)
+        if selector is None:
+            raise RuntimeError("The virtual clock requires a selector event loop.")
+
+        real_select = selector.select
+        real_run_in_executor = loop.run_in_executor
+
+        def select(timeout: float | None = None):
+            # There are callbacks ready to run.
+            if timeout is not None and timeout <= 0:
+                return real_select(0)
+
+            wait = self.grace if timeout is None else min(timeout, self.grace)
+            events = real_select(wait)
+
+            if events:
+                return events
+            elif timeout is None:
+                # No timers, only I/O can wake the loop.
+                return real_select(None)
+            elif self._pending > 0:
+                return real_select(min(timeout, 0.01))
+
+            self.now += timeout
+
+            return events
+
+        def run_in_executor(executor, func, *args):
+            future = real_run_in_executor(executor, func, *args)
+
+            self._pending += 1
+            future.add_done_callback(self._executor_done)
+
+            return future
+
+        self.loop = loop
+        self.start = self.now = loop.time()
+
+        loop.time = self.time  # type: ignore
+        loop.run_in_executor = run_in_executor  # type: ignore
+        selector.select = select  # type: ignore
+
+    def uninstall(self):
+        """Restores the real time in the loop."""
+
+        if self.loop is None:
+            return
+
+        for obj, name in [
+            (self.loop, "time"),
+            (self.loop, "run_in_executor"),
+            (getattr(self.loop, "_selector"), "select"),
+        ]:
+            obj.__dict__.pop(name, None)
+
+        self.loop = None
+
+    def _executor_done(self, future: asyncio.Future):
+        self._pending -= 1
@@ -14,6 +14,7 @@ from sdsstools import read_yaml_file
 from lvmieb.actor import IEBActor
 from lvmieb.controller import IEBController
 
+from .clock import VirtualClock
 from .mockers import DepthMocker, MotorMocker, PressureMocker, WAGOMocker
 
 
@@ -23,6 +24,19 @@ def config():
     yield read_yaml_file(str(config_file))
 
 
+@pytest.fixture
+async def virtual_clock():
+    """Runs the test in virtual time (see `.VirtualClock`).
+
+    Request it before the fixtures that start tasks that must also run in
+    virtual time.
+
+    """
+
+    with VirtualClock() as clock:
+        yield clock
+
+
 @pytest.fixture
 async def setup_servers(config, mocker):
     mocker.patch("lvmieb.controller.controller.IEBWAGO", WAGOMocker)
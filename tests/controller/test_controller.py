@@ -10,6 +10,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
+from lvmieb.controller import ControllerSnapshot
+from lvmieb.controller.maskbits import MotorStatus
+from lvmieb.exceptions import LvmIebError
+
 from ..mockers import WAGOMocker
 
 
@@ -34,3 +40,79 @@ async def test_controller(controllers: list[IEBController]):
     assert controller.motors is not None
     assert isinstance(controller.motors, dict)
     assert len(controller.motors) == 3
+
+
+async def test_controller_probe(controllers: list[IEBController]):
+    readiness = await controllers[0].probe(timeout=1)
+
+    assert readiness == {
+        "wago": True,
+        "shutter": True,
+        "hartmann_left": True,
+        "hartmann_right": True,
+        "r1": True,
+        "b1": True,
+        "z1": True,
+    }
+
+
+async def test_controller_probe_fails(controllers: list[IEBController], setup_servers):
+    setup_servers["sp1_shutter"].server.close()
+    await setup_servers["sp1_shutter"].server.wait_closed()
+
+    controllers[0].pressure["b1"].disabled = True
+
+    readiness = await controllers[0].probe(timeout=1)
+
+    assert readiness["shutter"] is False
+    assert readiness["hartmann_left"] is True
+    assert "b1" not in readiness
+
+
+async def test_controller_read_snapshot(controllers: list[IEBController]):
+    snapshot = await controllers[0].read_snapshot()
+
+    assert isinstance(snapshot, ControllerSnapshot)
+    assert snapshot.spec == "sp1"
+    assert snapshot.errors == {}
+
+    assert snapshot.sensors is not None and snapshot.sensors["t1"] == 0.0
+    assert snapshot.relays is not None and snapshot.relays["shutter"] is True
+    assert snapshot.pressure is not None
+    assert snapshot.pressure["r1"] == {"pressure": 1e-6, "temperature": 20}
+    assert snapshot.motors is not None
+    assert snapshot.motors["shutter"][0] & MotorStatus.CLOSED
+
+
+async def test_controller_read_snapshot_fails(
+    controllers: list[IEBController],
+    setup_servers,
+):
+    setup_servers["sp1_pressure_b1"].server.close()
+    await setup_servers["sp1_pressure_b1"].server.wait_closed()
+
+    snapshot = await controllers[0].read_snapshot(["pressure"])
+
+    assert snapshot.sensors is None
+    assert snapshot.pressure is not None
+    assert "b1" not in snapshot.pressure
+    assert "r1" in snapshot.pressure
+    assert "pressure.b1" in snapshot.errors
+
+
+async def test_controller_read_snapshot_bad_subsystem(
+    controllers: list[IEBController],
+):
+    with pytest.raises(LvmIebError):
+        await controllers[0].read_snapshot(["bad"])
+
+
+async def test_controller_watch(controllers: list[IEBController]):
+    snapshots = []
+    async for snapshot in controllers[0].watch(["sensors"], interval=0.05):
+        snapshots.append(snapshot)
+        if len(snapshots) == 3:
+            break
+
+    assert snapshots[0].pressure is None
+    assert snapshots[2].time - snapshots[0].time >= 0.09
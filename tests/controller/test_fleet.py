@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_fleet.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lvmieb.controller import IEBFleet
+from lvmieb.controller.maskbits import MotorStatus
+from lvmieb.exceptions import LvmIebError
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+    from lvmieb.controller import IEBController
+
+
+@pytest.fixture()
+def fleet(actor: IEBActor):
+    # The controllers fixture shares the WAGO modules between spectrographs, so
+    # we use the fleet created by the actor.
+    assert isinstance(actor.controllers, IEBFleet)
+
+    yield actor.controllers
+
+
+def test_fleet_mapping(fleet: IEBFleet):
+    assert list(fleet) == ["sp1", "sp2"]
+    assert len(fleet) == 2
+    assert fleet["sp1"].spec == "sp1"
+
+    assert fleet.select() == ["sp1", "sp2"]
+    assert fleet.select("sp2") == ["sp2"]
+
+    with pytest.raises(LvmIebError):
+        fleet.select(["sp1", "sp3"])
+
+
+async def test_fleet_read_all_sensors(fleet: IEBFleet):
+    results = await fleet.read_all_sensors()
+
+    assert results.ok
+    assert set(results) == {"sp1", "sp2"}
+    assert results["sp1"].value is not None
+    assert results["sp1"].value["t1"] == 0.0
+    assert results["sp1"].elapsed > 0
+    assert results.elapsed >= max(r.elapsed for r in results.values())
+
+
+async def test_fleet_move_all(fleet: IEBFleet, setup_servers):
+    results = await fleet.move_all("shutter", open=True)
+    assert results.ok
+
+    assert setup_servers["sp1_shutter"].current_status == "open"
+    assert setup_servers["sp2_shutter"].current_status == "open"
+
+    status = await fleet.get_status_all("shutter", specs="sp2")
+    assert list(status) == ["sp2"]
+    assert status.succeeded["sp2"][0] & MotorStatus.OPEN
+
+
+async def test_fleet_send_command_all(fleet: IEBFleet, setup_servers):
+    setup_servers["sp1_shutter"].current_status = "open"
+    setup_servers["sp2_shutter"].current_status = "open"
+
+    results = await fleet.send_command_all("shutter", "home", specs="sp1")
+    assert results.ok
+    assert list(results) == ["sp1"]
+
+    assert setup_servers["sp1_shutter"].current_status == "closed"
+    assert setup_servers["sp2_shutter"].current_status == "open"
+
+
+async def test_fleet_map_motors(fleet: IEBFleet, setup_servers):
+    motors = ["hartmann_left", "hartmann_right"]
+    results = await fleet.map_motors(lambda motor: motor.move(open=True), motors)
+
+    assert results.ok
+    assert set(results) == {"sp1", "sp2"}
+    assert results["sp1"].value == {"hartmann_left": True, "hartmann_right": True}
+
+    for spec in ["sp1", "sp2"]:
+        for motor in motors:
+            assert setup_servers[f"{spec}_{motor}"].current_status == "open"
+
+
+async def test_fleet_set_power_all(fleet: IEBFleet):
+    results = await fleet.set_power_all("hartmann_left", closed=True)
+    assert results.ok
+
+    relays = await fleet.read_all_relays()
+    assert all(value["hartmann_left"] for value in relays.succeeded.values())
+
+
+async def test_fleet_errors(fleet: IEBFleet):
+    async def fail_sp1(controller: IEBController):
+        if controller.spec == "sp1":
+            raise ValueError("failed")
+        return True
+
+    results = await fleet.map(fail_sp1)
+
+    assert not results.ok
+    assert isinstance(results.failed["sp1"], ValueError)
+    assert results.succeeded == {"sp2": True}
+
+
+async def test_fleet_max_concurrency(controllers: list[IEBController]):
+    running = 0
+    max_running = 0
+
+    async def func(controller: IEBController):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(running, max_running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await IEBFleet(controllers, max_concurrency=1).map(func)
+    assert max_running == 1
+
+    await IEBFleet(controllers, max_concurrency=None).map(func)
+    assert max_running == 2
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_journal.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import pathlib
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lvmieb.controller.journal import CommandJournal, journal
+from lvmieb.exceptions import LvmIebError, LvmIebUserWarning, MotorControllerError
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+    from lvmieb.controller import IEBController
+
+
+@pytest.fixture
+def journal_path(tmp_path: pathlib.Path):
+    path = tmp_path / "commands.journal"
+    journal.open(path)
+
+    yield path
+
+    journal.close()
+
+
+def fill_journal(command_journal: CommandJournal, n: int = 100):
+    for ii in range(n):
+        command_journal.append(
+            {
+                "time": 1000.0 + ii,
+                "spec": f"sp{ii % 3 + 1}",
+                "device": "shutter",
+                "operation": "move",
+            }
+        )
+
+
+def test_journal_query(tmp_path: pathlib.Path):
+    command_journal = CommandJournal(tmp_path / "commands.journal")
+    fill_journal(command_journal)
+
+    assert len(command_journal) == 100
+
+    entries = command_journal.query(since=1010, until=1019.5)
+    assert [entry["time"] for entry in entries] == list(range(1010, 1020))
+
+    entries = command_journal.query(since=1010, until=1019.5, spec="sp2")
+    assert all(entry["spec"] == "sp2" for entry in entries)
+    assert len(entries) == 4
+
+    assert command_journal.query(since=2000) == []
+    assert command_journal.query(limit=2)[-1]["time"] == 1099
+
+    command_journal.close()
+
+    with pytest.raises(LvmIebError):
+        command_journal.query()
+
+
+def test_journal_rebuild_index(tmp_path: pathlib.Path):
+    path = tmp_path / "commands.journal"
+
+    command_journal = CommandJournal(path)
+    fill_journal(command_journal, n=10)
+    command_journal.close()
+
+    # A partial index, as if the actor had died while writing it.
+    index_path = path.with_name(path.name + ".idx")
+    index_path.write_bytes(index_path.read_bytes()[:50])
+
+    command_journal = CommandJournal(path)
+    assert len(command_journal) == 10
+    assert command_journal.query(since=1005)[0]["time"] == 1005
+    command_journal.close()
+
+    index_path.unlink()
+
+    command_journal = CommandJournal(path)
+    assert len(command_journal) == 10
+    assert command_journal.query(until=1001)[-1]["time"] == 1001
+    command_journal.close()
+
+
+def test_journal_clock_goes_back(tmp_path: pathlib.Path):
+    command_journal = CommandJournal(tmp_path / "commands.journal")
+
+    for timestamp in [1000, 1002, 1001, 1003]:
+        command_journal.append({"time": timestamp})
+
+    assert len(command_journal.query(since=1002)) == 3
+
+
+async def test_journal_motor_move(controllers: list[IEBController], journal_path):
+    shutter = controllers[0].motors["shutter"]
+
+    assert await shutter.move(open=True)
+    assert await shutter.move(open=True)
+
+    entries = journal.query(device="shutter")
+    assert len(entries) == 2
+
+    assert entries[0]["operation"] == "move"
+    assert entries[0]["initial"] == "closed"
+    assert entries[0]["requested"] == "open"
+    assert entries[0]["observed"] == "open"
+    assert entries[0]["success"] is True
+    assert entries[0]["duration"] >= 0
+
+    assert entries[1]["initial"] == "open"
+
+
+async def test_journal_motor_move_fails(
+    controllers: list[IEBController],
+    journal_path,
+    mocker,
+):
+    shutter = controllers[0].motors["shutter"]
+    mocker.patch.object(shutter, "send_command", return_value=b"????")
+
+    with pytest.raises(MotorControllerError):
+        await shutter.move(open=True)
+
+    entry = journal.query()[-1]
+    assert entry["success"] is False
+    assert entry["error"] == "Motor position is unknown or invalid."
+
+
+async def test_journal_motor_move_callback_fails(
+    controllers: list[IEBController],
+    journal_path,
+):
+    shutter = controllers[0].motors["shutter"]
+
+    def callback(*args):
+        raise RuntimeError("failed writing")
+
+    shutter.callbacks.append(callback)
+
+    # The move succeeded, so a failing callback only issues a warning.
+    with pytest.warns(LvmIebUserWarning, match="failed writing"):
+        assert await shutter.move(open=True)
+
+    entry = journal.query(device="shutter")[-1]
+    assert entry["success"] is True
+    assert entry["observed"] == "open"
+
+
+async def test_journal_write_fails(
+    controllers: list[IEBController],
+    journal_path,
+    mocker,
+):
+    shutter = controllers[0].motors["shutter"]
+    mocker.patch.object(journal, "append", side_effect=OSError("disk full"))
+
+    # The move succeeded, so failing to write the entry only issues a warning.
+    with pytest.warns(LvmIebUserWarning, match="disk full"):
+        assert await shutter.move(open=True)
+
+
+async def test_journal_set_relay_observed(
+    controllers: list[IEBController],
+    journal_path,
+    mocker,
+):
+    wago = controllers[0].wago
+    relay = wago.get_device("shutter")
+
+    # The relay does not switch.
+    mocker.patch.object(type(relay), "open", return_value=None)
+
+    assert await wago.set_relay("shutter", closed=False)
+
+    entry = journal.query(operation="set_relay")[-1]
+    assert entry["requested"] == "open"
+    assert entry["observed"] == "closed"
+    assert entry["success"] is False
+
+
+async def test_journal_motor_init(controllers: list[IEBController], journal_path):
+    await controllers[0].motors["hartmann_left"].send_command("init")
+    await controllers[0].motors["hartmann_left"].send_command("status")
+
+    entries = journal.query(spec="sp1")
+    assert len(entries) == 1
+    assert entries[0]["operation"] == "init"
+    assert entries[0]["observed"] == "done"
+
+
+async def test_command_journal(actor: IEBActor, journal_path):
+    await (await actor.invoke_mock_command("wago setpower --off shutter sp1"))
+
+    command = await actor.invoke_mock_command("journal --operation set_relay")
+    await command
+    assert command.status.did_succeed
+
+    entries = command.replies.get("journal")["entries"]
+    assert len(entries) == 1
+    assert entries[0]["device"] == "shutter"
+    assert entries[0]["initial"] == "closed"
+    assert entries[0]["observed"] == "open"
+
+
+async def test_command_journal_disabled(actor: IEBActor):
+    command = await actor.invoke_mock_command("journal")
+    await command
+    assert command.status.did_fail
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_metrics.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import math
+
+import pytest
+
+from lvmieb.controller.metrics import Histogram, MetricsRegistry, registry
+from lvmieb.controller.motor import MotorController
+from lvmieb.exceptions import MotorControllerError
+
+from ..mockers import MotorMocker
+
+
+def test_histogram():
+    histogram = Histogram()
+
+    assert math.isnan(histogram.quantile(0.5))
+    assert histogram.to_dict() == {"count": 0}
+
+    for value in [0.002] * 90 + [0.2] * 10:
+        histogram.observe(value)
+
+    assert histogram.count == 100
+    assert histogram.min == 0.002
+    assert histogram.max == 0.2
+
+    assert 0.001 <= histogram.quantile(0.5) <= 0.0025
+    assert 0.1 <= histogram.quantile(0.95) <= 0.2
+    assert histogram.quantile(1.0) == 0.2
+
+    summary = histogram.to_dict()
+    assert summary["count"] == 100
+    assert summary["mean"] == pytest.approx(0.0218)
+
+
+def test_histogram_overflow():
+    histogram = Histogram()
+    histogram.observe(20.0)
+    histogram.observe(30.0)
+
+    assert histogram.counts[-1] == 2
+    assert 20.0 <= histogram.quantile(0.99) <= 30.0
+
+
+def test_tracker():
+    metrics = MetricsRegistry()
+
+    with metrics.track("sp1.shutter", "status") as tracker:
+        tracker.connected()
+        tracker.sent(5)
+        tracker.received(14)
+
+    with pytest.raises(MotorControllerError):
+        with metrics.track("sp1.shutter", "status"):
+            try:
+                raise asyncio.TimeoutError()
+            except asyncio.TimeoutError:
+                raise MotorControllerError("Timed out.")
+
+    with pytest.raises(ValueError):
+        with metrics.track("sp1.shutter", "status"):
+            raise ValueError()
+
+    data = metrics.to_dict()["sp1.shutter"]["status"]
+
+    assert data["connect"]["count"] == 1
+    assert data["request"]["count"] == 1
+    assert data["bytes_sent"] == 5
+    assert data["bytes_received"] == 14
+    assert data["timeouts"] == 1
+    assert data["errors"] == 1
+
+    assert metrics.to_dict(device="sp2.shutter") == {}
+
+    metrics.reset()
+    assert metrics.to_dict() == {}
+
+
+async def test_motor_metrics():
+    registry.reset()
+
+    mock_motor = MotorMocker("sp1", "closed", "shutter")
+    await mock_motor.start()
+
+    motor = MotorController("sp1", "shutter", "localhost", mock_motor.port)
+    await motor.send_command("status")
+
+    data = registry.to_dict()["sp1.shutter"]["status"]
+    assert data["request"]["count"] == 1
+    assert data["bytes_received"] == len(b"\x00\x07IS=01111111\r")
+
+    mock_motor.stop()
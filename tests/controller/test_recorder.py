@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_recorder.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+
+from lvmieb.controller import IEBController
+from lvmieb.controller.recorder import WireRecorder, read_journal, recorder
+from lvmieb.exceptions import LvmIebError
+from lvmieb.simulator import Simulator
+from lvmieb.simulator.replay import get_connections, replay, summarise_replay
+
+
+@pytest.fixture
+def journal(tmp_path: pathlib.Path):
+    path = tmp_path / "wire.journal"
+    recorder.open(path)
+
+    yield path
+
+    recorder.close()
+
+
+def test_recorder_sessions(tmp_path: pathlib.Path):
+    path = tmp_path / "wire.journal"
+    wire_recorder = WireRecorder()
+
+    assert wire_recorder.connect("sp1.shutter") == 0
+
+    for _ in range(2):
+        wire_recorder.open(path)
+        connection = wire_recorder.connect("sp1.shutter")
+        wire_recorder.sent("sp1.shutter", connection, b"\x00\x07IS\r")
+        wire_recorder.received("sp1.shutter", connection, b"\x00\x07IS=10111111\r")
+        wire_recorder.closed("sp1.shutter", connection)
+        wire_recorder.close()
+
+    events = list(read_journal(path))
+
+    assert [event.event for event in events[:4]] == [
+        "connect",
+        "send",
+        "receive",
+        "close",
+    ]
+    assert events[2].data == b"\x00\x07IS=10111111\r"
+    assert all(event.device == "sp1.shutter" for event in events)
+    assert events[0].time <= events[3].time
+
+    # Connections in the second session are renumbered.
+    assert sorted(set(event.connection for event in events)) == [1, 2]
+
+
+def test_read_journal_truncated(tmp_path: pathlib.Path):
+    path = tmp_path / "wire.journal"
+
+    wire_recorder = WireRecorder()
+    wire_recorder.open(path)
+    wire_recorder.sent("sp1.shutter", 1, b"\x00\x07IS\r")
+    wire_recorder.close()
+
+    with open(path, "ab") as fd:
+        fd.write(b"\x00\x01")
+
+    with pytest.raises(LvmIebError):
+        list(read_journal(path))
+
+
+async def test_recorder_motor(controllers: list[IEBController], journal):
+    await controllers[0].motors["shutter"].get_status()
+    recorder.flush()
+
+    events = [event for event in read_journal(journal)]
+
+    assert [event.event for event in events] == [
+        "connect",
+        "send",
+        "receive",
+        "close",
+    ]
+    assert events[0].device == "sp1.shutter"
+    assert events[2].data.startswith(b"\x00\x07IS=")
+
+
+async def test_recorder_pressure(controllers: list[IEBController], journal):
+    await controllers[0].pressure["r1"].read_pressure()
+    recorder.flush()
+
+    connections = get_connections(read_journal(journal))
+
+    assert len(connections) == 1
+    assert connections[0].device == "sp1.r1"
+    assert connections[0].requests[0].latency is not None
+
+
+async def test_recorder_wago(controllers: list[IEBController], journal):
+    wago = controllers[0].wago
+
+    # Device.read is mocked, so we call the Modbus trace hooks directly.
+    assert wago.client.ctx.trace_packet == wago._trace_packet
+
+    wago._trace_connect(True)
+    assert wago._trace_packet(True, b"\x00\x01") == b"\x00\x01"
+    wago._trace_connect(False)
+    recorder.flush()
+
+    events = list(read_journal(journal))
+    assert [event.device for event in events] == ["sp1.wago"] * 3
+
+
+async def test_recorder_wago_simulator(config, journal):
+    async with Simulator(config, behaviour={}, seed=42) as simulator:
+        sim_config = simulator.get_config()
+        controller = IEBController.from_config(
+            "sp1",
+            sim_config["specs"]["sp1"],
+            wago_modules=sim_config["wago_modules"],
+        )
+        controller.wago.overrides = {}  # type: ignore
+
+        # Device.read is mocked, but the Modbus client connects to the simulator.
+        await controller.wago.read_sensors()
+        recorder.flush()
+
+    events = [event for event in read_journal(journal) if event.device == "sp1.wago"]
+
+    # A single connection, opened and closed by the Modbus client.
+    assert [event.event for event in events] == ["connect", "close"]
+    assert events[0].connection == events[1].connection
+
+
+async def test_replay(config, journal):
+    async with Simulator(config, behaviour={}, seed=42) as simulator:
+        sim_config = simulator.get_config()
+        controller = IEBController.from_config(
+            "sp1",
+            sim_config["specs"]["sp1"],
+            wago_modules=sim_config["wago_modules"],
+        )
+        controller.wago.overrides = {}  # type: ignore
+
+        await controller.motors["hartmann_left"].get_status()
+        await controller.pressure["b1"].read_temperature()
+        recorder.close()
+
+        results = await replay(read_journal(journal), simulator, speed=10)
+
+    assert [result["device"] for result in results] == ["sp1.hartmann_left", "sp1.b1"]
+    assert all(result["match"] for result in results)
+    assert all(result["replayed"] is not None for result in results)
+
+    summary = summarise_replay(results)
+    assert summary["sp1.b1"]["n"] == 1
+    assert summary["sp1.b1"]["missing"] == 0
+    assert "replayed_p50_ms" in summary["sp1.hartmann_left"]
@@ -81,6 +81,9 @@ class MotorMocker:
         self.current_status = current_status
         self.motor_type = motor_type
 
+        # Seconds to wait before replying. Use with the virtual_clock fixture.
+        self.delay = 0.0
+
         self.server = None
         self.port = None
 
@@ -103,6 +106,9 @@ class MotorMocker:
                 com = matched.group()
                 cmd = com.decode()
 
+                if self.delay > 0:
+                    await asyncio.sleep(self.delay)
+
                 if cmd == "QX3":  # open
                     writer.write(b"\x00\x07%DONE\r")
                     self.current_status = "open"
@@ -152,6 +158,9 @@ class PressureMocker:
         self.pressure = pressure
         self.temperature = temperature
 
+        # Seconds to wait before replying. Use with the virtual_clock fixture.
+        self.delay = 0.0
+
         self.server = None
         self.port = None
 
@@ -174,6 +183,9 @@ class PressureMocker:
                 com = matched.group()
                 cmd = com.decode()
 
+                if self.delay > 0:
+                    await asyncio.sleep(self.delay)
+
                 if cmd == "P":
                     writer.write((f"@253ACK{self.pressure:.1E}\\").encode())
                 elif cmd == "T":
@@ -200,6 +212,9 @@ class DepthMocker:
         self.use_r = False
         self.custom_reply = None
 
+        # Seconds to wait before replying. Use with the virtual_clock fixture.
+        self.delay = 0.0
+
     async def handle_connection(
         self,
         reader: asyncio.StreamReader,
@@ -213,6 +228,9 @@ class DepthMocker:
 
             matched = re.search(b"SEND ([ABC])\n", data)
 
+            if self.delay > 0:
+                await asyncio.sleep(self.delay)
+
             if self.custom_reply is not None:
                 writer.write(self.custom_reply)
                 await writer.drain()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_adaptive.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lvmieb.actor.publisher import TelemetryPublisher
+from lvmieb.telemetry import AdaptiveInterval, RateEstimator
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+    from ..clock import VirtualClock
+
+
+def test_rate_estimator():
+    estimator = RateEstimator(alpha=0.5)
+
+    for ii in range(20):
+        estimator.update(10 + 0.2 * ii, ii * 5.0)
+
+    assert estimator.rate == pytest.approx(0.04)
+    assert estimator.noise == pytest.approx(0.0)
+    assert estimator.n_samples == 20
+
+
+def test_adaptive_interval_constant():
+    adaptive = AdaptiveInterval(1, 60)
+
+    intervals = []
+    time = 0.0
+    for _ in range(20):
+        intervals.append(adaptive.update({"a": 5.0, "b": "closed"}, time))
+        time += intervals[-1]
+
+    assert intervals[0] == 1
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 60
+
+
+def test_adaptive_interval_ramp():
+    adaptive = AdaptiveInterval(1, 60)
+
+    # Slow ramp until t=300 s, then a fast one.
+    time = 0.0
+    value = 20.0
+    while time < 300:
+        interval = adaptive.update({"a": value}, time, lambda name, value: 0.1)
+        time += interval
+        value += 0.001 * interval
+
+    assert interval == 60
+
+    intervals = []
+    for _ in range(12):
+        intervals.append(adaptive.update({"a": value}, time, lambda n, v: 0.1))
+        time += intervals[-1]
+        value += 0.05 * intervals[-1]
+
+    # The first sample after the change is followed immediately.
+    assert intervals[1] == pytest.approx(2)
+    assert max(intervals[1:]) < 5
+    assert intervals[-1] == pytest.approx(2, rel=0.1)
+
+
+def test_adaptive_interval_noise():
+    rng = random.Random(1)
+    adaptive = AdaptiveInterval(1, 60)
+
+    # Noise with no trend should not keep the interval short.
+    time = 0.0
+    for _ in range(50):
+        interval = adaptive.update({"a": 20 + rng.gauss(0, 0.5)}, time)
+        time += interval
+
+    assert interval > 10
+
+
+def test_adaptive_interval_bad_bounds():
+    with pytest.raises(ValueError):
+        AdaptiveInterval(10, 5)
+
+
+async def test_publisher_adaptive(virtual_clock: VirtualClock, actor: IEBActor):
+    publisher = TelemetryPublisher(
+        actor,
+        adaptive={"wago": (5, 60), "pressure": (2, 30)},
+    )
+
+    publisher.start()
+    await asyncio.sleep(600)
+    await publisher.stop()
+
+    assert set(publisher.intervals) == {
+        ("wago", "sp1"),
+        ("wago", "sp2"),
+        ("pressure", "sp1"),
+        ("pressure", "sp2"),
+        ("depth", None),
+    }
+
+    # The values of the mock devices do not change.
+    assert publisher.intervals[("wago", "sp1")].interval == 60
+    assert publisher.intervals[("pressure", "sp2")].interval == 30
+    assert publisher.intervals[("depth", None)].interval == 10
+
+    await asyncio.sleep(0.01)
+    published = [reply for reply in actor.mock_replies if "transducer" in reply]
+    assert published[0]["transducer"]["z2_temperature"] == 20
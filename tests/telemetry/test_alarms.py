@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_alarms.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+from copy import deepcopy
+
+import pytest
+
+from lvmieb import config as lvmieb_config
+from lvmieb.actor import IEBActor
+from lvmieb.telemetry import AlarmEngine, AlarmRule
+
+
+@pytest.fixture
+def engine():
+    return AlarmEngine.from_config(
+        {
+            "rules": {
+                "rtd1_box": {
+                    "channels": "sp*_sensors.rtd1",
+                    "max": 35,
+                    "hysteresis": 1,
+                },
+                "rtd_rate": {"channels": "sp*_sensors.rtd*", "max_rate": 0.01},
+                "pressure": {
+                    "channels": ["transducer.*_pressure"],
+                    "max": 1e-4,
+                    "severity": "error",
+                },
+                "shutter_invalid": {
+                    "channels": "sp*_shutter.invalid",
+                    "expected": False,
+                },
+            }
+        }
+    )
+
+
+def test_alarm_limit_hysteresis(engine: AlarmEngine):
+    assert engine.evaluate({"sp1_sensors": {"rtd1": 30, "rh1": 90}}, 0) == []
+
+    alarms = engine.evaluate({"sp1_sensors": {"rtd1": 36}, "sp2_sensors": {}}, 1000)
+    assert len(alarms) == 1
+    assert alarms[0]["rule"] == "rtd1_box"
+    assert alarms[0]["channel"] == "sp1_sensors.rtd1"
+    assert alarms[0]["active"] is True
+    assert alarms[0]["reason"] == "max"
+    assert alarms[0]["since"] == 1000
+
+    # Within the hysteresis the alarm stays active.
+    assert engine.evaluate({"sp1_sensors": {"rtd1": 34.5}}, 2000) == []
+
+    # A failed read does not clear it.
+    assert engine.evaluate({"sp1_sensors": {"rtd1": float("nan")}}, 3000) == []
+
+    alarms = engine.evaluate({"sp1_sensors": {"rtd1": 33.5}}, 4000)
+    assert len(alarms) == 1
+    assert alarms[0]["active"] is False
+    assert alarms[0]["value"] == 33.5
+
+    assert engine.get_active() == []
+
+
+def test_alarm_rate(engine: AlarmEngine):
+    engine.evaluate({"sp1_sensors": {"rtd1": 20, "rtd2": 20}}, 0)
+
+    # The rate is not measured until the reference is rate_interval old.
+    assert engine.evaluate({"sp1_sensors": {"rtd1": 21, "rtd2": 25}}, 30) == []
+
+    alarms = engine.evaluate({"sp1_sensors": {"rtd1": 21, "rtd2": 25}}, 60)
+    assert [(alarm["channel"], alarm["reason"]) for alarm in alarms] == [
+        ("sp1_sensors.rtd1", "rate"),
+        ("sp1_sensors.rtd2", "rate"),
+    ]
+
+    # The rate is kept until the next measurement.
+    assert engine.evaluate({"sp1_sensors": {"rtd1": 21, "rtd2": 25}}, 90) == []
+
+    alarms = engine.evaluate({"sp1_sensors": {"rtd1": 21, "rtd2": 25}}, 120)
+    assert len(alarms) == 2
+    assert not any(alarm["active"] for alarm in alarms)
+
+
+def test_alarm_rate_noise():
+    engine = AlarmEngine.from_config(lvmieb_config["alarms"])
+    assert engine.rate_interval == 60
+
+    # Closely spaced readings that alternate by one quantisation step.
+    for ii in range(600):
+        value = 20.0 + 0.1 * (ii % 2)
+        assert engine.evaluate({"sp1_sensors": {"rtd1": value}}, 1000 + ii * 0.5) == []
+
+    # A real ramp raises the alarm once, and it is not cleared while the rate
+    # is within the hysteresis.
+    alarms = []
+    for ii in range(600):
+        value = 20.0 + 0.02 * ii * 0.5 + 0.1 * (ii % 2)
+        alarms += engine.evaluate({"sp1_sensors": {"rtd1": value}}, 1300 + ii * 0.5)
+
+    assert [(alarm["reason"], alarm["active"]) for alarm in alarms] == [("rate", True)]
+
+
+def test_alarm_state_and_severity(engine: AlarmEngine):
+    alarms = engine.evaluate(
+        {
+            "sp1_shutter": {"open": True, "invalid": True, "bits": "11111111"},
+            "sp2_shutter": {"open": False, "invalid": False},
+            "transducer": {"r1_pressure": 1e-6, "b2_pressure": 1e-3},
+        },
+        0,
+    )
+
+    assert {(alarm["rule"], alarm["channel"]) for alarm in alarms} == {
+        ("shutter_invalid", "sp1_shutter.invalid"),
+        ("pressure", "transducer.b2_pressure"),
+    }
+
+    active = {alarm["rule"]: alarm for alarm in engine.get_active()}
+    assert active["shutter_invalid"]["value"] is True
+    assert active["shutter_invalid"]["reason"] == "state"
+    assert active["pressure"]["severity"] == "error"
+
+    # Only the channels to which a rule applies are tracked.
+    assert len(engine.channels) == 4
+
+
+def test_alarm_invalid_rule():
+    with pytest.raises(ValueError):
+        AlarmRule("bad", "sp*_sensors.rh1", max=80, severity="critical")
+
+
+def test_alarm_disabled():
+    engine = AlarmEngine.from_config(
+        {"enabled": False, "rules": {"a": {"channels": "*"}}}
+    )
+
+    assert not engine.enabled
+    assert engine.evaluate({"sp1_sensors": {"rtd1": 100}}) == []
+
+
+async def test_actor_alarms(actor: IEBActor, engine: AlarmEngine, mocker):
+    command = await actor.invoke_mock_command("alarms")
+    await command
+    assert command.status.did_fail
+
+    actor.alarms = engine
+    mocker.patch.object(
+        actor.controllers["sp1"].pressure["b1"],
+        "read_pressure",
+        return_value=1e-3,
+    )
+
+    await (await actor.invoke_mock_command("transducer status sp1"))
+    await asyncio.sleep(0.01)
+
+    alarms = [reply["alarm"] for reply in actor.mock_replies if "alarm" in reply]
+    assert len(alarms) == 1
+    assert alarms[0]["channel"] == "transducer.b1_pressure"
+
+    command = await actor.invoke_mock_command("alarms")
+    await command
+    assert command.status.did_succeed
+    assert command.replies.get("alarms")[0]["rule"] == "pressure"
+
+
+async def test_actor_alarms_from_config(config):
+    config["alarms"] = deepcopy(lvmieb_config["alarms"])
+
+    actor = IEBActor.from_config(config)
+    assert actor.alarms.enabled
+    assert [rule.name for rule in actor.alarms.rules] == list(config["alarms"]["rules"])
+    assert actor.alarms.rate_interval == config["alarms"]["rate_interval"]
+
+    alarms = actor.alarms.evaluate({"sp1_sensors": {"rtd1": 40.0}})
+    assert alarms[0]["rule"] == "rtd1_box"
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_anomaly.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import math
+from copy import deepcopy
+
+import pytest
+
+import clu.testing
+
+from lvmieb import config as lvmieb_config
+from lvmieb.actor import IEBActor
+from lvmieb.telemetry import AnomalyDetector
+
+
+def test_anomaly_spike():
+    detector = AnomalyDetector(window=30, threshold=5, min_samples=10)
+
+    for ii in range(100):
+        values = {"sp1_rh1": 40 + 0.5 * math.sin(ii), "sp1_rtd1": 20.0 + 0.01 * ii}
+        assert detector.update(values, float(ii)) == []
+
+    anomalies = detector.update({"sp1_rh1": 60.0, "sp1_rtd1": 21.0}, 100.0)
+    assert len(anomalies) == 1
+    assert anomalies[0]["channel"] == "sp1_rh1"
+    assert anomalies[0]["active"] is True
+    assert anomalies[0]["zscore"] > 5
+    assert anomalies[0]["median"] == pytest.approx(40, abs=0.5)
+    assert anomalies[0]["anomalies"] == 1
+
+    status = detector.get_status()
+    assert status["sp1_rh1"]["last_anomaly"] == 100.0
+    assert status["sp1_rh1"]["n_samples"] == 30
+    assert status["sp1_rtd1"]["anomalies"] == 0
+    assert status["sp1_rtd1"]["last_anomaly"] is None
+
+    # The anomaly is cleared by the next normal value.
+    anomalies = detector.update({"sp1_rh1": 40.0, "sp1_rtd1": 21.0}, 101.0)
+    assert len(anomalies) == 1
+    assert anomalies[0]["active"] is False
+    assert detector.get_status()["sp1_rh1"]["active"] is False
+
+
+def test_anomaly_level_change():
+    detector = AnomalyDetector(window=10, threshold=5, min_samples=5)
+
+    for ii in range(10):
+        detector.update({"sp1_t1": 10.0}, float(ii))
+
+    # A change of level is raised once, and cleared when it fills half of the
+    # window, instead of being reported on every sample.
+    changes = [detector.update({"sp1_t1": 15.0}, float(ii)) for ii in range(10, 20)]
+    assert [len(change) for change in changes] == [1, 0, 0, 0, 0, 1, 0, 0, 0, 0]
+    assert changes[0][0]["active"] is True
+    assert changes[5][0]["active"] is False
+
+    status = detector.get_status()["sp1_t1"]
+    assert status["anomalies"] == 5
+    assert status["active"] is False
+
+
+def test_anomaly_sample_interval():
+    detector = AnomalyDetector(window=10, min_samples=5, sample_interval=10)
+
+    # Samples closer than sample_interval are ignored.
+    for ii in range(20):
+        detector.update({"sp1_rtd1": 20.0}, ii * 5.0)
+    assert detector.get_status()["sp1_rtd1"]["n_samples"] == 10
+
+    assert detector.update({"sp1_rtd1": 30.0}, 95.0) == []
+    assert detector.get_status()["sp1_rtd1"]["zscore"] == 0
+
+    assert len(detector.update({"sp1_rtd1": 30.0}, 100.0)) == 1
+
+    # A sample from before the last one (the clock has gone back) is accepted.
+    assert len(detector.update({"sp1_rtd1": 20.0}, 50.0)) == 1
+
+
+def test_anomaly_min_scale():
+    detector = AnomalyDetector(window=10, min_samples=5, min_scale=0.1)
+
+    for ii in range(10):
+        detector.update({"sp1_rtd2": 20.0, "sp1_rh2": float("nan")}, float(ii))
+
+    assert detector.update({"sp1_rtd2": 20.1}, 10.0) == []
+    assert detector.get_status()["sp1_rtd2"]["zscore"] == pytest.approx(1)
+    assert "sp1_rh2" not in detector.get_status()
+
+    assert len(detector.update({"sp1_rtd2": 21.0}, 11.0)) == 1
+
+
+def test_anomaly_invalid():
+    with pytest.raises(ValueError):
+        AnomalyDetector(window=10, min_samples=20)
+
+    with pytest.raises(ValueError):
+        AnomalyDetector(min_scale=0)
+
+    with pytest.raises(ValueError):
+        AnomalyDetector(threshold=5, hysteresis=5)
+
+    assert AnomalyDetector.from_config({"window": 10}) is None
+
+
+async def test_command_wago_anomalies_disabled(actor: IEBActor):
+    command = await actor.invoke_mock_command("wago anomalies")
+    await command
+    assert command.status.did_fail
+
+
+async def test_command_wago_anomalies(config, setup_servers):
+    config["anomaly_detection"] = {"enabled": True, "window": 5, "min_samples": 3}
+
+    actor = IEBActor.from_config(config)
+    actor.parser_args = [actor.controllers]
+    actor = await clu.testing.setup_test_actor(actor)
+
+    detector = actor.anomalies
+    assert detector is not None
+    for ii in range(5):
+        detector.update({"sp1_rtd1": 20.0}, float(ii))
+
+    await (await actor.invoke_mock_command("wago status sp1"))
+    await asyncio.sleep(0.01)
+
+    anomalies = [
+        reply["sensor_anomaly"]
+        for reply in actor.mock_replies
+        if "sensor_anomaly" in reply
+    ]
+    assert len(anomalies) == 1
+    assert anomalies[0]["channel"] == "sp1_rtd1"
+    assert anomalies[0]["active"] is True
+
+    command = await actor.invoke_mock_command("wago anomalies sp1")
+    await command
+    assert command.status.did_succeed
+
+    status = command.replies.get("sensor_anomalies")
+    assert status["sp1_rtd1"]["anomalies"] == 1
+    assert status["sp1_rtd1"]["active"] is True
+    assert status["sp1_rh1"]["n_samples"] == 1
+    assert "sp2_rtd1" not in status
+
+    await actor.stop()
+
+
+async def test_actor_anomalies_from_config(config):
+    config["anomaly_detection"] = deepcopy(lvmieb_config["anomaly_detection"])
+    assert IEBActor.from_config(deepcopy(config)).anomalies is None
+
+    config["anomaly_detection"].update({"enabled": True, "window": 30})
+
+    actor = IEBActor.from_config(config)
+    assert actor.anomalies is not None
+    assert actor.anomalies.window == 30
+    assert actor.anomalies.sample_interval == 10
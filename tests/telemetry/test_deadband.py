@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_deadband.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from lvmieb.telemetry import Deadband, DeadbandFilter
+
+
+@pytest.mark.parametrize(
+    "deadband,value,last,significant",
+    [
+        (Deadband(), 1.0, 1.0, False),
+        (Deadband(), 1.01, 1.0, True),
+        (Deadband(absolute=0.1), 1.05, 1.0, False),
+        (Deadband(absolute=0.1), 1.2, 1.0, True),
+        (Deadband(relative=0.1), 1.05e-6, 1e-6, False),
+        (Deadband(relative=0.1), 1.2e-6, 1e-6, True),
+        (Deadband(absolute=1), math.nan, 1.0, True),
+        (Deadband(absolute=1), math.nan, math.nan, False),
+        (Deadband(absolute=1), True, False, True),
+        (Deadband(absolute=1), "r1", "r1", False),
+    ],
+)
+def test_deadband(deadband: Deadband, value, last, significant: bool):
+    assert deadband.is_significant(value, last) is significant
+
+
+def test_deadband_filter():
+    deadband = DeadbandFilter(
+        {"sp*_sensors.rh*": Deadband(absolute=1), "sp*_sensors.*": Deadband(0.1)}
+    )
+
+    message = {"sp1_sensors": {"t1": 20.0, "rh1": 30.0}, "sp1_relays": {"a": True}}
+    assert deadband.filter(message, now=0) == message
+
+    message = {"sp1_sensors": {"t1": 20.05, "rh1": 30.5}, "sp1_relays": {"a": True}}
+    assert deadband.filter(message, now=1) == {}
+
+    message = {"sp1_sensors": {"t1": 20.2, "rh1": 30.5}, "sp1_relays": {"a": False}}
+    # A keyword is published complete if any of its fields is significant.
+    assert deadband.filter(message, now=2) == message
+
+    # Changes accumulate against the last published value.
+    message = {"sp1_sensors": {"t1": 20.2, "rh1": 31.1}}
+    assert deadband.filter(message, now=3) == {}
+
+    message = {"sp1_sensors": {"t1": 20.2, "rh1": 31.6}}
+    assert deadband.filter(message, now=4) == message
+
+    deadband.reset()
+    assert deadband.filter(message, now=5) == message
+
+
+def test_deadband_filter_max_silence():
+    deadband = DeadbandFilter.from_config(
+        {"max_silence": 60, "deadbands": {"transducer.*": {"relative": 0.1}}}
+    )
+
+    assert deadband.get_deadband("transducer.r1_pressure").relative == 0.1
+    assert deadband.default.max_silence == 60
+
+    message = {"transducer": {"r1_pressure": 1e-6}}
+    assert deadband.filter(message, now=0) == message
+    assert deadband.filter(message, now=30) == {}
+    assert deadband.filter(message, now=61) == message
+    assert deadband.filter(message, now=90) == {}
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_leak.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import math
+from copy import deepcopy
+
+import pytest
+
+from lvmieb import config as lvmieb_config
+from lvmieb.actor import IEBActor
+from lvmieb.telemetry import LeakRateEstimator, LeakRateMonitor
+
+
+def test_leak_rate_exponential():
+    estimator = LeakRateEstimator(window=1000, min_samples=5)
+
+    # Pressure doubling every 600 seconds.
+    for ii in range(100):
+        estimator.update(1e-6 * 2 ** (ii * 60 / 600), 1e9 + ii * 60)
+
+    status = estimator.get_status(max_pressure=1e-2)
+    assert status is not None
+
+    assert status["log_rate"] == pytest.approx(math.log(2) / 600)
+    assert status["pressure"] == pytest.approx(1e-6 * 2 ** (99 * 60 / 600))
+    assert status["rate"] == pytest.approx(status["pressure"] * math.log(2) / 600)
+    assert status["threshold"] == 1e-2
+
+    expected = 600 * math.log2(1e-2 / status["pressure"])
+    assert status["time_to_threshold"] == pytest.approx(expected)
+
+    # Only the samples in the window are kept.
+    assert status["n_samples"] == 17
+    assert status["span"] == 960
+
+
+def test_leak_rate_window_change():
+    estimator = LeakRateEstimator(window=300, min_samples=3)
+
+    # The chamber is pumped down and then left to leak.
+    for ii in range(100):
+        pressure = 1e-4 * math.exp(-ii / 10) if ii < 50 else 1e-6 * (1 + ii - 50)
+        estimator.update(pressure, ii * 10.0)
+
+    status = estimator.get_status(target_pressure=1e-7, max_pressure=1e-5)
+    assert status is not None
+    assert status["rate"] > 0
+    assert status["threshold"] == 1e-5
+    assert status["time_to_threshold"] == 0.0
+
+
+def test_leak_rate_recompute():
+    estimator = LeakRateEstimator(window=50, min_samples=5)
+    estimator.RECOMPUTE = 7
+
+    for ii in range(100):
+        estimator.update(1e-5 * math.exp(-ii / 100), 1e9 + ii)
+
+    # The reference was moved to the first sample in the window at ii=97.
+    assert estimator.reference == 1e9 + 47
+    status = estimator.get_status(target_pressure=1e-6)
+    assert status is not None
+    assert status["log_rate"] == pytest.approx(-0.01)
+    assert status["time_to_threshold"] == pytest.approx(100 * math.log(10) - 99)
+
+
+def test_leak_rate_invalid():
+    estimator = LeakRateEstimator(min_samples=2)
+
+    estimator.update(float("nan"), 0)
+    estimator.update(0.0, 1)
+    estimator.update(1e-6, 2)
+    assert estimator.get_status() is None
+
+    estimator.update(1e-6, 2)
+    assert estimator.get_status() is None
+
+    estimator.update(1e-6, 3)
+    status = estimator.get_status(max_pressure=1e-5)
+    assert status is not None
+    assert status["rate"] == 0
+    assert status["threshold"] is None
+    assert status["time_to_threshold"] is None
+
+
+def test_leak_rate_monitor():
+    monitor = LeakRateMonitor(min_samples=2)
+
+    for ii in range(3):
+        monitor.update(
+            {"r1_pressure": 1e-6 * (1 + ii), "r1_temperature": 20.0},
+            1000.0 + ii,
+        )
+
+    status = monitor.get_status(["r1", "b1"])
+    assert status["b1"] is None
+    assert status["r1"] is not None
+    assert status["r1"]["n_samples"] == 3
+
+
+async def test_command_transducer_leak(actor: IEBActor):
+    for _ in range(5):
+        await (await actor.invoke_mock_command("transducer status"))
+
+    command = await actor.invoke_mock_command("transducer leak sp1")
+    await command
+    assert command.status.did_succeed
+
+    leak_rate = command.replies.get("leak_rate")
+    assert set(leak_rate) == {"r1", "b1", "z1"}
+    assert leak_rate["r1"]["n_samples"] == 5
+    assert leak_rate["r1"]["rate"] == pytest.approx(0.0)
+
+
+async def test_command_transducer_leak_bad_spectro(actor: IEBActor):
+    command = await actor.invoke_mock_command("transducer leak sp5")
+    await command
+    assert command.status.did_fail
+
+
+async def test_actor_leak_rate_from_config(config):
+    config["leak_rate"] = deepcopy(lvmieb_config["leak_rate"])
+
+    actor = IEBActor.from_config(config)
+    assert actor.leak_rates.window == 1800
+    assert actor.leak_rates.max_pressure == 1e-4
+    assert actor.leak_rates.target_pressure == 1e-6
+
+    for ii in range(10):
+        actor.leak_rates.update({"b1_pressure": 1e-5 * math.exp(ii / 100)}, ii)
+
+    status = actor.leak_rates.get_status(["b1"])["b1"]
+    assert status is not None
+    assert status["threshold"] == 1e-4
+    assert status["time_to_threshold"] == pytest.approx(100 * math.log(10) - 9)
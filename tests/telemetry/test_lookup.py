@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_lookup.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from lvmieb.actor import IEBActor
+from lvmieb.exceptions import LvmIebError
+from lvmieb.telemetry import TelemetryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    _store = TelemetryStore(tmp_path / "telemetry.dat", ["a", "b"], capacity=8)
+
+    # Wrap around the ring buffer. Column b is only measured every other sample.
+    for ii in range(12):
+        values = {"a": ii * 10.0, "b": -ii if ii % 2 == 0 else None}
+        _store.append(values, timestamp=1000 + ii * 10)
+
+    yield _store
+
+    _store.close()
+
+
+def test_lookup_linear(store: TelemetryStore):
+    result = store.lookup([1065, 1090, 1115], max_gap=30)
+
+    assert result["a"] == [65.0, 90.0, 110.0]
+    assert result["b"] == [-6.5, -9.0, -10.0]
+
+
+def test_lookup_nearest(store: TelemetryStore):
+    result = store.lookup([1072, 1094], columns=["b"], method="nearest")
+
+    assert result == {"b": [-8.0, -10.0]}
+
+
+def test_lookup_out_of_range(store: TelemetryStore):
+    # The samples before 1040 have been overwritten.
+    result = store.lookup([1000, 2000, 1035], max_gap=10)
+
+    assert result["a"] == [None, None, 40.0]
+
+
+def test_lookup_invalid(store: TelemetryStore):
+    with pytest.raises(LvmIebError):
+        store.lookup([1050], columns=["c"])
+
+    with pytest.raises(LvmIebError):
+        store.lookup([1050], method="cubic")
+
+
+async def test_command_lookup(actor: IEBActor, tmp_path):
+    actor.config["telemetry"] = {"enabled": True, "path": str(tmp_path / "t.dat")}
+    actor.open_telemetry()
+
+    await (await actor.invoke_mock_command("transducer status"))
+    now = time.time()
+
+    command = await actor.invoke_mock_command(
+        f"lookup {now} {now - 3600} -s r1_pressure -s b1_temperature"
+    )
+    await command
+    assert command.status.did_succeed
+
+    lookup = command.replies.get("lookup")
+    assert lookup["method"] == "linear"
+    assert lookup["sensors"]["b1_temperature"] == [20, None]
+
+
+async def test_command_lookup_disabled(actor: IEBActor):
+    command = await actor.invoke_mock_command("lookup 10s")
+    await command
+
+    assert command.status.did_fail
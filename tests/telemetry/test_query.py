@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_query.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import numpy
+import pytest
+
+from lvmieb.actor import IEBActor
+from lvmieb.exceptions import LvmIebError
+from lvmieb.telemetry import TelemetryStore, aggregate, parse_duration, parse_time
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("90", 90), ("60s", 60), ("5m", 300), ("1.5h", 5400), ("1d", 86400), (10, 10)],
+)
+def test_parse_duration(value, expected):
+    assert parse_duration(value) == expected
+
+
+def test_parse_duration_invalid():
+    with pytest.raises(LvmIebError):
+        parse_duration("5 minutes")
+
+
+def test_parse_time():
+    now = 1_800_000_000.0
+
+    assert parse_time("2h", now=now) == now - 7200
+    assert parse_time("1700000000", now=now) == 1_700_000_000
+    assert parse_time("2026-01-01T00:00:00", now=now) == 1767225600
+
+    with pytest.raises(LvmIebError):
+        parse_time("yesterday", now=now)
+
+
+def test_aggregate():
+    timestamps = numpy.arange(0, 300, 10, dtype=numpy.float64)
+    values = numpy.arange(30, dtype=numpy.float64)
+    values[7] = numpy.nan
+
+    bins = aggregate(timestamps, values, 60)
+
+    numpy.testing.assert_array_equal(bins["time"], [0, 60, 120, 180, 240])
+    numpy.testing.assert_array_equal(bins["count"], [6, 5, 6, 6, 6])
+    numpy.testing.assert_array_equal(bins["min"], [0, 6, 12, 18, 24])
+    numpy.testing.assert_array_equal(bins["max"], [5, 11, 17, 23, 29])
+    numpy.testing.assert_array_equal(bins["last"], [5, 11, 17, 23, 29])
+    assert bins["mean"][1] == (6 + 8 + 9 + 10 + 11) / 5
+
+
+def test_aggregate_empty():
+    bins = aggregate(numpy.array([1.0]), numpy.array([numpy.nan]), 60)
+
+    assert len(bins["time"]) == 0
+    assert len(bins["mean"]) == 0
+
+
+def test_store_history(tmp_path):
+    store = TelemetryStore(tmp_path / "telemetry.dat", ["a", "b"], capacity=100)
+    for ii in range(20):
+        store.append({"a": ii, "b": -ii}, timestamp=1000 + ii * 15)
+
+    history = store.history(["b"], since=1060, bin_size=60)
+
+    assert list(history) == ["b"]
+    numpy.testing.assert_array_equal(
+        history["b"]["time"],
+        [1020, 1080, 1140, 1200, 1260],
+    )
+    numpy.testing.assert_array_equal(history["b"]["min"], [-5, -9, -13, -17, -19])
+    numpy.testing.assert_array_equal(history["b"]["count"], [2, 4, 4, 4, 2])
+
+
+async def test_command_history(actor: IEBActor, tmp_path):
+    actor.config["telemetry"] = {
+        "enabled": True,
+        "path": str(tmp_path / "telemetry.dat"),
+        "capacity": 100,
+    }
+    actor.open_telemetry()
+
+    await (await actor.invoke_mock_command("transducer status"))
+    await (await actor.invoke_mock_command("transducer status"))
+
+    command = await actor.invoke_mock_command("history r1_pressure b1_temperature")
+    await command
+
+    assert command.status.did_succeed
+
+    history = command.replies.get("history")
+    assert history["bin"] == 60
+    assert sum(history["sensors"]["r1_pressure"]["count"]) == 2
+    assert history["sensors"]["b1_temperature"]["last"][-1] == 20
+
+
+async def test_command_history_bad_sensor(actor: IEBActor, tmp_path):
+    actor.config["telemetry"] = {"enabled": True, "path": str(tmp_path / "t.dat")}
+    actor.open_telemetry()
+
+    command = await actor.invoke_mock_command("history sp9_t1")
+    await command
+
+    assert command.status.did_fail
+
+
+async def test_command_history_disabled(actor: IEBActor):
+    command = await actor.invoke_mock_command("history sp1_t1")
+    await command
+
+    assert command.status.did_fail
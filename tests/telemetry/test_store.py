@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_store.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import math
+
+import numpy
+import pytest
+
+from lvmieb.actor import IEBActor
+from lvmieb.exceptions import LvmIebError
+from lvmieb.telemetry import TelemetryStore
+
+
+COLUMNS = ["sp1_t1", "sp1_rh1", "r1_pressure"]
+
+
+def test_store_append_read(tmp_path):
+    store = TelemetryStore(tmp_path / "telemetry.dat", columns=COLUMNS, capacity=10)
+
+    store.append({"sp1_t1": 20.0, "r1_pressure": 1e-6}, timestamp=100)
+    store.append({"sp1_t1": 21.0, "sp1_rh1": 30.0, "bad": 1.0}, timestamp=101)
+
+    assert len(store) == 2
+    assert store.count == 2
+
+    timestamps, values = store.read()
+    numpy.testing.assert_array_equal(timestamps, [100, 101])
+    assert values.shape == (2, 3)
+    assert values[0, 0] == 20.0
+    assert math.isnan(values[0, 1])
+    assert math.isnan(values[1, 2])
+
+    timestamps, values = store.read(since=101, columns=["sp1_rh1", "sp1_t1"])
+    numpy.testing.assert_array_equal(timestamps, [101])
+    numpy.testing.assert_array_equal(values, [[30.0, 21.0]])
+
+
+def test_store_ring(tmp_path):
+    store = TelemetryStore(tmp_path / "telemetry.dat", columns=COLUMNS, capacity=5)
+
+    for ii in range(12):
+        store.append({"sp1_t1": ii}, timestamp=ii)
+
+    assert len(store) == 5
+    assert store.count == 12
+
+    timestamps, values = store.read(columns=["sp1_t1"])
+    numpy.testing.assert_array_equal(timestamps, [7, 8, 9, 10, 11])
+    numpy.testing.assert_array_equal(values[:, 0], [7, 8, 9, 10, 11])
+
+    timestamps, _ = store.read(since=8, until=10)
+    numpy.testing.assert_array_equal(timestamps, [8, 9, 10])
+
+    # The range wraps around the end of the buffer.
+    timestamps, values = store.read(since=9, columns=["sp1_t1", "sp1_rh1"])
+    numpy.testing.assert_array_equal(timestamps, [9, 10, 11])
+    assert values.shape == (3, 2)
+
+    timestamps, values = store.read(since=20)
+    assert timestamps.shape == (0,)
+    assert values.shape == (0, 3)
+
+
+def test_store_clock_goes_back(tmp_path):
+    store = TelemetryStore(tmp_path / "telemetry.dat", columns=COLUMNS, capacity=5)
+
+    for timestamp in [10, 12, 11, 13]:
+        store.append({"sp1_t1": timestamp}, timestamp=timestamp)
+
+    timestamps, values = store.read(since=12)
+    numpy.testing.assert_array_equal(timestamps, [12, 12, 13])
+    numpy.testing.assert_array_equal(values[:, 0], [12, 11, 13])
+
+
+def test_store_reopen_readonly(tmp_path):
+    path = tmp_path / "telemetry.dat"
+
+    store = TelemetryStore(path, columns=COLUMNS, capacity=5)
+    store.append({"sp1_t1": 1.0}, timestamp=1)
+
+    reader = TelemetryStore(path, readonly=True)
+    assert reader.columns == COLUMNS
+    assert reader.capacity == 5
+    assert len(reader) == 1
+
+    # The reader sees the rows appended after it was opened.
+    store.append({"sp1_t1": 2.0}, timestamp=2)
+    assert len(reader) == 2
+    assert reader.read(columns=["sp1_t1"])[1][-1, 0] == 2.0
+
+    with pytest.raises(LvmIebError):
+        reader.append({"sp1_t1": 3.0})
+
+
+def test_store_columns_mismatch(tmp_path):
+    path = tmp_path / "telemetry.dat"
+    TelemetryStore(path, columns=COLUMNS, capacity=5).close()
+
+    with pytest.raises(LvmIebError):
+        TelemetryStore(path, columns=["sp1_t1"])
+
+
+def test_store_not_found(tmp_path):
+    with pytest.raises(LvmIebError):
+        TelemetryStore(tmp_path / "telemetry.dat", readonly=True)
+
+
+def test_store_unknown_column(tmp_path):
+    store = TelemetryStore(tmp_path / "telemetry.dat", columns=COLUMNS, capacity=5)
+
+    with pytest.raises(LvmIebError):
+        store.read(columns=["sp2_t1"])
+
+
+async def test_actor_records_telemetry(actor: IEBActor, tmp_path):
+    actor.config["telemetry"] = {
+        "enabled": True,
+        "path": str(tmp_path / "telemetry.dat"),
+        "capacity": 100,
+    }
+    store = actor.open_telemetry()
+    assert store is not None
+
+    assert "sp1_t1" in store.columns
+    assert "r1_pressure" in store.columns
+    assert "depth_a" in store.columns
+
+    for command_string in ["wago status", "transducer status", "depth status"]:
+        command = await actor.invoke_mock_command(command_string)
+        await command
+        assert command.status.did_succeed
+
+    assert len(store) == 3
+
+    # Each command records a row with its own columns.
+    _, values = store.read(columns=["sp2_t1", "b2_temperature", "depth_c"])
+    numpy.testing.assert_array_equal(numpy.nanmax(values, axis=0), [0.0, 20.0, 1.5])
+
+
+async def test_actor_telemetry_columns_mismatch(actor: IEBActor, tmp_path):
+    path = tmp_path / "telemetry.dat"
+    TelemetryStore(path, columns=["sp1_t1"], capacity=5).close()
+
+    actor.config["telemetry"] = {"enabled": True, "path": str(path)}
+
+    assert actor.open_telemetry() is None
+    assert actor.telemetry is None
@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from lvmieb.actor import IEBActor
+from lvmieb.actor.publisher import TelemetryPublisher
 
 
 async def test_actor(actor: IEBActor):
@@ -17,3 +20,72 @@ async def test_ping(actor: IEBActor):
     assert command.status.did_succeed
     assert len(command.replies) == 2
     assert command.replies[1].message["text"] == "Pong."
+
+
+async def test_probe_devices(actor: IEBActor):
+    readiness = await actor.probe_devices()
+
+    assert set(readiness) == {"sp1", "sp2", "depth"}
+    assert readiness["depth"] is True
+    assert isinstance(readiness["sp1"], dict)
+    assert all(readiness["sp1"].values())
+
+    assert actor.readiness == readiness
+
+
+async def test_command_readiness(actor: IEBActor, setup_servers):
+    setup_servers["depth"].server.close()
+    await setup_servers["depth"].server.wait_closed()
+
+    command = await actor.invoke_mock_command("readiness")
+    await command
+
+    assert command.status.did_succeed
+    assert command.replies.get("depth_readiness") is False
+    assert command.replies.get("sp2_readiness")["shutter"] is True
+
+
+async def test_actor_stop_cancels_probe(actor: IEBActor, mocker):
+    async def probe_devices():
+        await asyncio.sleep(60)
+
+    mocker.patch.object(actor, "probe_devices", side_effect=probe_devices)
+
+    probe_task = asyncio.create_task(actor.report_readiness())
+    actor._probe_task = probe_task
+    await asyncio.sleep(0)
+
+    await actor.stop()
+
+    assert probe_task.cancelled()
+    assert actor._probe_task is None
+
+
+async def test_telemetry_publisher(actor: IEBActor):
+    publisher = TelemetryPublisher(actor, interval=0.1)
+
+    message = await publisher.sweep()
+    assert set(message) == {"sp1_sensors", "sp2_sensors", "transducer", "depth"}
+    assert message["transducer"]["r1_pressure"] == 1e-6
+
+    published = await publisher.publish()
+    assert published == message
+
+    await asyncio.sleep(0.01)
+    assert actor.mock_replies[-1]["transducer"]["z2_temperature"] == 20
+
+    # Nothing has changed so nothing is published.
+    n_replies = len(actor.mock_replies)
+    assert await publisher.publish() == {}
+    await asyncio.sleep(0.01)
+    assert len(actor.mock_replies) == n_replies
+
+    # A keyword read in parts is published complete.
+    published = await publisher.publish({"transducer": {"r1_pressure": 2e-6}})
+    assert published["transducer"]["r1_pressure"] == 2e-6
+    assert published["transducer"] == {**message["transducer"], "r1_pressure": 2e-6}
+
+    publisher.start()
+    assert publisher.running
+    await publisher.stop()
+    assert not publisher.running
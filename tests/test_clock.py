@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_clock.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lvmieb.actor.commands.transducer import read_transducer
+from lvmieb.actor.poller import Poller
+from lvmieb.controller.motor import MotorControllerError
+
+
+if TYPE_CHECKING:
+    from lvmieb.controller import IEBController
+
+    from .clock import VirtualClock
+
+
+async def test_virtual_sleep(virtual_clock: VirtualClock):
+    t0 = time.perf_counter()
+
+    await asyncio.sleep(3600)
+
+    assert virtual_clock.elapsed == pytest.approx(3600)
+    assert time.perf_counter() - t0 < 1
+
+
+async def test_virtual_wait_for(virtual_clock: VirtualClock):
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(asyncio.Event().wait(), 10)
+
+    assert virtual_clock.elapsed == pytest.approx(10)
+
+
+async def test_virtual_io(
+    virtual_clock: VirtualClock,
+    controllers: list[IEBController],
+):
+    # Replies from the mock servers arrive before the clock advances.
+    for _ in range(10):
+        assert await controllers[0].pressure["r1"].read_pressure() == 1e-6
+
+    assert virtual_clock.elapsed < 0.1
+
+
+async def test_motor_timeout(
+    virtual_clock: VirtualClock,
+    controllers: list[IEBController],
+    setup_servers,
+):
+    setup_servers["sp1_shutter"].delay = 60
+
+    with pytest.raises(MotorControllerError, match="timed out"):
+        await controllers[0].motors["shutter"].send_command("status", timeout=3)
+
+    assert virtual_clock.elapsed == pytest.approx(3, abs=0.1)
+
+
+async def test_transducer_timeout(
+    virtual_clock: VirtualClock,
+    controllers: list[IEBController],
+    setup_servers,
+    mocker,
+):
+    setup_servers["sp1_pressure_b1"].delay = 60
+
+    transducer = controllers[0].pressure["b1"]
+    read_pressure = mocker.spy(transducer, "read_pressure")
+
+    t0 = time.perf_counter()
+
+    # read_transducer retries each timed out read before raising.
+    with pytest.raises(asyncio.TimeoutError):
+        await read_transducer(controllers[0], "b1")
+
+    assert read_pressure.call_count == 3
+    assert virtual_clock.elapsed == pytest.approx(3 * transducer.TIMEOUT, abs=0.1)
+    assert time.perf_counter() - t0 < 1
+
+
+async def test_depth_timeout(virtual_clock: VirtualClock, actor, setup_servers):
+    setup_servers["depth"].delay = 2
+
+    command = await actor.invoke_mock_command("depth status")
+    await command
+
+    assert command.status.did_fail
+    assert virtual_clock.elapsed == pytest.approx(1, abs=0.1)
+
+
+async def test_poller_long_interval(virtual_clock: VirtualClock):
+    count = 0
+
+    async def reader():
+        nonlocal count
+        count += 1
+        return count
+
+    values = []
+    async for value in Poller().subscribe("key", reader, 600):
+        values.append(value)
+        if len(values) == 5:
+            break
+
+    assert values == [1, 2, 3, 4, 5]
+    assert virtual_clock.elapsed == pytest.approx(2400, abs=1)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_command_debug.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import os
+import pstats
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+
+@pytest.fixture
+def log_dir(actor: IEBActor, mocker, tmp_path):
+    mocker.patch.object(actor.log, "fh", None)
+    actor.config = {"actor": {"log_dir": str(tmp_path)}}
+
+    yield tmp_path
+
+
+async def test_command_debug_profile(actor: IEBActor, log_dir):
+    command = await actor.invoke_mock_command("debug profile 0.2 --filter lvmieb")
+
+    await asyncio.sleep(0.05)
+    await (await actor.invoke_mock_command("transducer status sp1"))
+
+    await command
+    assert command.status.did_succeed
+
+    profile = command.replies.get("profile")
+    assert profile["duration"] == 0.2
+    assert os.path.dirname(profile["file"]) == str(log_dir)
+    assert len(pstats.Stats(profile["file"]).stats) > 0  # type: ignore
+
+    functions = profile["functions"]
+    assert 0 < len(functions) <= 20
+    assert all("lvmieb" in row["function"] for row in functions)
+    assert any("read_transducer" in row["function"] for row in functions)
+
+
+async def test_command_debug_profile_sort_tottime(actor: IEBActor, log_dir):
+    command = await actor.invoke_mock_command(
+        "debug profile 0.05 --top 3 --sort tottime"
+    )
+    await command
+    assert command.status.did_succeed
+
+    functions = command.replies.get("profile")["functions"]
+    assert len(functions) <= 3
+    assert functions == sorted(functions, key=lambda f: f["tottime"], reverse=True)
+
+
+async def test_command_debug_profile_concurrent(actor: IEBActor, log_dir):
+    command1 = await actor.invoke_mock_command("debug profile 0.1")
+    await asyncio.sleep(0.01)
+
+    command2 = await actor.invoke_mock_command("debug profile 0.1")
+    await command2
+    assert command2.status.did_fail
+
+    await command1
+    assert command1.status.did_succeed
+
+
+async def test_command_debug_profile_bad_duration(actor: IEBActor):
+    command = await actor.invoke_mock_command("debug profile 1000")
+    await command
+    assert command.status.did_fail
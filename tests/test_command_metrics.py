@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_command_metrics.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lvmieb.controller.metrics import registry
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+
+async def test_command_metrics(actor: IEBActor):
+    registry.reset()
+
+    await (await actor.invoke_mock_command("transducer status sp1"))
+    await (await actor.invoke_mock_command("depth status"))
+    await (await actor.invoke_mock_command("wago status sp1"))
+
+    command = await actor.invoke_mock_command("metrics")
+    await command
+    assert command.status.did_succeed
+
+    metrics = command.replies.get("metrics")
+    assert metrics["sp1.b1"]["pressure"]["request"]["count"] == 1
+    assert metrics["sp1.b1"]["temperature"]["errors"] == 0
+    assert metrics["depth"]["read"]["request"]["count"] == 3
+    assert metrics["sp1.wago"]["read_sensors"]["connect"]["count"] == 1
+
+
+async def test_command_metrics_device_reset(actor: IEBActor):
+    registry.reset()
+
+    await (await actor.invoke_mock_command("depth status"))
+
+    command = await actor.invoke_mock_command("metrics depth --reset")
+    await command
+    assert command.status.did_succeed
+
+    assert list(command.replies.get("metrics")) == ["depth"]
+    assert registry.to_dict() == {}
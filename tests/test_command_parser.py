@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_command_parser.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lvmieb.actor.commands import COMMANDS, parser
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+
+# Maximum time, in seconds, that importing the command parser can add on top of
+# its (already imported) dependencies. This is generous; the parser should only
+# define a click group and must not import the command modules.
+IMPORT_BUDGET = 0.5
+
+IMPORT_SCRIPT = """
+import json, sys, time
+import clu.parsers.click
+t0 = time.perf_counter()
+import lvmieb.actor.commands
+elapsed = time.perf_counter() - t0
+loaded = [m for m in sys.modules if m.startswith("lvmieb.actor.commands.")]
+print(json.dumps({"elapsed": elapsed, "loaded": loaded}))
+"""
+
+
+def test_parser_import_is_lazy():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert data["loaded"] == []
+    assert data["elapsed"] < IMPORT_BUDGET
+
+
+def test_parser_list_commands():
+    commands = parser.list_commands(None)  # type: ignore
+
+    for name in COMMANDS:
+        assert name in commands
+    assert "ping" in commands
+
+
+@pytest.mark.parametrize("name", list(COMMANDS))
+def test_parser_resolve_command(name: str):
+    assert name in parser.commands
+    assert parser.commands[name].name == name
+
+
+def test_parser_unknown_command():
+    assert "bad_command" not in parser.commands
+    assert parser.commands.get("bad_command") is None
+
+    with pytest.raises(KeyError):
+        parser.commands["bad_command"]
+
+
+async def test_help_lazy_command(actor: IEBActor):
+    command = await actor.invoke_mock_command("help shutter")
+    await command
+
+    assert command.status.did_succeed
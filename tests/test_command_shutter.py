@@ -3,8 +3,12 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from typing import TYPE_CHECKING
 
+from lvmieb.actor.publisher import TelemetryPublisher
+
 
 if TYPE_CHECKING:
     from lvmieb.actor import IEBActor
@@ -82,3 +86,68 @@ async def test_shutter_open_and_close(actor: IEBActor, setup_servers):
     # check the status of the virtual shutter is closed
     assert shutter.current_status == "closed"
     assert command.replies[-2].message["sp1_shutter"]["open"] is False
+
+
+async def test_shutter_transitions(actor: IEBActor):
+    await (await actor.invoke_mock_command("wago status sp1"))
+    await (await actor.invoke_mock_command("wago getpower sp1"))
+    await (await actor.invoke_mock_command("transducer status"))
+
+    command = await actor.invoke_mock_command("shutter open sp1")
+    await command
+    assert command.status.did_succeed
+
+    transition = actor.transitions["sp1"][-1]
+    assert transition.position == "open"
+    assert set(transition.values) == {"sp1_sensors", "sp1_relays", "transducer"}
+    assert set(transition.values["transducer"]) == {
+        "r1_pressure",
+        "r1_temperature",
+        "b1_pressure",
+        "b1_temperature",
+        "z1_pressure",
+        "z1_temperature",
+    }
+    assert transition.updated["sp1_sensors"] <= transition.time
+
+    await (await actor.invoke_mock_command("shutter close sp1"))
+
+    command = await actor.invoke_mock_command("shutter transitions sp1 --last 5")
+    await command
+    assert command.status.did_succeed
+
+    transitions = command.replies.get("shutter_transitions")
+    assert [transition["position"] for transition in transitions] == [
+        "closed",
+        "open",
+    ]
+
+    await asyncio.sleep(0.01)
+    broadcast = [
+        reply["shutter_transition"]
+        for reply in actor.mock_replies
+        if "shutter_transition" in reply
+    ]
+    assert len(broadcast) == 2
+
+
+async def test_shutter_transitions_publisher(actor: IEBActor):
+    publisher = TelemetryPublisher(actor)
+
+    await (await actor.invoke_mock_command("transducer status"))
+    await publisher.publish({"transducer": {"r1_pressure": 2e-6}})
+
+    await (await actor.invoke_mock_command("shutter open sp1"))
+
+    # The values read by the publisher are fresher than the status command.
+    transition = actor.transitions["sp1"][-1]
+    assert transition.values["transducer"]["r1_pressure"] == 2e-6
+    assert transition.values["transducer"]["b1_pressure"] == 1e-6
+
+
+async def test_shutter_transitions_none(actor: IEBActor):
+    command = await actor.invoke_mock_command("shutter transitions sp1")
+    await command
+    assert command.status.did_succeed
+
+    assert command.replies.get("shutter_transitions") == []
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_command_status.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from lvmieb.actor.snapshot import Snapshot
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+
+def test_snapshot():
+    snapshot = Snapshot()
+
+    token = snapshot.update({"sp1_sensors": {"t1": 1.0, "t2": 2.0}, "value": 5})
+    assert snapshot.version == 1
+
+    # No changes, the token is the same.
+    assert snapshot.update({"sp1_sensors": {"t1": 1.0}, "value": 5}) == token
+
+    new_token = snapshot.update({"sp1_sensors": {"t1": 1.5, "t2": 2.0}, "value": 5})
+    assert new_token != token
+
+    assert snapshot.delta(token) == {"sp1_sensors": {"t1": 1.5}}
+    assert snapshot.delta(new_token) == {}
+    assert snapshot.delta(None) == {"sp1_sensors": {"t1": 1.5, "t2": 2.0}, "value": 5}
+    assert snapshot.delta(token, keywords=["value"]) == {}
+
+    # Tokens from another snapshot return everything.
+    other = Snapshot()
+    assert snapshot.delta(other.token) == snapshot.delta(None)
+    assert snapshot.delta("bad-token") == snapshot.delta(None)
+
+
+def test_snapshot_nan():
+    snapshot = Snapshot()
+
+    token = snapshot.update({"transducer": {"r1_pressure": float("nan")}})
+    snapshot.update({"transducer": {"r1_pressure": float("nan")}})
+
+    assert snapshot.delta(token) == {}
+
+
+async def test_command_status(actor: IEBActor, setup_servers):
+    command = await actor.invoke_mock_command("status")
+    await command
+    assert command.status.did_succeed
+
+    assert command.replies.get("sp1_shutter")["open"] is False
+    assert command.replies.get("sp2_hartmann_left")["open"] is False
+    assert command.replies.get("sp1_relays")["shutter"] is True
+    assert command.replies.get("transducer")["r1_pressure"] == 1e-6
+    assert command.replies.get("depth")["A"] == 1.5
+    assert "status_token" not in command.replies[-1].message
+
+    command = await actor.invoke_mock_command("status --since 0")
+    await command
+    assert command.status.did_succeed
+    assert command.replies.get("sp1_shutter")["open"] is False
+
+    token = command.replies.get("status_token")
+
+    command = await actor.invoke_mock_command(f"status --since {token}")
+    await command
+    assert command.status.did_succeed
+    assert set(command.replies[-1].message) == {"status_token"}
+
+    await (await actor.invoke_mock_command("shutter open sp1"))
+
+    command = await actor.invoke_mock_command(f"status --since {token}")
+    await command
+    assert command.status.did_succeed
+
+    message = command.replies[-1].message
+    assert set(message) == {"sp1_shutter", "status_token"}
+    assert message["sp1_shutter"]["open"] is True
+    assert "power" not in message["sp1_shutter"]
+
+
+async def test_command_status_since_single_command(actor: IEBActor):
+    command = await actor.invoke_mock_command("transducer status --since 0")
+    await command
+
+    assert "transducer" in command.replies[-1].message
+    token = command.replies.get("status_token")
+
+    command = await actor.invoke_mock_command(f"transducer status --since {token}")
+    await command
+
+    assert command.status.did_succeed
+    assert "transducer" not in command.replies[-1].message
+
+
+async def test_command_hartmann_since(actor: IEBActor):
+    command = await actor.invoke_mock_command("hartmann status sp1 --since 0")
+    await command
+
+    assert command.status.did_succeed
+    assert command.replies.get("sp1_hartmann_left")["open"] is False
+
+    token = command.replies.get("status_token")
+
+    command = await actor.invoke_mock_command(f"hartmann status sp1 --since {token}")
+    await command
+
+    assert command.status.did_succeed
+    assert len(command.replies) == 2
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_command_stream.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lvmieb.controller.metrics import registry
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+
+@pytest.mark.parametrize(
+    "command_string,keyword",
+    [
+        ("wago status", "sp1_sensors"),
+        ("transducer status", "transducer"),
+        ("depth status", "depth"),
+        ("shutter status sp1", "sp1_shutter"),
+        ("hartmann status sp2", "sp2_hartmann_right"),
+    ],
+)
+async def test_command_stream(actor: IEBActor, command_string: str, keyword: str):
+    command = await actor.invoke_mock_command(f"{command_string} --stream 0.05")
+    await asyncio.sleep(0.3)
+
+    assert not command.status.is_done
+
+    stream = command.replies.get("stream")
+    assert stream["interval"] == 0.05
+
+    n_replies = len([reply for reply in command.replies if keyword in reply.message])
+    assert n_replies >= 2
+
+    stop = await actor.invoke_mock_command(f"stream stop {stream['id']}")
+    await stop
+    assert stop.status.did_succeed
+
+    await asyncio.sleep(0.01)
+    assert command.status.is_done
+    assert actor.poller.streams == {}
+    assert actor.poller.sources == {}
+
+
+async def test_command_stream_list_stop_all(actor: IEBActor):
+    commands = [
+        await actor.invoke_mock_command("shutter status sp1 --stream 0.1"),
+        await actor.invoke_mock_command("shutter status sp1 --stream 0.2"),
+    ]
+    await asyncio.sleep(0.05)
+
+    # Both streams share the same source.
+    assert len(actor.poller.sources) == 1
+
+    command = await actor.invoke_mock_command("stream list")
+    await command
+    assert len(command.replies.get("streams")) == 2
+
+    command = await actor.invoke_mock_command("stream stop --all")
+    await command
+    assert command.status.did_succeed
+
+    await asyncio.sleep(0.01)
+    assert all(command.status.is_done for command in commands)
+
+
+async def test_command_stream_stop_bad_id(actor: IEBActor):
+    command = await actor.invoke_mock_command("stream stop 1000")
+    await command
+
+    assert command.status.did_fail
+
+
+async def test_command_stream_invalid_interval(actor: IEBActor):
+    command = await actor.invoke_mock_command("depth status --stream 0")
+    await command
+
+    assert command.status.did_fail
+
+
+async def test_command_stream_not_recorded(actor: IEBActor):
+    registry.reset()
+
+    command = await actor.invoke_mock_command("shutter status sp1 --stream 0.05")
+    await asyncio.sleep(0.1)
+
+    stop = await actor.invoke_mock_command("stream stop --all")
+    await stop
+    assert stop.status.did_succeed
+
+    await asyncio.sleep(0.01)
+    assert command.status.is_done
+
+    assert "shutter status" not in registry.commands
+    assert "stream stop" in registry.commands
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_exporter.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lvmieb.actor.exporter import PrometheusExporter
+from lvmieb.controller.metrics import MetricsRegistry, registry
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+
+async def http_get(port: int, path: str = "/metrics", method: str = "GET"):
+    r, w = await asyncio.open_connection("localhost", port)
+    w.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await w.drain()
+
+    response = await r.read()
+    w.close()
+
+    headers, body = response.split(b"\r\n\r\n", 1)
+    return headers.decode().split("\r\n")[0], body.decode()
+
+
+@pytest.fixture
+async def exporter():
+    metrics = MetricsRegistry()
+
+    _exporter = PrometheusExporter(host="localhost", port=0, metrics=metrics)
+    await _exporter.start()
+
+    yield _exporter
+
+    await _exporter.stop()
+
+
+async def test_exporter(exporter: PrometheusExporter):
+    with exporter.metrics.track("sp1.shutter", "status") as tracker:
+        tracker.connected()
+        tracker.sent(5)
+
+    exporter.metrics.observe_command("shutter open", 1.2, failed=True)
+    exporter.metrics.gauge("lvmieb_test", "A test gauge.").set(1.5, spec='s"p1')
+    exporter.metrics.gauge("lvmieb_nan").set(float("nan"))
+
+    status, body = await http_get(exporter.port)
+    assert status == "HTTP/1.1 200 OK"
+
+    lines = body.splitlines()
+    assert "# TYPE lvmieb_device_request_seconds histogram" in lines
+    assert (
+        'lvmieb_device_request_seconds_bucket{device="sp1.shutter",'
+        'operation="status",le="+Inf"} 1'
+    ) in lines
+    assert (
+        'lvmieb_device_bytes_sent_total{device="sp1.shutter",operation="status"} 5'
+    ) in lines
+    assert 'lvmieb_command_duration_seconds_count{command="shutter open"} 1' in lines
+    assert 'lvmieb_command_failures_total{command="shutter open"} 1' in lines
+    assert 'lvmieb_test{spec="s\\"p1"} 1.5' in lines
+    assert "lvmieb_nan NaN" in lines
+
+
+@pytest.mark.parametrize(
+    "path,method,expected",
+    [
+        ("/", "GET", "404 Not Found"),
+        ("/metrics", "POST", "405 Method Not Allowed"),
+    ],
+)
+async def test_exporter_bad_request(
+    exporter: PrometheusExporter,
+    path: str,
+    method: str,
+    expected: str,
+):
+    status, body = await http_get(exporter.port, path=path, method=method)
+
+    assert status == f"HTTP/1.1 {expected}"
+    assert body == ""
+
+
+async def test_exporter_head(exporter: PrometheusExporter):
+    status, body = await http_get(exporter.port, method="HEAD")
+
+    assert status == "HTTP/1.1 200 OK"
+    assert body == ""
+
+
+async def test_exporter_cached_values(actor: IEBActor, mocker):
+    registry.reset()
+
+    await (await actor.invoke_mock_command("transducer status sp1"))
+    await (await actor.invoke_mock_command("wago status sp1"))
+
+    read_sensors = mocker.patch.object(actor.controllers["sp1"].wago, "read_sensors")
+
+    body = PrometheusExporter(metrics=registry).render()
+    lines = body.splitlines()
+
+    assert (
+        'lvmieb_transducer{camera="b1",measurement="pressure",spec="sp1"} 1e-06'
+    ) in lines
+    assert 'lvmieb_wago_sensor{sensor="rtd1",spec="sp1"} 0.0' in lines
+    assert 'lvmieb_command_duration_seconds_count{command="wago status"} 1' in lines
+
+    read_sensors.assert_not_called()
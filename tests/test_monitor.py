@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_monitor.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lvmieb.actor.monitor import LoopMonitor, describe_callback
+from lvmieb.exceptions import LvmIebError
+
+
+if TYPE_CHECKING:
+    from lvmieb.actor import IEBActor
+
+
+async def blocking_coroutine():
+    time.sleep(0.05)
+
+
+def blocking_function():
+    time.sleep(0.05)
+
+
+async def test_loop_monitor():
+    original_run = asyncio.events.Handle._run
+
+    monitor = LoopMonitor(interval=0.01, slow_callback=0.02, time_callbacks=True)
+    monitor.start()
+    assert monitor.running
+
+    await asyncio.sleep(0.02)
+    await asyncio.create_task(blocking_coroutine())
+    asyncio.get_running_loop().call_soon(blocking_function)
+    await asyncio.sleep(0.05)
+
+    await monitor.stop()
+    assert not monitor.running
+    assert asyncio.events.Handle._run is original_run
+
+    summary = monitor.to_dict()
+    assert summary["lag"]["count"] > 0
+    assert summary["lag"]["max"] >= 0.02
+    assert summary["n_slow_callbacks"] >= 2
+
+    origins = [record["origin"] for record in summary["slow_callbacks"]]
+    assert any(origin.startswith("blocking_coroutine (") for origin in origins)
+    assert any(origin.startswith("blocking_function (") for origin in origins)
+
+
+async def test_loop_monitor_lag_only():
+    original_run = asyncio.events.Handle._run
+
+    monitor = LoopMonitor(interval=0.01, slow_callback=0.02)
+    monitor.start()
+
+    # Only the lag is measured, without patching the callbacks.
+    assert asyncio.events.Handle._run is original_run
+    assert asyncio.get_running_loop().slow_callback_duration == 0.02
+
+    await asyncio.sleep(0.02)
+    asyncio.get_running_loop().call_soon(blocking_function)
+    await asyncio.sleep(0.05)
+
+    await monitor.stop()
+
+    summary = monitor.to_dict()
+    assert summary["n_slow_callbacks"] >= 1
+    assert summary["slow_callbacks"][0]["origin"] == "unknown"
+
+
+async def test_loop_monitor_time_callbacks_twice():
+    original_run = asyncio.events.Handle._run
+
+    monitor1 = LoopMonitor(interval=0.01, time_callbacks=True)
+    monitor2 = LoopMonitor(interval=0.01, time_callbacks=True)
+
+    monitor1.start()
+    with pytest.raises(LvmIebError):
+        monitor2.start()
+    assert not monitor2.running
+
+    # Stopping the monitor that did not patch does not restore the original.
+    await monitor2.stop()
+    assert asyncio.events.Handle._run is not original_run
+
+    await monitor1.stop()
+    assert asyncio.events.Handle._run is original_run
+
+
+def test_describe_callback():
+    partial = functools.partial(blocking_function)
+    assert describe_callback(partial).startswith("blocking_function (")
+
+    assert describe_callback(print) == "print"
+
+
+async def test_command_debug_loop(actor: IEBActor):
+    actor.loop_monitor = LoopMonitor(interval=0.01)
+    actor.loop_monitor.start()
+
+    await asyncio.sleep(0.03)
+
+    command = await actor.invoke_mock_command("debug loop")
+    await command
+
+    await actor.loop_monitor.stop()
+
+    assert command.status.did_succeed
+    assert command.replies.get("loop_health")["lag"]["count"] > 0
+
+
+async def test_command_debug_loop_not_running(actor: IEBActor):
+    command = await actor.invoke_mock_command("debug loop")
+    await command
+
+    assert command.status.did_fail
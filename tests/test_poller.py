@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_poller.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+
+from lvmieb.actor.poller import POLL_LAG_GAUGE, Poller
+
+
+async def test_poller_shared_source():
+    poller = Poller()
+    n_reads = 0
+
+    async def reader():
+        nonlocal n_reads
+        n_reads += 1
+        return n_reads
+
+    async def consume(interval: float, n_values: int):
+        values = []
+        async for value in poller.subscribe("key", reader, interval):
+            values.append(value)
+            if len(values) == n_values:
+                break
+        return values
+
+    fast, slow = await asyncio.gather(consume(0.02, 6), consume(0.05, 2))
+
+    assert fast == sorted(fast)
+    assert len(slow) == 2
+
+    # Both subscribers share the same reads.
+    assert n_reads <= 7
+    assert set(slow) <= set(range(1, n_reads + 1))
+
+    # The source is removed when the last subscriber leaves.
+    await asyncio.sleep(0)
+    assert poller.sources == {}
+
+
+async def test_poller_reader_fails():
+    poller = Poller()
+
+    async def reader():
+        raise ValueError("failed")
+
+    async for value in poller.subscribe("key", reader, 0.01):
+        assert isinstance(value, ValueError)
+        break
+
+
+async def test_poller_lag():
+    poller = Poller()
+
+    async def reader():
+        return 1
+
+    values = poller.subscribe(("shutter", "sp1"), reader, 0.01)
+    for _ in range(3):
+        await values.__anext__()
+
+    lag = POLL_LAG_GAUGE.get(source="shutter sp1")
+    assert lag is not None and 0 <= lag < 0.1
+
+    # The lag of the source is removed when it stops.
+    await values.aclose()
+    await asyncio.sleep(0)
+    assert POLL_LAG_GAUGE.get(source="shutter sp1") is None
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Date: 2026-10-19
+# @Filename: test_simulator.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from lvmieb.controller import IEBController
+from lvmieb.controller.depth import DepthGauges
+from lvmieb.controller.maskbits import MotorStatus
+from lvmieb.controller.motor import MotorControllerError
+from lvmieb.exceptions import LvmIebError
+from lvmieb.simulator import Faults, Latency, Simulator, expand_specs
+from lvmieb.simulator.behaviour import get_behaviour
+from lvmieb.simulator.devices import DeviceSimulator
+
+
+@pytest.fixture
+async def simulator(config):
+    _simulator = Simulator(config, behaviour={}, seed=42)
+    await _simulator.start()
+
+    yield _simulator
+
+    await _simulator.stop()
+
+
+def get_controller(simulator: Simulator, spec: str = "sp1") -> IEBController:
+    config = simulator.get_config()
+
+    controller = IEBController.from_config(
+        spec,
+        config["specs"][spec],
+        wago_modules=config["wago_modules"],
+    )
+
+    # Device.read is patched by the mockers and always reports the relays as
+    # closed. It requires the overrides attribute of WAGOMocker.
+    controller.wago.overrides = {}  # type: ignore
+
+    return controller
+
+
+def test_expand_specs(config):
+    expanded = expand_specs(config, 4)
+
+    assert expanded["enabled_specs"] == ["sp1", "sp2", "sp3", "sp4"]
+    assert list(expanded["specs"]["sp4"]["pressure"]) == ["r4", "b4", "z4"]
+    assert "sp3" not in config["specs"]
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "normal", "lognormal"])
+def test_latency_sample(distribution: str):
+    rng = random.Random(1)
+    latency = Latency(distribution, mean=0.1, jitter=0.02)
+
+    samples = [latency.sample(rng) for _ in range(2000)]
+
+    assert min(samples) >= 0
+    assert sum(samples) / len(samples) == pytest.approx(0.1, rel=0.05)
+
+
+def test_latency_bad_distribution():
+    with pytest.raises(ValueError):
+        Latency("bad")
+
+
+def test_faults_sample():
+    rng = random.Random(1)
+    faults = Faults(drop=0.2, error=0.3)
+
+    samples = [faults.sample(rng) for _ in range(2000)]
+
+    assert samples.count("hang") == 0
+    assert samples.count("drop") / 2000 == pytest.approx(0.2, abs=0.03)
+    assert samples.count("error") / 2000 == pytest.approx(0.3, abs=0.03)
+
+
+def test_get_behaviour():
+    config = {
+        "default": {"latency": {"mean": 0.1}},
+        "devices": {
+            "*.hartmann_*": {"motion_time": 2, "single_client": True},
+            "sp2.hartmann_left": {"latency": {"jitter": 0.01}},
+        },
+    }
+
+    behaviour = get_behaviour("sp2.hartmann_left", config)
+    assert behaviour.motion_time == 2
+    assert behaviour.single_client is True
+    assert behaviour.latency == Latency(mean=0.1, jitter=0.01)
+
+    assert get_behaviour("sp1.shutter", config).motion_time == 0
+
+
+async def test_simulator_config(simulator: Simulator):
+    config = simulator.get_config()
+
+    assert simulator.specs == ["sp1", "sp2"]
+    assert len(simulator.devices) == 2 * 7 + 1
+
+    shutter = config["specs"]["sp1"]["motor_controllers"]["shutter"]
+    assert shutter["port"] == simulator.devices["sp1.shutter"].port
+
+
+async def test_simulator_controller(simulator: Simulator):
+    controller = get_controller(simulator)
+
+    assert all((await controller.probe()).values())
+
+    assert await controller.pressure["r1"].read_pressure() == 1e-6
+    assert await controller.pressure["r1"].read_temperature() == 20
+
+    status, _ = await controller.motors["hartmann_left"].get_status()
+    assert status & MotorStatus.CLOSED
+
+    assert await controller.motors["shutter"].move(open=True)
+    assert simulator.devices["sp1.shutter"].status == "open"
+
+    status, _ = await controller.motors["shutter"].get_status()
+    assert status & MotorStatus.OPEN
+
+
+async def test_simulator_depth(simulator: Simulator):
+    config = simulator.get_config()
+
+    depth = DepthGauges(**config["depth_gauges"])
+    assert await depth.read() == {"A": 1.5, "B": 1.5, "C": 1.5}
+
+
+async def test_simulator_wago(simulator: Simulator):
+    controller = get_controller(simulator)
+    wago_simulator = simulator.devices["sp1.wago"]
+
+    wago_simulator.set_sensor("T1", 15.0)
+
+    # Device.read and the relays are patched by the mockers, so use the Modbus
+    # client directly.
+    async with controller.wago:
+        value, units = await controller.wago.get_device("T1")._read()
+        assert value == pytest.approx(15.0, abs=0.01)
+        assert units == "degC"
+
+        assert (await controller.wago.get_device("shutter")._read())[0] == "closed"
+
+        await controller.wago.client.write_coil(512, True)
+
+    assert wago_simulator.get_relay("shutter") is False
+
+    # Without power the motor controller does not reply.
+    with pytest.raises(MotorControllerError):
+        await controller.motors["shutter"].send_command("status", timeout=0.2)
+
+
+async def test_simulator_motion_time(config):
+    behaviour = {"devices": {"*.shutter": {"motion_time": 0.2, "single_client": True}}}
+
+    async with Simulator(config, behaviour=behaviour) as simulator:
+        shutter = get_controller(simulator).motors["shutter"]
+
+        t0 = time.perf_counter()
+        move = asyncio.create_task(shutter.move(open=True))
+        await asyncio.sleep(0.05)
+
+        # The status request waits for the move to finish (single client).
+        status, _ = await shutter.get_status()
+
+        assert time.perf_counter() - t0 >= 0.2
+        assert status & MotorStatus.OPEN
+        assert await move
+
+
+async def test_simulator_latency(config):
+    behaviour = {"devices": {"*.pressure.*": {"latency": {"mean": 0.1}}}}
+
+    async with Simulator(config, behaviour=behaviour) as simulator:
+        transducer = get_controller(simulator).pressure["r1"]
+
+        t0 = time.perf_counter()
+        await transducer.read_pressure()
+
+        assert time.perf_counter() - t0 >= 0.1
+
+
+@pytest.mark.parametrize("fault", ["drop", "error"])
+async def test_simulator_faults(simulator: Simulator, fault: str):
+    controller = get_controller(simulator)
+
+    device = simulator.devices["sp1.pressure.r1"]
+    setattr(device.behaviour.faults, fault, 1.0)
+
+    with pytest.raises((LvmIebError, ValueError, asyncio.IncompleteReadError)):
+        await controller.pressure["r1"].read_pressure()
+
+    assert device.n_faults == 1
+
+
+async def test_simulator_motor_error(simulator: Simulator):
+    controller = get_controller(simulator)
+
+    simulator.devices["sp1.shutter"].behaviour.faults.error = 1.0
+
+    status, _ = await controller.motors["shutter"].get_status()
+    assert status & MotorStatus.POSITION_INVALID
+
+
+def test_device_simulator_abstract():
+    with pytest.raises(TypeError):
+        DeviceSimulator("sp1.test")  # type: ignore
+
+
+async def test_simulator_stop_open_connection(simulator: Simulator):
+    device = simulator.devices["sp1.pressure.r1"]
+
+    reader, writer = await asyncio.open_connection(device.host, device.port)
+    await asyncio.sleep(0.05)
+    assert len(device._handlers) == 1
+
+    # The handler waiting on the open connection is stopped.
+    await asyncio.wait_for(device.stop(), 1)
+    assert len(device._handlers) == 0
+    assert await reader.read() == b""
+
+    writer.close()